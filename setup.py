@@ -33,6 +33,7 @@ setup(
     package_dir={"": "src"},
     include_package_data=True,
     install_requires=["click", "ibm-cloud-sdk-core", "pyyaml", "schemathesis"],
+    extras_require={"fast": ["orjson"]},
     entry_points="""
         [console_scripts]
         ibm-service-validator=ibm_service_validator.cli:ibm_service_validator
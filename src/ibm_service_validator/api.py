@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Python API for running the validator in-process.
+
+Example:
+
+    for result in validate("openapi.yaml", "https://api.example.com"):
+        if result.failures:
+            report(result.method, result.path, result.failures)
+"""
+
+from typing import Dict, FrozenSet, Generator, List, NamedTuple, Optional, Tuple
+
+import contextvars
+
+import hypothesis
+from schemathesis.cli.context import ExecutionContext
+from schemathesis.models import Status
+from schemathesis.runner import events
+from schemathesis.runner.serialization import SerializedCheck
+
+from ibm_service_validator.cli import DEFAULT_WORKERS, RunBuilder
+from ibm_service_validator.cli.history import DEFAULT_HISTORY_FILE
+
+ERROR: str = "error"
+WARNING: str = "warning"
+
+
+class CheckResult(NamedTuple):
+    """Outcome of one check on one request."""
+
+    name: str
+    # "success" or "failure"
+    status: str
+    # "error" or "warning", the severity a failure of this check has in the config
+    severity: str
+    message: Optional[str]
+    # Python code that reproduces the request
+    requests_code: Optional[str]
+
+
+class OperationResult(NamedTuple):
+    """Outcome of all requests sent to one operation."""
+
+    method: str
+    path: str
+    # "success", "failure", or "error"
+    status: str
+    # seconds spent testing the operation
+    elapsed_time: float
+    checks: List[CheckResult]
+    # exceptions raised while testing the operation
+    errors: List[str]
+    seed: Optional[int]
+
+    @property
+    def failures(self) -> List[CheckResult]:
+        return [check for check in self.checks if check.status == Status.failure.name]
+
+
+def validate(  # pylint: disable=too-many-arguments,too-many-locals
+    schema: str,
+    base_url: str,
+    *,
+    checks: Optional[List[str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    auth: Optional[Tuple[str, str]] = None,
+    auth_type: str = "basic",
+    additional_cases: bool = True,
+    endpoints: Optional[List[str]] = None,
+    methods: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    operation_ids: Optional[List[str]] = None,
+    exit_first: bool = False,
+    request_timeout: Optional[int] = None,
+    validate_schema: bool = True,
+    hypothesis_deadline: Optional[int] = None,
+    hypothesis_derandomize: Optional[bool] = None,
+    hypothesis_max_examples: Optional[int] = None,
+    hypothesis_phases: Optional[List[hypothesis.Phase]] = None,
+    hypothesis_seed: Optional[int] = None,
+    workers: int = DEFAULT_WORKERS,
+    check_processes: int = 0,
+    circuit_breaker: int = 0,
+    max_failures_per_operation: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    stream_responses: bool = False,
+    adaptive_deadline: bool = False,
+    history_file: str = DEFAULT_HISTORY_FILE,
+) -> Generator[OperationResult, None, None]:
+    """Tests the API and yields a result as soon as each operation is tested.
+
+    Options mirror the options of the run command, and time_budget is in seconds. The
+    config file is used unless checks are given, and adaptive deadlines are kept in
+    history_file. Closing the generator cancels the remaining operations, except those
+    already being tested by worker threads.
+    """
+    builder = RunBuilder(schema, checks, check_processes)
+    if time_budget is not None:
+        if workers > 1:
+            raise ValueError(
+                "time_budget tests operations one by one, so workers must be 1."
+            )
+        builder.limit_time(time_budget)
+    if adaptive_deadline:
+        if workers > 1:
+            raise ValueError(
+                "adaptive_deadline sets the deadline of each test as it starts, so workers must be 1."
+            )
+        if hypothesis_deadline is not None:
+            raise ValueError("adaptive_deadline replaces hypothesis_deadline.")
+        builder.adapt_deadlines(builder.keep_history(history_file))
+    prepared_runner = builder.prepare(
+        auth,
+        auth_type,
+        workers,
+        additional_cases=additional_cases,
+        circuit_breaker=circuit_breaker,
+        max_failures_per_operation=max_failures_per_operation,
+        stream_responses=stream_responses,
+        endpoint=endpoints,
+        method=methods,
+        tag=tags,
+        operation_id=operation_ids,
+        base_url=base_url,
+        headers=dict(headers) if headers else {},
+        request_timeout=request_timeout,
+        exit_first=exit_first,
+        validate_schema=validate_schema,
+        seed=hypothesis_seed,
+        hypothesis_phases=hypothesis_phases or [hypothesis.Phase.explicit],
+        hypothesis_max_examples=hypothesis_max_examples,
+        hypothesis_deadline=hypothesis_deadline,
+        hypothesis_derandomize=hypothesis_derandomize,
+        hypothesis_report_multiple_bugs=False,
+    )
+    execution_context = ExecutionContext(workers_num=workers)
+
+    # Each generator draws its events in its own context, so the hooks stay scoped to
+    # this run even when several generators are consumed alternately in one thread.
+    context = contextvars.copy_context()
+    context.run(builder.hooks.__enter__)
+    try:
+        while True:
+            event = context.run(next, prepared_runner, None)
+            if event is None or isinstance(event, events.Interrupted):
+                return
+            for handler in builder.handlers:
+                handler.handle_event(execution_context, event)
+            if isinstance(event, events.InternalError):
+                raise RuntimeError(f"{event.message}: {event.exception}")
+            if isinstance(event, events.AfterExecution):
+                yield to_operation_result(event, builder.warnings)
+    finally:
+        prepared_runner.close()
+        builder.pool.close()
+        context.run(builder.hooks.__exit__, None, None, None)
+
+
+def to_operation_result(
+    event: events.AfterExecution, warnings: FrozenSet[str]
+) -> OperationResult:
+    result = event.result
+    return OperationResult(
+        method=event.method,
+        path=event.path,
+        status=event.status.name,
+        elapsed_time=event.elapsed_time,
+        checks=[to_check_result(check, warnings) for check in result.checks],
+        errors=[error.exception for error in result.errors],
+        seed=result.seed,
+    )
+
+
+def to_check_result(check: SerializedCheck, warnings: FrozenSet[str]) -> CheckResult:
+    return CheckResult(
+        name=check.name,
+        status=check.value.name,
+        severity=WARNING if check.name in warnings else ERROR,
+        message=check.message,
+        requests_code=check.example.requests_code if check.example else None,
+    )
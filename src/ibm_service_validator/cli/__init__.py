@@ -13,13 +13,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    IO,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import functools
 import os
+import shutil
 
 import click
 import hypothesis
 from ibm_cloud_sdk_core.authenticators.iam_authenticator import IAMAuthenticator
 
+from requests.auth import AuthBase
 from requests.models import Response
 from schemathesis.cli.context import ExecutionContext
 from schemathesis.cli.handlers import EventHandler
@@ -28,24 +43,65 @@ from schemathesis.cli.output.short import ShortOutputStyleHandler
 from schemathesis.cli.options import CSVOption, OptionalInt, NotSet
 from schemathesis.cli import callbacks, execute
 from schemathesis.cli import replay as _replay
-from schemathesis import loaders, runner
+from schemathesis import runner
 
-from schemathesis.hooks import GLOBAL_HOOK_DISPATCHER, HookContext
+from schemathesis.hooks import HookContext
 from schemathesis.types import Filter
 from schemathesis import checks as checks_module
 from schemathesis.models import Case
+from schemathesis.runner import events
 
-from ibm_service_validator.cli.handlers.output_handler import OutputHandler
+from ibm_service_validator.cli.baseline import (
+    BASELINE_RULES,
+    BaselineComparison,
+    load_baseline,
+    load_thresholds,
+)
+from ibm_service_validator.cli.check_pool import CheckPool
+from ibm_service_validator.cli.circuit_breaker import CircuitBreaker
+from ibm_service_validator.cli.daemon import DEFAULT_SOCKET_PATH, forward_run, serve
+from ibm_service_validator.cli.deadlines import AdaptiveDeadlines, load_deadline_config
+from ibm_service_validator.cli.download_cap import DownloadCap
+from ibm_service_validator.cli.failure_budget import FailureCounter, load_failure_budget
+from ibm_service_validator.cli.handlers.output_handler import OutputHandler, RunReport
+from ibm_service_validator.cli.history import (
+    DEFAULT_HISTORY_FILE,
+    ORDERS,
+    SCHEMA_ORDER,
+    HistoryRecorder,
+    load_history,
+    ordered_loader,
+)
+from ibm_service_validator.cli.hooks import RunHooks
+from ibm_service_validator.cli.incremental import IncrementalRun, prepare_incremental_run
+from ibm_service_validator.cli.latency_hunt import LatencyHunt, with_target_phase
+from ibm_service_validator.cli.metrics import MetricsExporter, ResponseMetrics
+from ibm_service_validator.cli.overrides import RuleOverrides, process_rule_config
+from ibm_service_validator.cli.response_validators import (
+    ResponseValidators,
+    load_array_sampling,
+)
+from ibm_service_validator.cli.schema_cache import SchemaCache
+from ibm_service_validator.cli.time_budget import TimeBudget, merge_passes, parse_duration
+from ibm_service_validator.cli.workers import (
+    MAX_WORKERS,
+    Operation,
+    in_operation_order,
+    recording_loader,
+)
 from ibm_service_validator.handbook_rules import ADD_CASE_HOOKS, HANDBOOK_RULES
+from ibm_service_validator.handbook_rules.add_case_rules import unless_handled_by_probe
+from ibm_service_validator.handbook_rules.parsed_response import share_parsed_response
 from ibm_service_validator.cli.process_config import (
     create_default_config,
-    process_config,
 )
 
 ALL_CHECKS: tuple = checks_module.ALL_CHECKS + HANDBOOK_RULES
 API_KEY = "IBM_CLOUD_SERVICE_VALIDATOR_API_KEY"
 IAM_ENDPOINT = "IBM_CLOUD_SERVICE_VALIDATOR_IAM_ENDPOINT"
 DEFAULT_WORKERS: int = 1
+# parsed API definitions are reused by later runs in the same process, e.g. the daemon
+SCHEMA_CACHE = SchemaCache()
 
 
 @click.group()
@@ -90,6 +146,24 @@ def set_environment_variable(val: str, env_var_name: str) -> None:
     callback=callbacks.validate_base_url,
     help="The base-url of the API.",
 )
+@click.option(
+    "--baseline",
+    "baseline_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Statistics file of an earlier run. Reports latency and size regressions against it.",
+)
+@click.option(
+    "--changed-since",
+    "state_file",
+    type=click.Path(dir_okay=False),
+    help="State file of the previous run. Only operations that changed or did not pass are tested.",
+)
+@click.option(
+    "--check-processes",
+    type=click.IntRange(0, MAX_WORKERS),
+    default=0,
+    help="Number of processes that run the CPU-bound checks, such as response schema validation. 0 runs them in this process.",
+)
 @click.option(
     "--checks",
     "-c",
@@ -98,6 +172,12 @@ def set_environment_variable(val: str, env_var_name: str) -> None:
     callback=lambda _, __, s: [c.strip() for c in s.split(",") if c.strip()],
     help="Comma-separated list of checks to run.",
 )
+@click.option(
+    "--circuit-breaker",
+    type=click.IntRange(0, None),
+    default=0,
+    help="Stop sending requests to an operation or host after this many consecutive timeouts, connection errors or 5xx responses. 0 never stops.",
+)
 @click.option(
     "--header",
     "-H",
@@ -130,6 +210,12 @@ def set_environment_variable(val: str, env_var_name: str) -> None:
     type=OptionalInt(1, 999999999 * 24 * 3600 * 1000),
     help="Duration in milliseconds each individual example is not allowed to exceed.",
 )
+@click.option(
+    "--adaptive-deadline",
+    is_flag=True,
+    default=False,
+    help="Give each operation a deadline derived from the latency of its first example, instead of --hypothesis-deadline. Deadlines are kept in the history file for later runs.",
+)
 @click.option(
     "--hypothesis-derandomize",
     help="Use Hypothesis's deterministic mode.",
@@ -156,6 +242,23 @@ def set_environment_variable(val: str, env_var_name: str) -> None:
     callback=callbacks.convert_verbosity,
     help="Verbosity level of Hypothesis messages.",
 )
+@click.option(
+    "--hunt-latency",
+    is_flag=True,
+    default=False,
+    help="Steer generation toward inputs that make the server slow, and report the slowest input of each operation. Adds the generate and target Hypothesis phases.",
+)
+@click.option(
+    "--hunt-size",
+    is_flag=True,
+    default=False,
+    help="With --hunt-latency, also steer generation toward large responses, and report the input with the largest response of each operation.",
+)
+@click.option(
+    "--max-failures-per-operation",
+    type=click.IntRange(0, None),
+    help="Stop testing an operation once it has this many distinct failures, instead of shrinking them. 0 is unlimited. Replaces max_failures in the failure_budget config.",
+)
 @click.option(
     "--method",
     "-M",
@@ -171,6 +274,18 @@ def set_environment_variable(val: str, env_var_name: str) -> None:
     default=False,
     help="Additional requests that target specific API behavior will not be sent.",
 )
+@click.option(
+    "--order",
+    type=click.Choice(ORDERS),
+    default=SCHEMA_ORDER,
+    help="Order in which operations are tested. Orders other than 'schema' use the history file.",
+)
+@click.option(
+    "--history-file",
+    type=click.Path(dir_okay=False),
+    default=DEFAULT_HISTORY_FILE,
+    help="File with the outcome and duration of each operation in earlier runs.",
+)
 @click.option(
     "--request-timeout",
     type=click.IntRange(1),
@@ -189,11 +304,22 @@ def set_environment_variable(val: str, env_var_name: str) -> None:
     default=False,
     help="Show statistical summary of errors.",
 )
+@click.option(
+    "--statistics-file",
+    help="Store the response time and size statistics of each operation into a JSON file.",
+    type=click.File("w"),
+)
 @click.option(
     "--store-request-log",
     help="Store requests and responses into a file.",
     type=click.File("w"),
 )
+@click.option(
+    "--stream-responses",
+    is_flag=True,
+    default=False,
+    help="Stop reading a response body once it exceeds the largest max_response_size budget.",
+)
 @click.option(
     "--tag",
     "-T",
@@ -212,6 +338,11 @@ def set_environment_variable(val: str, env_var_name: str) -> None:
     help="Filter schemathesis test by operationId pattern.",
     callback=callbacks.validate_regex,
 )
+@click.option(
+    "--time-budget",
+    callback=parse_duration,
+    help="Time for the whole run, e.g. 300s or 5m. The explicit examples of every operation run first, then the time left is split between the operations for the other Hypothesis phases.",
+)
 @click.option(
     "--validate-schema",
     help="Enable or disable validation of input schema.",
@@ -222,6 +353,14 @@ def set_environment_variable(val: str, env_var_name: str) -> None:
 @click.option(
     "--with-bearer", "-B", is_flag=True, help="Flag to send bearer token with requests."
 )
+@click.option(
+    "--workers",
+    "-w",
+    "workers_num",
+    type=click.IntRange(1, MAX_WORKERS),
+    default=DEFAULT_WORKERS,
+    help="Number of operations tested at the same time, so checks run while other requests are in flight.",
+)
 def run(  # pylint: disable=too-many-arguments
     schema: str,
     auth: Optional[Tuple[str, str]],
@@ -230,6 +369,10 @@ def run(  # pylint: disable=too-many-arguments
     checks: Optional[List[str]],
     headers: Dict[str, str],
     hypothesis_phases: Optional[List[hypothesis.Phase]],
+    adaptive_deadline: bool = False,
+    baseline_file: Optional[str] = None,
+    check_processes: int = 0,
+    circuit_breaker: int = 0,
     endpoints: Optional[Filter] = None,
     exit_first: bool = False,
     hypothesis_deadline: Optional[Union[int, NotSet]] = None,
@@ -237,47 +380,83 @@ def run(  # pylint: disable=too-many-arguments
     hypothesis_max_examples: Optional[int] = None,
     hypothesis_seed: Optional[int] = None,
     hypothesis_verbosity: Optional[hypothesis.Verbosity] = None,
+    history_file: str = DEFAULT_HISTORY_FILE,
+    hunt_latency: bool = False,
+    hunt_size: bool = False,
+    max_failures_per_operation: Optional[int] = None,
     methods: Optional[Filter] = None,
     no_additional_cases: bool = False,
+    order: str = SCHEMA_ORDER,
     request_timeout: Optional[int] = None,
     show_exception_tracebacks: bool = False,
+    state_file: Optional[str] = None,
     statistics: bool = False,
+    statistics_file: Optional[IO[str]] = None,
     store_request_log: Optional[click.utils.LazyFile] = None,
+    stream_responses: bool = False,
     tags: Optional[Filter] = None,
+    time_budget: Optional[float] = None,
     operation_ids: Optional[Filter] = None,
     validate_schema: bool = True,
     verbosity: int = 0,
     with_bearer: bool = False,
+    workers_num: int = DEFAULT_WORKERS,
 ) -> None:
     # pylint: disable=too-many-locals
 
     if with_bearer:
-        if "Authorization" not in headers and "authorization" not in headers:
-            headers["Authorization"] = get_bearer_token()
-        else:
-            raise click.UsageError(
-                "--with-bearer flag used but Authorization header provided with --header."
-            )
+        add_bearer_token(headers)
 
-    on, warnings = (frozenset(checks), frozenset()) if checks else process_config()
+    builder = RunBuilder(schema, checks, check_processes)
+    incremental_run = builder.run_incrementally(state_file) if state_file else None
+    # runs that order operations or adapt their deadlines keep the history file
+    keeps_history = order != SCHEMA_ORDER or adaptive_deadline
+    history = builder.keep_history(history_file) if keeps_history else {}
+    if order != SCHEMA_ORDER:
+        builder.loader = ordered_loader(builder.loader, order, history)
 
-    selected_checks = get_selected_checks(on)
-    register_output_handler(warnings, statistics)
-    if not no_additional_cases:
-        register_add_case_hooks(on)
+    metrics = None
+    if statistics or statistics_file is not None or baseline_file:
+        metrics = builder.collect_metrics(statistics_file)
+    if time_budget is not None:
+        if workers_num > 1:
+            raise click.UsageError(
+                "--time-budget tests operations one by one, so it cannot be used with --workers."
+            )
+        builder.limit_time(time_budget)
+    if adaptive_deadline:
+        if workers_num > 1:
+            raise click.UsageError(
+                "--adaptive-deadline sets the deadline of each test as it starts, so it cannot be used with --workers."
+            )
+        if hypothesis_deadline is not None:
+            raise click.UsageError("--adaptive-deadline replaces --hypothesis-deadline.")
+        builder.adapt_deadlines(history)
+    hunt = None
+    if hunt_size and not hunt_latency:
+        raise click.UsageError("--hunt-size is used with --hunt-latency.")
+    if hunt_latency:
+        hunt = builder.hunt_latency(hunt_size, headers)
+        hypothesis_phases = with_target_phase(hypothesis_phases or [])
+    baseline = None
+    # metrics are collected whenever there is a baseline
+    if baseline_file and metrics is not None:
+        baseline = builder.compare_with_baseline(baseline_file, metrics)
 
     # Invoke Schemathesis
-    prepared_runner = runner.prepare(
-        schema,
+    prepared_runner = builder.prepare(
+        auth,
+        auth_type,
+        workers_num,
+        additional_cases=not no_additional_cases,
+        circuit_breaker=circuit_breaker,
+        max_failures_per_operation=max_failures_per_operation,
+        stream_responses=stream_responses,
         app=None,
-        auth=auth,
-        auth_type=auth_type,
         base_url=base_url,
-        checks=selected_checks,
         endpoint=endpoints,
         exit_first=exit_first,
         headers=headers,
-        loader=loaders.from_path,
         method=methods,
         request_timeout=request_timeout,
         seed=hypothesis_seed,
@@ -285,7 +464,6 @@ def run(  # pylint: disable=too-many-arguments
         tag=tags,
         operation_id=operation_ids,
         validate_schema=validate_schema,
-        workers_num=DEFAULT_WORKERS,
         hypothesis_deadline=hypothesis_deadline,
         hypothesis_derandomize=hypothesis_derandomize,
         hypothesis_max_examples=hypothesis_max_examples,
@@ -294,48 +472,252 @@ def run(  # pylint: disable=too-many-arguments
         hypothesis_suppress_health_check=None,
         hypothesis_verbosity=hypothesis_verbosity,
     )
-    execute(
-        prepared_runner,
-        DEFAULT_WORKERS,
-        show_exception_tracebacks,
-        store_request_log,
-        None,
-        verbosity,
+    report = RunReport(
+        statistics,
+        incremental_run.carried_forward if incremental_run else None,
+        metrics,
+        baseline,
+        builder.validators,
+        builder.time_budget,
+        hunt,
     )
+    register_output_handler(builder.hooks, builder.warnings, builder.handlers, report)
+    with builder.hooks, builder.pool:
+        execute(
+            prepared_runner,
+            workers_num,
+            show_exception_tracebacks,
+            store_request_log,
+            None,
+            verbosity,
+        )
 
 
 def get_selected_checks(
     on: FrozenSet[str],
-) -> Iterable[Callable[[Response, Case], None]]:
-    return tuple(check for check in ALL_CHECKS if check.__name__ in on)
+    overrides: Optional[RuleOverrides] = None,
+    validators: Optional[ResponseValidators] = None,
+    pool: Optional[CheckPool] = None,
+) -> Iterable[Callable[[Response, Case], Optional[bool]]]:
+    selected = tuple(
+        (
+            unless_handled_by_probe(check)
+            if check is checks_module.status_code_conformance
+            else check
+        )
+        for check in ALL_CHECKS
+        if check.__name__ in on
+    )
+    if validators is not None:
+        # compiles each response schema once instead of for every response
+        selected = tuple(
+            (
+                validators.response_schema_conformance
+                if check is checks_module.response_schema_conformance
+                else check
+            )
+            for check in selected
+        )
+    if pool is not None:
+        selected = tuple(map(pool.offload, selected))
+    if overrides is not None:
+        return tuple(map(overrides.apply, selected))
+    return selected
 
 
-def register_output_handler(warnings: FrozenSet[str], statistics: bool) -> None:
+def register_output_handler(
+    hooks: RunHooks,
+    warnings: FrozenSet[str],
+    handlers: Iterable[EventHandler] = (),
+    report: RunReport = RunReport(),
+) -> None:
+    extra_handlers = list(handlers)
+
     def after_init_cli_run_handlers(
         context: HookContext,
         handlers: List[EventHandler],
         execution_context: ExecutionContext,
     ) -> None:
-        # filters out the Schemathesis output handlers and adds OutputHandler
+        # filters out the Schemathesis output handlers and adds OutputHandler. It exits
+        # once the run finishes, so the other handlers go first.
         handlers[:] = [
             *filter(
                 lambda handler: not isinstance(handler, DefaultOutputStyleHandler)
                 and not isinstance(handler, ShortOutputStyleHandler),
                 handlers,
             ),
-            OutputHandler(warnings, statistics),
+            *extra_handlers,
+            OutputHandler(warnings, report),
         ]
 
-    GLOBAL_HOOK_DISPATCHER.register(after_init_cli_run_handlers)
+    hooks.register(after_init_cli_run_handlers)
 
 
-def register_add_case_hooks(on: FrozenSet) -> None:
+def register_add_case_hooks(
+    hooks: RunHooks, on: FrozenSet, overrides: Optional[RuleOverrides] = None
+) -> None:
     # pylint: disable=bad-str-strip-call
     add_case_prefix = "add_"
     for case_hook in ADD_CASE_HOOKS:
+        rule = case_hook.__name__.lstrip(add_case_prefix)
         # add add_case hook if its corresponding check is on
-        if case_hook.__name__.lstrip(add_case_prefix) in on:
-            GLOBAL_HOOK_DISPATCHER.register_hook_with_name(case_hook, "add_case")
+        if rule in on:
+            if overrides is not None:
+                case_hook = overrides.apply_add_case(case_hook, rule)
+            hooks.register(case_hook, "add_case")
+
+
+class RunBuilder:  # pylint: disable=too-many-instance-attributes
+    """Assembles the checks, schema loader and auth of a run from its options.
+
+    The run command and the Python API both build their runs with it, so each option is
+    wired the same way in both. The options that wrap every check, or the auth, are
+    applied last by ``prepare``. ``handlers`` are the event handlers the run needs
+    besides the output, e.g. the one that writes the history file.
+    """
+
+    def __init__(
+        self, schema: str, checks: Optional[List[str]], check_processes: int = 0
+    ) -> None:
+        self.on, self.warnings, self.overrides = process_rule_config(checks)
+        self.schema_source, self.loader = SCHEMA_CACHE.load(schema)
+        self.validators = SCHEMA_CACHE.validators(schema).with_sampling(
+            load_array_sampling()
+        )
+        self.pool = CheckPool(check_processes, self.validators)
+        # the first check parses each response once for all the others
+        self.checks: Tuple[Callable[[Response, Case], Optional[bool]], ...] = (
+            share_parsed_response,
+            *get_selected_checks(self.on, self.overrides, self.validators, self.pool),
+        )
+        self.hooks = RunHooks()
+        self.handlers: List[EventHandler] = []
+        self.time_budget: Optional[TimeBudget] = None
+        self.history_file = DEFAULT_HISTORY_FILE
+        self.history: Optional[Dict[str, Dict[str, Any]]] = None
+        self.deadlines: Optional[AdaptiveDeadlines] = None
+
+    def add_check(self, check: Callable[[Response, Case], Optional[bool]]) -> None:
+        self.checks = (*self.checks, check)
+
+    def run_incrementally(self, state_file: str) -> Optional[IncrementalRun]:
+        """Prunes the operations that need no testing, see prepare_incremental_run."""
+        self.schema_source, incremental_run = prepare_incremental_run(
+            state_file, self.schema_source, self.loader, self.overrides, self.warnings
+        )
+        if incremental_run is not None:
+            self.handlers.append(incremental_run)
+        return incremental_run
+
+    def keep_history(self, history_file: str) -> Dict[str, Dict[str, Any]]:
+        """Loads the history file, which is written back once the run finishes."""
+        self.history_file = history_file
+        self.history = load_history(history_file)
+        return self.history
+
+    def collect_metrics(self, statistics_file: Optional[IO[str]]) -> ResponseMetrics:
+        metrics = ResponseMetrics(self.overrides.compression_threshold)
+        self.add_check(metrics.collect_response_metrics)
+        if statistics_file is not None:
+            self.handlers.append(MetricsExporter(metrics, statistics_file))
+        return metrics
+
+    def limit_time(self, seconds: float) -> TimeBudget:
+        self.time_budget = TimeBudget(seconds)
+        self.loader = self.time_budget.loader(self.loader)
+        self.add_check(self.time_budget.count_response)
+        return self.time_budget
+
+    def adapt_deadlines(self, history: Dict[str, Dict[str, Any]]) -> AdaptiveDeadlines:
+        self.deadlines = AdaptiveDeadlines(load_deadline_config(), history)
+        self.loader = self.deadlines.loader(self.loader)
+        self.add_check(self.deadlines.measure)
+        return self.deadlines
+
+    def hunt_latency(self, size: bool, headers: Dict[str, Any]) -> LatencyHunt:
+        hunt = LatencyHunt(size, headers)
+        self.add_check(hunt.hunt)
+        return hunt
+
+    def compare_with_baseline(
+        self, baseline_file: str, metrics: ResponseMetrics
+    ) -> BaselineComparison:
+        baseline = BaselineComparison(
+            load_baseline(baseline_file),
+            metrics,
+            load_thresholds(),
+            self.on & BASELINE_RULES,
+        )
+        self.handlers.append(baseline)
+        return baseline
+
+    def prepare(  # pylint: disable=too-many-arguments
+        self,
+        auth: Optional[Tuple[str, str]],
+        auth_type: str,
+        workers_num: int,
+        *,
+        additional_cases: bool = True,
+        circuit_breaker: int = 0,
+        max_failures_per_operation: Optional[int] = None,
+        stream_responses: bool = False,
+        **options: Any,
+    ) -> Generator[events.ExecutionEvent, None, None]:
+        """Returns the runner. The other options are passed to Schemathesis as is."""
+        if additional_cases:
+            register_add_case_hooks(self.hooks, self.on, self.overrides)
+        checks = self.checks
+        budget = load_failure_budget(max_failures_per_operation)
+        if budget is not None:
+            # the counter sees the failures of a response after every other check ran on it
+            counter = FailureCounter(budget, self.warnings)
+            checks = (*map(counter.count, checks), counter.enforce)
+        loader = self.loader
+        runner_auth: Optional[Union[Tuple[str, str], AuthBase]] = auth
+        if stream_responses:
+            # DownloadCap applies the auth itself, Schemathesis passes it to the session as is
+            runner_auth = DownloadCap(self.overrides.download_cap, auth, auth_type)
+            auth_type = "basic"
+        if circuit_breaker:
+            breaker = CircuitBreaker(circuit_breaker, runner_auth, auth_type)
+            loader = breaker.watching(loader)
+            runner_auth = breaker
+            auth_type = "basic"
+        operations: List[Operation] = []
+        if workers_num > 1:
+            checks = (self.hooks.join_thread, *checks)
+            loader = recording_loader(loader, operations)
+        if self.history is not None:
+            self.handlers.append(
+                HistoryRecorder(
+                    self.history_file,
+                    self.history,
+                    self.deadlines.deadlines if self.deadlines else None,
+                )
+            )
+
+        prepared_runner = runner.prepare(
+            self.schema_source,
+            auth=runner_auth,
+            auth_type=auth_type,
+            checks=checks,
+            loader=loader,
+            workers_num=workers_num,
+            **options,
+        )
+        if workers_num > 1:
+            prepared_runner = in_operation_order(prepared_runner, operations)
+        if self.time_budget is not None:
+            prepared_runner = merge_passes(prepared_runner, self.time_budget)
+        return prepared_runner
+
+
+def add_bearer_token(headers: Dict[str, str]) -> None:
+    if "Authorization" in headers or "authorization" in headers:
+        raise click.UsageError(
+            "--with-bearer flag used but Authorization header provided with --header."
+        )
+    headers["Authorization"] = get_bearer_token()
 
 
 def get_bearer_token() -> str:
@@ -345,14 +727,20 @@ def get_bearer_token() -> str:
         )
 
     try:
-        bearer_token = IAMAuthenticator(
-            os.environ[API_KEY], url=os.environ[IAM_ENDPOINT]
+        bearer_token = get_authenticator(
+            os.environ[API_KEY], os.environ[IAM_ENDPOINT]
         ).token_manager.get_token()
         return "Bearer {0}".format(bearer_token)
     except Exception as e:  # pragma: no cover
         raise RuntimeError("Problem getting bearer token.") from e  # pragma: no cover
 
 
+@functools.lru_cache(maxsize=None)
+def get_authenticator(api_key: str, iam_endpoint: str) -> IAMAuthenticator:
+    """Returns a shared authenticator so later runs reuse the token until it expires."""
+    return IAMAuthenticator(api_key, url=iam_endpoint)
+
+
 @ibm_service_validator.command(short_help="Create a default config file.")
 @click.option(
     "--overwrite",
@@ -399,3 +787,40 @@ def replay(  # pylint: disable=too-many-arguments
 ) -> None:
     # pylint: disable=too-many-locals
     context.forward(_replay)
+
+
+@ibm_service_validator.command(
+    short_help="Serve runs from a long-lived process that keeps schemas and tokens warm."
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=DEFAULT_SOCKET_PATH,
+    show_default=True,
+    help="Path of the Unix socket to listen on.",
+)
+def daemon(socket_path: str) -> None:
+    serve(socket_path, run)
+
+
+@ibm_service_validator.command(
+    short_help="Forward run arguments to a running daemon.",
+    context_settings={"ignore_unknown_options": True},
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=DEFAULT_SOCKET_PATH,
+    show_default=True,
+    help="Path of the Unix socket the daemon listens on.",
+)
+@click.argument("run_args", nargs=-1, type=click.UNPROCESSED)
+def client(socket_path: str, run_args: Tuple[str, ...]) -> None:
+    env = {
+        name: os.environ[name] for name in (API_KEY, IAM_ENDPOINT) if name in os.environ
+    }
+    # lets the daemon format output for the client's terminal
+    env["COLUMNS"] = str(shutil.get_terminal_size().columns)
+    raise click.exceptions.Exit(forward_run(socket_path, run_args, env))
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Tuple
+
+import json
+
+import click
+from schemathesis.cli.context import ExecutionContext
+from schemathesis.cli.handlers import EventHandler
+from schemathesis.models import Status
+from schemathesis.runner import events
+
+from ibm_service_validator.cli.metrics import METRICS_VERSION, ResponseMetrics
+from ibm_service_validator.cli.process_config import (
+    BASELINE_CONFIG_NAME,
+    config_number,
+    load_config,
+)
+
+LATENCY_REGRESSION: str = "latency_regression"
+SIZE_REGRESSION: str = "size_regression"
+BASELINE_RULES: FrozenSet[str] = frozenset({LATENCY_REGRESSION, SIZE_REGRESSION})
+DEFAULT_THRESHOLDS: Dict[str, float] = {"latency": 2.0, "size": 2.0}
+# slowdowns smaller than this are treated as noise, however large the ratio
+MIN_LATENCY_INCREASE_US: int = 1000
+
+# rule, metric in the statistics file, statistics compared
+COMPARISONS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    (LATENCY_REGRESSION, "latency_us", ("p50", "p99")),
+    (SIZE_REGRESSION, "size_bytes", ("p50", "max")),
+)
+
+
+class Regression(NamedTuple):
+    operation: str
+    rule: str
+    statistic: str
+    baseline: int
+    current: int
+
+
+def load_baseline(baseline_file: str) -> Dict[str, Dict[str, Any]]:
+    """Returns the operations of a file written with --statistics-file."""
+    not_statistics = click.UsageError(
+        f"{baseline_file} is not a statistics file written with --statistics-file."
+    )
+    with open(baseline_file, "r") as f:
+        try:
+            baseline = json.load(f)
+        except json.JSONDecodeError as e:
+            raise not_statistics from e
+    if not isinstance(baseline, dict) or baseline.get("version") != METRICS_VERSION:
+        raise not_statistics
+    return baseline.get("operations", {})
+
+
+def load_thresholds() -> Dict[str, float]:
+    """Returns the ratios over the baseline that count as regressions."""
+    thresholds = load_config().get(BASELINE_CONFIG_NAME)
+    if not isinstance(thresholds, dict):
+        return dict(DEFAULT_THRESHOLDS)
+    unknown = thresholds.keys() - DEFAULT_THRESHOLDS.keys()
+    if unknown:
+        raise click.UsageError(
+            f"Unknown {BASELINE_CONFIG_NAME} in the config file: {', '.join(sorted(map(str, unknown)))}. "
+            f"Thresholds are {', '.join(DEFAULT_THRESHOLDS)}."
+        )
+    return {
+        name: config_number(thresholds, BASELINE_CONFIG_NAME, name, default)
+        for name, default in DEFAULT_THRESHOLDS.items()
+    }
+
+
+def compare(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    thresholds: Dict[str, float],
+    rules: FrozenSet[str],
+) -> Tuple[List[Regression], Dict[str, Dict[str, int]]]:
+    """Compares the operations in both runs.
+
+    Returns the regressions and, for each rule, the number of operations that passed
+    and failed. Operations that are not in both runs are not compared.
+    """
+    regressions: List[Regression] = []
+    outcomes: Dict[str, Dict[str, int]] = {}
+    for rule, metric, statistics in COMPARISONS:
+        if rule not in rules:
+            continue
+        threshold = thresholds[metric.split("_")[0]]
+        for operation in sorted(baseline.keys() & current.keys()):
+            found = [
+                Regression(
+                    operation,
+                    rule,
+                    statistic,
+                    baseline[operation][metric][statistic],
+                    current[operation][metric][statistic],
+                )
+                for statistic in statistics
+                if is_regression(
+                    rule,
+                    baseline[operation][metric][statistic],
+                    current[operation][metric][statistic],
+                    threshold,
+                )
+            ]
+            regressions.extend(found)
+            counts = outcomes.setdefault(rule, {"passed": 0, "failed": 0})
+            counts["failed" if found else "passed"] += 1
+    return regressions, outcomes
+
+
+def is_regression(rule: str, baseline: int, current: int, threshold: float) -> bool:
+    if rule == LATENCY_REGRESSION and current - baseline < MIN_LATENCY_INCREASE_US:
+        return False
+    return current > baseline * threshold
+
+
+class BaselineComparison(EventHandler):
+    """Compares the run with the baseline once it finishes.
+
+    The outcome of each rule is added to the totals of the Finished event, so the
+    regressions count as errors or warnings like any other check.
+    """
+
+    def __init__(
+        self,
+        baseline: Dict[str, Dict[str, Any]],
+        metrics: ResponseMetrics,
+        thresholds: Dict[str, float],
+        rules: FrozenSet[str],
+    ) -> None:
+        self.baseline = baseline
+        self.metrics = metrics
+        self.thresholds = thresholds
+        self.rules = rules
+        self.regressions: List[Regression] = []
+
+    def handle_event(
+        self, context: ExecutionContext, event: events.ExecutionEvent
+    ) -> None:
+        if not isinstance(event, events.Finished):
+            return
+        self.regressions, outcomes = compare(
+            self.baseline,
+            self.metrics.to_dict()["operations"],
+            self.thresholds,
+            self.rules,
+        )
+        for rule, counts in outcomes.items():
+            total: Dict[Any, int] = {"total": counts["passed"] + counts["failed"]}
+            if counts["passed"]:
+                total[Status.success] = counts["passed"]
+            if counts["failed"]:
+                total[Status.failure] = counts["failed"]
+            event.total[rule] = total
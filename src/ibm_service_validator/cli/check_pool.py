@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type, Union
+
+import functools
+import multiprocessing
+import threading
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from schemathesis import checks as checks_module
+from schemathesis import loaders
+from schemathesis.models import Case
+from schemathesis.schemas import BaseSchema
+
+from ibm_service_validator.cli.response_validators import ResponseValidators
+from ibm_service_validator.handbook_rules import HANDBOOK_RULES
+from ibm_service_validator.handbook_rules.markers import is_cpu_bound
+
+# the checks a worker process can run, by name
+WORKER_CHECKS: Dict[str, Callable] = {
+    check.__name__: check for check in checks_module.ALL_CHECKS + HANDBOOK_RULES
+}
+
+
+class CheckRequest(NamedTuple):
+    """What a worker process needs to run a check on a response."""
+
+    check: str
+    # the operation
+    method: str
+    path: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    encoding: Optional[str]
+    url: str
+    request_method: Optional[str]
+    request_url: Optional[str]
+    request_headers: Dict[str, Union[str, bytes]]
+    request_body: Any
+
+
+class CheckOutcome(NamedTuple):
+    """The serialized result of a check run in a worker process."""
+
+    skipped: bool
+    # None when the check passed
+    message: Optional[str]
+    # what the check added to the array sampling counts of the worker
+    arrays_sampled: int = 0
+    items_validated: int = 0
+    items_skipped: int = 0
+
+
+class CheckPool:
+    """Runs the CPU-bound checks in worker processes, so a run can use more than one core.
+
+    A check is sent the raw response and its operation, and waits for the outcome, so
+    Hypothesis sees failures as usual. With --workers, several checks run at once. The
+    pool starts with the first check, because the workers load the run's API definition.
+    """
+
+    def __init__(
+        self, processes: int, validators: Optional[ResponseValidators] = None
+    ) -> None:
+        self.processes = processes
+        self.validators = validators
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CheckPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def offload(
+        self, check: Callable[[Response, Case], Optional[bool]]
+    ) -> Callable[[Response, Case], Optional[bool]]:
+        """Wraps a CPU-bound check so it runs in a worker process."""
+        if not self.processes or not is_cpu_bound(check):
+            return check
+        name = check.__name__
+
+        @functools.wraps(check)
+        def offloaded_check(response: Response, case: Case) -> Optional[bool]:
+            outcome = (
+                self._executor_for(case.endpoint.schema)
+                .submit(run_check, to_check_request(name, response, case))
+                .result()
+            )
+            if outcome is None:
+                # the API definition of the workers does not have the operation
+                return check(response, case)
+            return self._report(name, outcome)
+
+        return offloaded_check
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _executor_for(self, schema: BaseSchema) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # forking a process that runs worker threads could copy held locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_worker,
+                    # the workers start with the schemas compiled so far
+                    initargs=(
+                        schema.raw_schema,
+                        schema.location,
+                        self.validators or ResponseValidators(),
+                    ),
+                )
+            return self._executor
+
+    def _report(self, name: str, outcome: CheckOutcome) -> Optional[bool]:
+        if self.validators is not None and outcome.arrays_sampled:
+            self.validators.add_sampled(
+                outcome.arrays_sampled, outcome.items_validated, outcome.items_skipped
+            )
+        if outcome.message is not None:
+            raise AssertionError(outcome.message)
+        return True if outcome.skipped else None
+
+
+def to_check_request(name: str, response: Response, case: Case) -> CheckRequest:
+    request = response.request
+    return CheckRequest(
+        check=name,
+        method=case.endpoint.method,
+        path=case.endpoint.path,
+        status_code=response.status_code,
+        headers=dict(response.headers),
+        content=response.content or b"",
+        encoding=response.encoding,
+        url=response.url,
+        request_method=request.method if request is not None else None,
+        request_url=request.url if request is not None else None,
+        request_headers=dict(request.headers) if request is not None else {},
+        request_body=request.body if request is not None else None,
+    )
+
+
+# the API definition and compiled response schemas of a worker process
+_worker: Optional[Tuple[BaseSchema, ResponseValidators]] = None
+
+
+def init_worker(
+    raw_schema: Dict[str, Any], location: Optional[str], validators: ResponseValidators
+) -> None:
+    global _worker  # pylint: disable=global-statement
+    schema = loaders.from_dict(raw_schema, location=location, validate_schema=False)
+    _worker = (schema, validators)
+
+
+def run_check(request: CheckRequest) -> Optional[CheckOutcome]:
+    """Runs a check in a worker process on a response rebuilt from the request.
+
+    Returns None when the worker's API definition does not have the operation, so the
+    check can run in the calling process instead.
+    """
+    if _worker is None:
+        raise RuntimeError("The check pool worker was not initialized.")
+    schema, validators = _worker
+    endpoint = schema.endpoints.get(request.path, {}).get(request.method)
+    if endpoint is None:
+        return None
+    case = Case(endpoint)
+    check = (
+        validators.response_schema_conformance
+        if request.check == "response_schema_conformance"
+        else WORKER_CHECKS[request.check]
+    )
+    before = (
+        validators.arrays_sampled,
+        validators.items_validated,
+        validators.items_skipped,
+    )
+    try:
+        skipped, message = bool(check(to_response(request), case)), None
+    except AssertionError as exc:
+        skipped, message = False, str(exc) or f"Check '{request.check}' failed"
+    return CheckOutcome(
+        skipped,
+        message,
+        validators.arrays_sampled - before[0],
+        validators.items_validated - before[1],
+        validators.items_skipped - before[2],
+    )
+
+
+def to_response(request: CheckRequest) -> Response:
+    response = Response()
+    response.status_code = request.status_code
+    response.headers = CaseInsensitiveDict(request.headers)
+    response._content = request.content  # pylint: disable=protected-access
+    response.encoding = request.encoding
+    response.url = request.url
+    if request.request_method is not None:
+        prepared = PreparedRequest()
+        prepared.prepare(
+            method=request.request_method,
+            url=request.request_url,
+            headers=request.request_headers,
+        )
+        prepared.body = request.request_body
+        response.request = prepared
+    return response
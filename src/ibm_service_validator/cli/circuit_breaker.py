@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
+from urllib.parse import urlsplit
+
+import re
+import threading
+import unittest
+
+from requests import PreparedRequest, Response
+from requests.auth import AuthBase, HTTPBasicAuth, HTTPDigestAuth
+from schemathesis.schemas import BaseSchema
+
+from ibm_service_validator.cli.workers import Operation
+
+PATH_PARAMETER: Pattern[str] = re.compile(r"{[^}]+}")
+
+
+class CircuitOpen(unittest.SkipTest):
+    """Raised instead of sending a request to an operation or host whose circuit is open.
+
+    Hypothesis re-raises skip exceptions at once, so the operation's test ends without
+    shrinking or replaying the example, and Schemathesis reports it as an error.
+    """
+
+
+class CircuitBreaker(AuthBase):
+    """Stops sending requests to an operation, or a host, that keeps failing.
+
+    The circuit of an operation opens after ``threshold`` consecutive timeouts,
+    connection errors or 5xx responses, and the circuit of a host after ``threshold``
+    consecutive timeouts or connection errors from any of its operations. A 5xx response
+    shows the host is up, so one failing operation does not stop the others. Circuits
+    stay open for the rest of the run. Requests to an open circuit raise
+    CircuitOpen, so Schemathesis reports the operation's remaining examples and
+    additional cases as an error without waiting for the request timeout.
+
+    Like DownloadCap, it is passed to the runner as the auth, because requests calls the
+    auth before every request and its response hook after every response. A request
+    that has not had a response by the time its thread sends the next one failed at the
+    transport level.
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        auth: Optional[Union[Tuple[str, str], AuthBase]] = None,
+        auth_type: Optional[str] = None,
+    ) -> None:
+        self.threshold = threshold
+        self.auth: Optional[AuthBase] = None
+        if isinstance(auth, tuple):
+            self.auth = (
+                HTTPDigestAuth(*auth) if auth_type == "digest" else HTTPBasicAuth(*auth)
+            )
+        elif auth is not None:
+            self.auth = auth
+        # consecutive failures and open circuits, by operation or host
+        self.failures: Dict[Union[Operation, str], int] = {}
+        self.opened: Dict[Union[Operation, str], str] = {}
+        # path pattern and path of every operation, paths without parameters first
+        self._paths: List[Tuple[Pattern[str], str]] = []
+        # the request each thread is waiting for a response to
+        self._pending = threading.local()
+        self._lock = threading.Lock()
+
+    def watching(self, loader: Callable[..., BaseSchema]) -> Callable[..., BaseSchema]:
+        """Wraps a schema loader so requests can be matched to the operations of the schema."""
+
+        def load(*args: Any, **kwargs: Any) -> BaseSchema:
+            schema = loader(*args, **kwargs)
+            paths = map(schema.get_full_path, schema.raw_schema.get("paths", {}))
+            # a path without parameters is matched before a path it could be a value of
+            self._paths = [
+                (path_pattern(path), path)
+                for path in sorted(
+                    paths, key=lambda path: len(PATH_PARAMETER.findall(path))
+                )
+            ]
+            return schema
+
+        return load
+
+    def __call__(self, request: PreparedRequest) -> PreparedRequest:
+        self._failed_without_response()
+        operation, host = self._keys(request)
+        with self._lock:
+            reason = self.opened.get(operation) or self.opened.get(host)
+        if reason is not None:
+            raise CircuitOpen(f"Skipped: circuit open, {reason}.")
+        if self.auth is not None:
+            request = self.auth(request)
+        self._pending.keys = (operation, host)
+        request.register_hook("response", self.record_response)
+        return request
+
+    def record_response(self, response: Response, **kwargs: Any) -> Response:
+        keys = getattr(self._pending, "keys", None)
+        self._pending.keys = None
+        if keys is not None:
+            operation, host = keys
+            self._record(
+                operation,
+                response.status_code >= 500,
+                "timed out, could not connect or had a server error",
+            )
+            self._record(host, False)
+        return response
+
+    def _failed_without_response(self) -> None:
+        keys = getattr(self._pending, "keys", None)
+        if keys is not None:
+            self._pending.keys = None
+            operation, host = keys
+            self._record(
+                operation, True, "timed out, could not connect or had a server error"
+            )
+            self._record(host, True, "timed out or could not connect")
+
+    def _record(self, key: Union[Operation, str], failed: bool, reason: str = "") -> None:
+        with self._lock:
+            if not failed:
+                self.failures[key] = 0
+                return
+            self.failures[key] = self.failures.get(key, 0) + 1
+            if self.failures[key] >= self.threshold and key not in self.opened:
+                name = f"{key[0]} {key[1]}" if isinstance(key, tuple) else f"host {key}"
+                self.opened[key] = (
+                    f"the last {self.threshold} requests to {name} {reason}"
+                )
+
+    def _keys(self, request: PreparedRequest) -> Tuple[Operation, str]:
+        url = urlsplit(request.url or "")
+        method = (request.method or "").upper()
+        for pattern, path in self._paths:
+            if pattern.search(url.path):
+                return (method, path), url.netloc
+        return (method, url.path), url.netloc
+
+
+def path_pattern(path: str) -> Pattern[str]:
+    """Matches the end of the URLs of a path, whatever the values of its parameters."""
+    return re.compile("[^/]+".join(map(re.escape, PATH_PARAMETER.split(path))) + "$")
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, Iterable
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import traceback
+
+import click
+
+# the client sends its API key, so the socket lives in a directory only its user can use
+DEFAULT_SOCKET_PATH: str = os.path.join(
+    tempfile.gettempdir(), f"ibm-service-validator-{os.getuid()}", "daemon.sock"
+)
+
+
+def send_message(stream: io.BufferedIOBase, message: Dict[str, Any]) -> None:
+    """Writes one newline-delimited JSON message."""
+    stream.write((json.dumps(message) + "\n").encode("utf-8"))
+    stream.flush()
+
+
+class OutputStream(io.TextIOBase):
+    """Text stream that forwards everything written to it as output messages."""
+
+    def __init__(self, stream: io.BufferedIOBase) -> None:
+        super().__init__()
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        # click probes streams with bytes to tell text and binary streams apart
+        if not isinstance(text, str):
+            raise TypeError("OutputStream only accepts str.")
+        if text:
+            send_message(self._stream, {"output": text})
+        return len(text)
+
+
+class RunRequestHandler(socketserver.StreamRequestHandler):
+    """Runs the command for a single request and streams its output back."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line)
+        exit_code = execute_request(
+            self.server.command, request, OutputStream(self.wfile)
+        )
+        send_message(self.wfile, {"exit_code": exit_code})
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Serves run requests one at a time.
+
+    Requests are not handled concurrently because each run changes the working directory,
+    environment, and stdout of the process.
+    """
+
+    def __init__(self, socket_path: str, command: click.Command) -> None:
+        self.command = command
+        self.socket_path = socket_path
+        super().__init__(socket_path, RunRequestHandler)
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        # only the user that started the daemon may connect
+        os.chmod(self.socket_path, stat.S_IRUSR | stat.S_IWUSR)
+
+
+def execute_request(
+    command: click.Command, request: Dict[str, Any], output: io.TextIOBase
+) -> int:
+    """Invokes command as if it was run from the client's directory and environment."""
+    cwd = os.getcwd()
+    environ = dict(os.environ)
+    try:
+        os.chdir(request.get("cwd", cwd))
+        os.environ.update(request.get("env", {}))
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            return invoke(command, request.get("args", []))
+    finally:
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(environ)
+
+
+def invoke(command: click.Command, args: Iterable[str]) -> int:
+    """Runs command in non-standalone mode and converts the outcome to an exit code."""
+    try:
+        exit_code = command.main(
+            list(args),
+            prog_name=f"ibm-service-validator {command.name}",
+            standalone_mode=False,
+            color=True,
+        )
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:  # pylint: disable=broad-except
+        # an unexpected error in one run should not take down the daemon
+        click.secho(traceback.format_exc(), fg="red")
+        return 1
+    return exit_code or 0
+
+
+def serve(socket_path: str, command: click.Command) -> None:
+    os.makedirs(socket_directory(socket_path), mode=0o700, exist_ok=True)
+    check_private_directory(socket_path)
+    if os.path.exists(socket_path):
+        if is_listening(socket_path):
+            raise click.UsageError(f"A daemon is already listening on {socket_path}.")
+        # stale socket left behind by a daemon that did not shut down cleanly
+        os.unlink(socket_path)
+
+    server = DaemonServer(socket_path, command)
+    click.echo(f"Listening on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+
+
+def is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def socket_directory(socket_path: str) -> str:
+    return os.path.dirname(os.path.abspath(socket_path))
+
+
+def check_private_directory(socket_path: str) -> None:
+    """Refuses a socket in a directory where other users could put a socket of their own.
+
+    A socket another user created would receive the environment, and the API key, of
+    every client that connects to it.
+    """
+    directory = socket_directory(socket_path)
+    status = os.stat(directory)
+    if status.st_uid != os.getuid() or status.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise click.UsageError(
+            f"{directory} must be owned by the current user and not writable by other users, so no one else can replace the socket."
+        )
+
+
+def forward_run(socket_path: str, args: Iterable[str], env: Dict[str, str]) -> int:
+    """Sends run arguments to the daemon, echoes its output, and returns the exit code."""
+    request = {"args": list(args), "cwd": os.getcwd(), "env": env}
+    not_listening = click.UsageError(
+        f"No daemon is listening on {socket_path}. Start one with: ibm-service-validator daemon"
+    )
+    if not os.path.isdir(socket_directory(socket_path)):
+        raise not_listening
+    check_private_directory(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            raise not_listening from e
+
+        with sock.makefile("rwb") as stream:
+            send_message(stream, request)
+            for line in stream:
+                message = json.loads(line)
+                if "output" in message:
+                    click.echo(message["output"], nl=False)
+                elif "exit_code" in message:
+                    return message["exit_code"]
+
+    raise click.ClickException("Daemon closed the connection before the run finished.")
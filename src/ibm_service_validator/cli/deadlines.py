@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import math
+
+import hypothesis
+from requests import Response
+from schemathesis.exceptions import InvalidSchema
+from schemathesis.models import Case, Endpoint
+from schemathesis.schemas import BaseSchema
+
+from ibm_service_validator.cli.incremental import operation_key
+from ibm_service_validator.cli.process_config import (
+    ADAPTIVE_DEADLINE_CONFIG_NAME,
+    config_count,
+    config_number,
+    load_config,
+)
+from ibm_service_validator.handbook_rules.add_case_rules import is_probe
+
+Test = Union[Callable, InvalidSchema]
+
+
+class DeadlineConfig(NamedTuple):
+    """How a deadline is derived from the latency of an operation's first example."""
+
+    multiplier: float = 5.0
+    # milliseconds
+    min_deadline: int = 200
+
+
+def load_deadline_config() -> DeadlineConfig:
+    """Returns the adaptive_deadline config, with defaults for the values it omits."""
+    config = load_config().get(ADAPTIVE_DEADLINE_CONFIG_NAME)
+    defaults = DeadlineConfig()
+    if not isinstance(config, dict):
+        return defaults
+    section = ADAPTIVE_DEADLINE_CONFIG_NAME
+    return DeadlineConfig(
+        multiplier=max(
+            config_number(config, section, "multiplier", defaults.multiplier), 1.0
+        ),
+        min_deadline=max(
+            config_count(config, section, "min_deadline", defaults.min_deadline), 1
+        ),
+    )
+
+
+class AdaptiveDeadlines:
+    """Gives each operation a Hypothesis deadline derived from its measured latency.
+
+    An operation with a deadline in the history file is tested with it. Otherwise, it is
+    calibrated: it is tested without a deadline. Either way, ``measure`` times the
+    responses of its first example, which is its first explicit example if it has one,
+    including those of the additional cases sent with it, as Hypothesis times the whole
+    example. The deadline is that latency times the multiplier, but at least
+    min_deadline. ``deadlines`` holds the deadlines measured in this run, and the ones
+    from the history file for operations that were not tested, so they can be written
+    back to the history file; each run recalibrates the operations it tests.
+
+    Tests are created just before they run, so this only works with a single worker.
+    """
+
+    def __init__(
+        self, config: DeadlineConfig, history: Dict[str, Dict[str, Any]]
+    ) -> None:
+        self.config = config
+        # operation key -> milliseconds
+        self.deadlines: Dict[str, int] = {
+            key: previous["deadline"]
+            for key, previous in history.items()
+            if isinstance(previous.get("deadline"), int) and previous["deadline"] > 0
+        }
+        # the deadlines tests are created with
+        self.previous = dict(self.deadlines)
+        # operation key -> milliseconds taken by the responses of its first example
+        self.first_examples: Dict[str, float] = {}
+        # operations whose first example is over
+        self.measured: Set[str] = set()
+
+    def loader(self, loader: Callable[..., BaseSchema]) -> Callable[..., BaseSchema]:
+        """Wraps a schema loader so each test has the deadline of its operation."""
+
+        def load(*args: Any, **kwargs: Any) -> BaseSchema:
+            schema = loader(*args, **kwargs)
+            get_all_tests = schema.get_all_tests
+
+            def get_tests_with_deadlines(
+                func: Callable,
+                settings: Optional[hypothesis.settings] = None,
+                seed: Optional[int] = None,
+            ) -> Generator[Tuple[Endpoint, Test], None, None]:
+                for endpoint, test in get_all_tests(func, settings, seed):
+                    if not isinstance(test, InvalidSchema):
+                        self.apply(endpoint, test)
+                    yield endpoint, test
+
+            schema.get_all_tests = get_tests_with_deadlines  # type: ignore
+            return schema
+
+        return load
+
+    def apply(self, endpoint: Endpoint, test: Callable) -> None:
+        # Schemathesis sets its default deadline the same way, Hypothesis reads the
+        # settings when the test is called
+        settings = test._hypothesis_internal_use_settings  # type: ignore
+        deadline = self.previous.get(operation_key(endpoint.method, endpoint.full_path))
+        test._hypothesis_internal_use_settings = hypothesis.settings(  # type: ignore
+            settings, deadline=deadline
+        )
+
+    def measure(self, response: Response, case: Case) -> Optional[bool]:
+        key = operation_key(case.endpoint.method, case.endpoint.full_path)
+        if key in self.first_examples and not is_probe(case):
+            # the additional cases of an example are sent after its own request, so
+            # this is the operation's next example
+            self.measured.add(key)
+        if key not in self.measured:
+            latency = self.first_examples.get(key, 0.0)
+            latency += response.elapsed.total_seconds() * 1000
+            self.first_examples[key] = latency
+            self.deadlines[key] = max(
+                math.ceil(latency * self.config.multiplier), self.config.min_deadline
+            )
+        # skips the test when it's not relevant
+        return True
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Optional, Tuple
+
+from requests import PreparedRequest, Response
+from requests.auth import AuthBase, HTTPBasicAuth, HTTPDigestAuth
+
+from ibm_service_validator.handbook_rules.general_rules.response_size_rules import (
+    DOWNLOAD_CAP_EXCEEDED,
+)
+
+CHUNK_SIZE: int = 64 * 1024
+
+
+class DownloadCap(AuthBase):
+    """Stops reading a response body once it is larger than cap bytes.
+
+    Schemathesis creates the session, and its auth is the only part of it we configure.
+    requests calls the auth for every request, so it registers a response hook, which
+    runs before the body is read. The run's own auth is applied first.
+    """
+
+    def __init__(
+        self,
+        cap: int,
+        auth: Optional[Tuple[str, str]] = None,
+        auth_type: Optional[str] = None,
+    ) -> None:
+        self.cap = cap
+        self.auth: Optional[AuthBase] = None
+        if auth is not None:
+            self.auth = (
+                HTTPDigestAuth(*auth) if auth_type == "digest" else HTTPBasicAuth(*auth)
+            )
+
+    def __call__(self, request: PreparedRequest) -> PreparedRequest:
+        if self.auth is not None:
+            request = self.auth(request)
+        request.register_hook("response", self.read_capped)
+        return request
+
+    def read_capped(self, response: Response, **kwargs: Any) -> Response:
+        if kwargs.get("stream"):
+            return response
+        length = response.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) > self.cap:
+            return self.discard(response)
+
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.cap:
+                return self.discard(response)
+            chunks.append(chunk)
+        response._content = b"".join(chunks)  # pylint: disable=protected-access
+        return response
+
+    def discard(self, response: Response) -> Response:
+        """Closes the connection without reading the rest of the body."""
+        response.close()
+        response._content = b""  # pylint: disable=protected-access
+        response._content_consumed = True  # pylint: disable=protected-access
+        # the body is gone, so the checks that parse it skip the response
+        response.headers.pop("Content-Type", None)
+        setattr(response, DOWNLOAD_CAP_EXCEEDED, self.cap)
+        return response
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+import functools
+import threading
+import unittest
+
+from hypothesis.errors import MultipleFailures
+from requests import Response
+from schemathesis.models import Case
+
+from ibm_service_validator.cli.incremental import operation_key
+from ibm_service_validator.cli.process_config import (
+    FAILURE_BUDGET_CONFIG_NAME,
+    config_count,
+    load_config,
+)
+
+
+class FailureBudget(NamedTuple):
+    """How many failures an operation may produce before its test stops. 0 is unlimited."""
+
+    # distinct check and message pairs
+    max_failures: int = 0
+    # times the same failure is seen
+    max_repeats: int = 0
+
+
+def load_failure_budget(max_failures: Optional[int] = None) -> Optional[FailureBudget]:
+    """Returns the budget of the failure_budget config, or None to test without one.
+
+    max_failures, from --max-failures-per-operation, replaces the one in the config.
+    """
+    config = load_config().get(FAILURE_BUDGET_CONFIG_NAME)
+    if not isinstance(config, dict):
+        config = {}
+    budget = FailureBudget(
+        **{
+            field: config_count(config, FAILURE_BUDGET_CONFIG_NAME, field)
+            for field in FailureBudget._fields
+        }
+    )
+    if max_failures is not None:
+        budget = budget._replace(max_failures=max_failures)
+    if not any(budget):
+        return None
+    return budget
+
+
+class FailureBudgetSpent(unittest.SkipTest, MultipleFailures):
+    """Ends the test of an operation that has spent its failure budget.
+
+    Hypothesis re-raises skip exceptions at once instead of shrinking the example, and
+    Schemathesis reports MultipleFailures as a failure, with the failures already found.
+    """
+
+
+class FailureCounter:
+    """Counts the failures of each operation and stops testing it once its budget is spent.
+
+    ``count`` wraps each check. ``enforce`` is passed to the runner after them, so it sees
+    the failures of the response the other checks have just run on. Checks that are
+    warnings are not counted.
+    """
+
+    def __init__(
+        self, budget: FailureBudget, warnings: FrozenSet[str] = frozenset()
+    ) -> None:
+        self.budget = budget
+        self.warnings = warnings
+        self.failures: Dict[str, Dict[Tuple[str, str], int]] = {}
+        # operations whose test was stopped
+        self.spent: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def count(
+        self, check: Callable[[Response, Case], Optional[bool]]
+    ) -> Callable[[Response, Case], Optional[bool]]:
+        if check.__name__ in self.warnings:
+            return check
+
+        @functools.wraps(check)
+        def counted_check(response: Response, case: Case) -> Optional[bool]:
+            try:
+                return check(response, case)
+            except AssertionError as exc:
+                self._record(case, (check.__name__, str(exc)))
+                raise
+
+        return counted_check
+
+    def enforce(self, response: Response, case: Case) -> Optional[bool]:
+        key = operation_key(case.endpoint.method, case.endpoint.full_path)
+        with self._lock:
+            reason = self._reason(self.failures.get(key, {}))
+            if reason is None:
+                return True
+            self.spent[key] = reason
+        raise FailureBudgetSpent(f"Stopped testing {key}: {reason}.")
+
+    def _record(self, case: Case, failure: Tuple[str, str]) -> None:
+        key = operation_key(case.endpoint.method, case.endpoint.full_path)
+        with self._lock:
+            failures = self.failures.setdefault(key, {})
+            failures[failure] = failures.get(failure, 0) + 1
+
+    def _reason(self, failures: Dict[Tuple[str, str], int]) -> Optional[str]:
+        if self.budget.max_failures and len(failures) >= self.budget.max_failures:
+            return f"{len(failures)} distinct failures"
+        if self.budget.max_repeats and any(
+            count >= self.budget.max_repeats for count in failures.values()
+        ):
+            return f"the same failure {self.budget.max_repeats} times"
+        return None
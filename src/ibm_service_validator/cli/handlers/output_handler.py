@@ -13,7 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import click
 from schemathesis.cli.context import ExecutionContext
@@ -27,6 +38,29 @@ from schemathesis.runner.serialization import (
     SerializedTestResult,
 )
 
+from ibm_service_validator.cli.baseline import (
+    LATENCY_REGRESSION,
+    BaselineComparison,
+    Regression,
+)
+from ibm_service_validator.cli.latency_hunt import HuntedInput, LatencyHunt
+from ibm_service_validator.cli.metrics import PERCENTILES, ResponseMetrics
+from ibm_service_validator.cli.response_validators import ResponseValidators
+from ibm_service_validator.cli.time_budget import TimeBudget
+
+
+class RunReport(NamedTuple):
+    """What the summary shows besides the results, depending on the options of the run."""
+
+    statistics: bool = False
+    # results of the operations an incremental run did not test again
+    carried_forward: Optional[Dict[str, Dict[str, Any]]] = None
+    metrics: Optional[ResponseMetrics] = None
+    baseline: Optional[BaselineComparison] = None
+    validators: Optional[ResponseValidators] = None
+    time_budget: Optional[TimeBudget] = None
+    latency_hunt: Optional[LatencyHunt] = None
+
 
 def handle_after_execution(
     context: ExecutionContext, event: events.AfterExecution, warnings: FrozenSet[str]
@@ -42,7 +76,7 @@ def handle_finished(
     context: ExecutionContext,
     event: events.Finished,
     warnings: FrozenSet[str],
-    statistics: bool = False,
+    report: RunReport = RunReport(),
 ) -> None:
     """Show the outcome of the whole testing session."""
     click.echo()
@@ -51,9 +85,24 @@ def handle_finished(
     display_warnings(context, event, warnings)
     display_errors(context, event, warnings)
     default.display_application_logs(context, event)
-    display_totals(context, event, warnings)
+    if report.baseline is not None and report.baseline.regressions:
+        display_regressions(report.baseline.regressions, warnings)
+    display_totals(context, event, warnings, report.carried_forward)
+    if report.validators is not None and report.validators.arrays_sampled:
+        click.echo()
+        display_array_sampling(report.validators)
+    if report.time_budget is not None and report.time_budget.reduced:
+        click.echo()
+        display_reduced_coverage(report.time_budget)
+    latency_hunt = report.latency_hunt
+    if latency_hunt is not None and latency_hunt.slowest:
+        click.echo()
+        display_hunted_inputs("Slowest inputs", latency_hunt.slowest, "elapsed")
+    if latency_hunt is not None and latency_hunt.largest:
+        click.echo()
+        display_hunted_inputs("Largest responses", latency_hunt.largest, "size")
     click.echo()
-    display_summary(event, warnings, statistics)
+    display_summary(event, warnings, report.statistics, report.metrics)
 
 
 def handle_internal_error(context: ExecutionContext, event: events.InternalError) -> None:
@@ -233,8 +282,69 @@ def display_example(
         )
 
 
+def display_regressions(regressions: List[Regression], warnings: FrozenSet[str]) -> None:
+    """Show the statistics that regressed compared to the baseline."""
+    default.display_section_name("BASELINE REGRESSIONS")
+    click.echo()
+    for regression in regressions:
+        if regression.rule == LATENCY_REGRESSION:
+            baseline, current = (
+                f"{regression.baseline / 1000:.1f} ms",
+                f"{regression.current / 1000:.1f} ms",
+            )
+        else:
+            baseline, current = f"{regression.baseline} B", f"{regression.current} B"
+        ratio = regression.current / regression.baseline if regression.baseline else None
+        click.secho(
+            f"{regression.operation}: {regression.rule} {regression.statistic} "
+            f"{baseline} -> {current}" + (f" ({ratio:.1f}x)" if ratio else ""),
+            fg="yellow" if regression.rule in warnings else "red",
+        )
+    click.echo()
+
+
+def display_array_sampling(validators: ResponseValidators) -> None:
+    """Shows how many array items response_schema_conformance skipped."""
+    category = click.style("Sampled arrays", bold=True)
+    click.secho(
+        f"{category}: {validators.arrays_sampled} arrays, "
+        f"{validators.items_validated} items validated, "
+        f"{validators.items_skipped} items skipped"
+    )
+
+
+def display_reduced_coverage(time_budget: TimeBudget) -> None:
+    """Lists the operations that got fewer examples to fit the time budget."""
+    click.secho(
+        f"Reduced coverage to fit the time budget of {time_budget.seconds:g} s:",
+        bold=True,
+    )
+    for operation, reduced in time_budget.reduced.items():
+        click.secho(f"    {operation}: {reduced}", fg="yellow")
+
+
+def display_hunted_inputs(
+    title: str, inputs: Dict[str, HuntedInput], order_by: str
+) -> None:
+    """Shows the input --hunt-latency found for each operation, the worst first."""
+    click.secho(f"{title}:", bold=True)
+    for operation, hunted in sorted(
+        inputs.items(), key=lambda item: getattr(item[1], order_by), reverse=True
+    ):
+        click.echo()
+        click.secho(
+            f"{operation}: {hunted.elapsed:.0f} ms, {hunted.size} bytes", fg="yellow"
+        )
+        click.echo(
+            f"Run this Python code to reproduce this request: \n\n    {hunted.case.requests_code}"
+        )
+
+
 def display_totals(
-    context: ExecutionContext, event: events.Finished, warnings: FrozenSet[str]
+    context: ExecutionContext,
+    event: events.Finished,
+    warnings: FrozenSet[str],
+    carried_forward: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> None:
     """Format and print statistic collected by :obj:`models.TestResult`."""
     default.display_section_name("SUMMARY")
@@ -246,6 +356,10 @@ def display_totals(
     if total:
         display_checks_totals(total, warnings)
 
+    if carried_forward:
+        click.echo()
+        display_carried_forward(carried_forward)
+
     if context.cassette_file_name or context.junit_xml_file:
         click.echo()
 
@@ -291,6 +405,20 @@ def display_checks_totals(
             display_check_result(check_name, results, template, warnings)
 
 
+def display_carried_forward(carried_forward: Dict[str, Dict[str, Any]]) -> None:
+    """Show the previous results of operations that were not tested again."""
+    padding = 20
+    col1_len = max(map(len, carried_forward.keys())) + padding
+    template = f"    {{:{col1_len}}}{{}}"
+    click.secho("Unchanged operations, results from the previous run:", bold=True)
+    for operation, previous in carried_forward.items():
+        passed = sum(
+            counts.get(Status.success.name, 0) for counts in previous["checks"].values()
+        )
+        total = sum(sum(counts.values()) for counts in previous["checks"].values())
+        click.echo(template.format(operation, f"{passed} / {total} checks passed"))
+
+
 def display_check_result(
     check_name: str,
     results: Dict[Union[str, Status], int],
@@ -319,12 +447,15 @@ def display_check_result(
 
 
 def display_summary(
-    event: events.Finished, warnings: FrozenSet[str], statistics: bool = False
+    event: events.Finished,
+    warnings: FrozenSet[str],
+    statistics: bool = False,
+    metrics: Optional[ResponseMetrics] = None,
 ) -> None:
     counts = get_summary_counts(event, warnings)
     message, color, status_code = get_summary_output(counts, event, warnings)
     if statistics:
-        display_statistical_summary(counts, event, warnings, color)
+        display_statistical_summary(counts, event, warnings, color, metrics)
     default.display_section_name(message, fg=color)
     raise click.exceptions.Exit(status_code)
 
@@ -334,6 +465,7 @@ def display_statistical_summary(
     event: events.Finished,
     warnings: FrozenSet[str],
     color: str = "cyan",
+    metrics: Optional[ResponseMetrics] = None,
 ) -> None:
     click.echo()
     default.display_section_name("STATISTICS")
@@ -353,7 +485,55 @@ def display_statistical_summary(
                 check_stats.items(), key=lambda x: x[1], reverse=True
             ):
                 click.secho(f"{check_name} : {count}", fg=color)
+    if metrics is not None and metrics.latencies:
+        click.echo()
+        display_latency_table(metrics, color)
+    click.echo()
+
+
+def display_latency_table(metrics: ResponseMetrics, color: str = "cyan") -> None:
+    """Shows the response time and size percentiles of each operation."""
+    columns = ("min", *(f"p{percent}" for percent in PERCENTILES), "max")
+    col1_len = max(map(len, metrics.latencies.keys())) + 4
+    template = f"{{:{col1_len}}}" + "{:>10}" * len(columns)
+
+    click.secho("Response times (ms)", fg=color, bold=True, underline=True)
+    click.secho(template.format("operation", *columns), fg=color)
+    for operation, latencies in sorted(metrics.latencies.items()):
+        summary = latencies.summary()
+        click.secho(
+            template.format(
+                operation, *(f"{summary[column] / 1000:.1f}" for column in columns)
+            ),
+            fg=color,
+        )
+
+    click.echo()
+    click.secho("Response sizes (bytes)", fg=color, bold=True, underline=True)
+    click.secho(template.format("operation", *columns), fg=color)
+    for operation, sizes in sorted(metrics.sizes.items()):
+        summary = sizes.summary()
+        click.secho(
+            template.format(operation, *(summary[column] for column in columns)),
+            fg=color,
+        )
+
     click.echo()
+    click.secho("Compression", fg=color, bold=True, underline=True)
+    click.secho(
+        f"Received {metrics.received_bytes} bytes. Compressing the responses larger than "
+        f"{metrics.compression_threshold} bytes would save {metrics.compression_savings} "
+        f"bytes ({metrics.compression_savings_percent:.1f}%).",
+        fg=color,
+    )
+
+    click.echo()
+    click.secho("Slowest operations by p99 (ms)", fg=color, bold=True, underline=True)
+    for operation, latencies in metrics.slowest():
+        click.secho(
+            f"{operation:{col1_len}}{latencies.value_at_percentile(99) / 1000:>10.1f}",
+            fg=color,
+        )
 
 
 def get_results_by_severity(
@@ -471,9 +651,9 @@ def _warn(check: SerializedCheck, warnings: FrozenSet[str]) -> bool:
 
 
 class OutputHandler(EventHandler):
-    def __init__(self, warn: FrozenSet[str], statistics: bool) -> None:
+    def __init__(self, warn: FrozenSet[str], report: RunReport = RunReport()) -> None:
         self.warn: FrozenSet[str] = warn
-        self.statistics = statistics
+        self.report = report
 
     def handle_event(
         self, context: ExecutionContext, event: events.ExecutionEvent
@@ -487,7 +667,7 @@ class OutputHandler(EventHandler):
             context.hypothesis_output.extend(event.hypothesis_output)
             handle_after_execution(context, event, self.warn)
         if isinstance(event, events.Finished):
-            handle_finished(context, event, self.warn, self.statistics)
+            handle_finished(context, event, self.warn, self.report)
         if isinstance(event, events.Interrupted):
             default.handle_interrupted(context, event)
         if isinstance(event, events.InternalError):
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import json
+import os
+
+from schemathesis.cli.context import ExecutionContext
+from schemathesis.cli.handlers import EventHandler
+from schemathesis.models import Endpoint, Status
+from schemathesis.runner import events
+from schemathesis.schemas import BaseSchema
+
+from ibm_service_validator.cli.incremental import operation_key
+
+HISTORY_VERSION: int = 1
+DEFAULT_HISTORY_FILE: str = ".ibm-service-validator-history.json"
+
+SCHEMA_ORDER: str = "schema"
+FAILED_FIRST: str = "failed-first"
+LONGEST_FIRST: str = "longest-first"
+ORDERS: Tuple[str, ...] = (SCHEMA_ORDER, FAILED_FIRST, LONGEST_FIRST)
+
+
+def load_history(history_file: str) -> Dict[str, Dict[str, Any]]:
+    """Returns the outcome and duration of each operation from earlier runs."""
+    if not os.path.exists(history_file):
+        return {}
+    with open(history_file, "r") as f:
+        history = json.load(f)
+    if not isinstance(history, dict) or history.get("version") != HISTORY_VERSION:
+        return {}
+    return history.get("operations", {})
+
+
+def order_endpoints(
+    endpoints: Iterable[Endpoint], order: str, history: Dict[str, Dict[str, Any]]
+) -> List[Endpoint]:
+    """Sorts endpoints by the given order. Ties keep the order of the API definition."""
+    endpoints = list(endpoints)
+    if order == FAILED_FIRST:
+        return sorted(endpoints, key=lambda endpoint: failed_first_key(endpoint, history))
+    if order == LONGEST_FIRST:
+        return sorted(
+            endpoints, key=lambda endpoint: longest_first_key(endpoint, history)
+        )
+    return endpoints
+
+
+def failed_first_key(endpoint: Endpoint, history: Dict[str, Dict[str, Any]]) -> int:
+    previous = history.get(operation_key(endpoint.method, endpoint.full_path))
+    if previous is None:
+        # an operation without history is as likely to fail as any other
+        return 1
+    return 0 if previous["status"] != Status.success.name else 2
+
+
+def longest_first_key(endpoint: Endpoint, history: Dict[str, Dict[str, Any]]) -> float:
+    previous = history.get(operation_key(endpoint.method, endpoint.full_path))
+    if previous is None:
+        # operations of unknown duration go first, so they can not end up last
+        return float("-inf")
+    return -previous["elapsed_time"]
+
+
+def ordered_loader(
+    loader: Callable[..., BaseSchema], order: str, history: Dict[str, Dict[str, Any]]
+) -> Callable[..., BaseSchema]:
+    """Wraps a schema loader so the runner tests the endpoints in the given order."""
+
+    def load(*args: Any, **kwargs: Any) -> BaseSchema:
+        schema = loader(*args, **kwargs)
+        get_all_endpoints = schema.get_all_endpoints
+
+        def get_ordered_endpoints() -> Iterable[Endpoint]:
+            return iter(order_endpoints(get_all_endpoints(), order, history))
+
+        # both the serial and the threaded runner take endpoints from this method
+        schema.get_all_endpoints = get_ordered_endpoints  # type: ignore
+        return schema
+
+    return load
+
+
+class HistoryRecorder(EventHandler):
+    """Records the outcome and duration of each tested operation in the history file.
+
+    Deadlines, from --adaptive-deadline, are recorded for the operations that have one.
+    """
+
+    def __init__(
+        self,
+        history_file: str,
+        history: Dict[str, Dict[str, Any]],
+        deadlines: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.history_file = history_file
+        # operations that are not tested in this run keep their history
+        self.operations = dict(history)
+        self.deadlines = deadlines
+
+    def handle_event(
+        self, context: ExecutionContext, event: events.ExecutionEvent
+    ) -> None:
+        if isinstance(event, events.AfterExecution):
+            key = operation_key(event.method, event.path)
+            self.operations[key] = {
+                **self.operations.get(key, {}),
+                "status": event.status.name,
+                "elapsed_time": event.elapsed_time,
+            }
+        if isinstance(event, events.Finished):
+            self.write()
+
+    def write(self) -> None:
+        for key, deadline in (self.deadlines or {}).items():
+            if key in self.operations:
+                self.operations[key] = {**self.operations[key], "deadline": deadline}
+        with open(self.history_file, "w") as f:
+            json.dump(
+                {"version": HISTORY_VERSION, "operations": self.operations},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
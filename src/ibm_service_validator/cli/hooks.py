@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+import functools
+import threading
+
+from requests import Response
+from schemathesis.hooks import GLOBAL_HOOK_DISPATCHER
+from schemathesis.models import Case
+
+_ACTIVE_HOOKS: ContextVar[Optional["RunHooks"]] = ContextVar(
+    "_ACTIVE_HOOKS", default=None
+)
+_REGISTRATION_LOCK = threading.Lock()
+
+
+class RunHooks:
+    """Hooks that apply to a single run.
+
+    Schemathesis only dispatches hooks registered on GLOBAL_HOOK_DISPATCHER, so the hooks
+    are registered there while the run is inside the ``with`` block and removed on exit.
+    Each hook only fires in the context that entered the block, so runs in other threads
+    do not trigger each other's hooks. Worker threads of the run join its context through
+    ``join_thread``.
+    """
+
+    def __init__(self) -> None:
+        self._hooks: List[Tuple[str, Callable]] = []
+        self._registered: List[Tuple[str, Callable]] = []
+        self._token: Optional[Token] = None
+
+    def register(self, hook: Callable, name: Optional[str] = None) -> Callable:
+        self._hooks.append((name or hook.__name__, hook))
+        return hook
+
+    def __enter__(self) -> "RunHooks":
+        self._token = _ACTIVE_HOOKS.set(self)
+        with _REGISTRATION_LOCK:
+            for name, hook in self._hooks:
+                scoped_hook = self._scope(hook)
+                GLOBAL_HOOK_DISPATCHER.register_hook_with_name(scoped_hook, name)
+                self._registered.append((name, scoped_hook))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        with _REGISTRATION_LOCK:
+            for name, scoped_hook in self._registered:
+                # replace the list instead of filtering it in place, so a run that is
+                # dispatching the same hooks in another thread is not affected
+                GLOBAL_HOOK_DISPATCHER._hooks[name] = (
+                    [  # pylint: disable=protected-access
+                        hook
+                        for hook in GLOBAL_HOOK_DISPATCHER.get_all_by_name(name)
+                        if hook is not scoped_hook
+                    ]
+                )
+            self._registered.clear()
+        if self._token is not None:
+            _ACTIVE_HOOKS.reset(self._token)
+            self._token = None
+
+    def join_thread(self, response: Response, case: Case) -> Optional[bool]:
+        """Passed to the runner as the first check, so the hooks fire in its worker threads.
+
+        Threads do not inherit the context that entered the block. A worker thread joins
+        it when it checks its first response, before any add_case hook is dispatched.
+        It always returns True, so Schemathesis does not record it as a result.
+        """
+        if _ACTIVE_HOOKS.get() is not self:
+            _ACTIVE_HOOKS.set(self)
+        return True
+
+    def _scope(self, hook: Callable) -> Callable:
+        # functools.wraps keeps the signature Schemathesis validates hooks against
+        @functools.wraps(hook)
+        def scoped_hook(*args: Any) -> Any:
+            if _ACTIVE_HOOKS.get() is self:
+                return hook(*args)
+            return None
+
+        return scoped_hook
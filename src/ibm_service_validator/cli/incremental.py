@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple, Union
+
+import copy
+import hashlib
+import json
+import os
+
+import click
+from schemathesis.cli.context import ExecutionContext
+from schemathesis.cli.handlers import EventHandler
+from schemathesis.exceptions import InvalidSchema
+from schemathesis.models import Endpoint, Status
+from schemathesis.runner import events
+from schemathesis.schemas import BaseSchema
+
+from ibm_service_validator.cli.overrides import RuleOverrides
+
+STATE_VERSION: int = 1
+HTTP_METHODS: FrozenSet[str] = frozenset(
+    {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+)
+
+
+def prepare_incremental_run(
+    state_file: str,
+    raw_schema: Union[str, Dict[str, Any]],
+    loader: Callable,
+    overrides: Optional[RuleOverrides] = None,
+    warnings: FrozenSet[str] = frozenset(),
+) -> Tuple[Union[str, Dict[str, Any]], Optional["IncrementalRun"]]:
+    """Returns the schema pruned to the operations that need testing and the state recorder.
+
+    Operations are fingerprinted with the rules that apply to them, so an operation is
+    tested again when its rules or their configuration change.
+    """
+    if not isinstance(raw_schema, dict):
+        raise click.UsageError("--changed-since requires an API definition file.")
+
+    try:
+        # all operations are fingerprinted, so runs filtered by --endpoint and the like
+        # keep the state of the operations they do not test
+        schema = loader(copy.deepcopy(raw_schema), validate_schema=False)
+        fingerprints = fingerprint_operations(schema, overrides, warnings)
+    except InvalidSchema:
+        # test everything, so the runner reports the problem with the definition
+        return raw_schema, None
+
+    previous = load_state(state_file)
+    selected = select_operations(fingerprints, previous)
+    pruned = prune_schema(
+        raw_schema,
+        (endpoint for key, (endpoint, _) in fingerprints.items() if key in selected),
+    )
+    return pruned, IncrementalRun(state_file, fingerprints, previous, selected)
+
+
+def operation_key(method: str, path: str) -> str:
+    return f"{method.upper()} {path}"
+
+
+def fingerprint(
+    endpoint: Endpoint,
+    overrides: Optional[RuleOverrides] = None,
+    warnings: FrozenSet[str] = frozenset(),
+) -> str:
+    """Hashes everything in the operation's resolved definition and rules that affects its tests."""
+    definition: Dict[str, Any] = {
+        "definition": endpoint.definition.resolved,
+        # parameters are merged with the path's common parameters here
+        "path_parameters": endpoint.path_parameters,
+        "headers": endpoint.headers,
+        "cookies": endpoint.cookies,
+        "query": endpoint.query,
+        "body": endpoint.body,
+        "form_data": endpoint.form_data,
+    }
+    if overrides is not None:
+        rules = overrides.rules_for(endpoint)
+        definition["rules"] = {
+            "enabled": sorted(rules),
+            "warnings": sorted(rules & warnings),
+            "response_time_budget": overrides.response_time_budget(endpoint),
+            "max_response_size": overrides.max_response_size(endpoint),
+            "compression_threshold": overrides.compression_threshold,
+        }
+    serialized = json.dumps(definition, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def fingerprint_operations(
+    schema: BaseSchema,
+    overrides: Optional[RuleOverrides] = None,
+    warnings: FrozenSet[str] = frozenset(),
+) -> Dict[str, Tuple[Endpoint, str]]:
+    return {
+        operation_key(endpoint.method, endpoint.full_path): (
+            endpoint,
+            fingerprint(endpoint, overrides, warnings),
+        )
+        for endpoint in schema.get_all_endpoints()
+    }
+
+
+def load_state(state_file: str) -> Dict[str, Dict[str, Any]]:
+    """Returns the operations recorded by the previous run, or nothing on the first run."""
+    if not os.path.exists(state_file):
+        return {}
+    with open(state_file, "r") as f:
+        state = json.load(f)
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return {}
+    return state.get("operations", {})
+
+
+def select_operations(
+    fingerprints: Dict[str, Tuple[Endpoint, str]], previous: Dict[str, Dict[str, Any]]
+) -> FrozenSet[str]:
+    """Returns operations that are new, changed, or did not pass in the previous run."""
+    return frozenset(
+        key
+        for key, (_, current) in fingerprints.items()
+        if key not in previous
+        or previous[key].get("fingerprint") != current
+        or previous[key].get("status") != Status.success.name
+    )
+
+
+def prune_schema(
+    raw_schema: Dict[str, Any], endpoints: Iterable[Endpoint]
+) -> Dict[str, Any]:
+    """Returns a copy of the raw schema with only the given operations under paths."""
+    keep: Dict[str, set] = {}
+    for endpoint in endpoints:
+        keep.setdefault(endpoint.path, set()).add(endpoint.method.lower())
+
+    pruned = {key: value for key, value in raw_schema.items() if key != "paths"}
+    pruned["paths"] = {}
+    for path, path_item in raw_schema.get("paths", {}).items():
+        if path not in keep:
+            continue
+        if "$ref" in path_item:
+            # a referenced path item can not be pruned without resolving it
+            pruned["paths"][path] = path_item
+            continue
+        pruned["paths"][path] = {
+            key: copy.deepcopy(value)
+            for key, value in path_item.items()
+            # keeps path level fields like parameters and servers
+            if key.lower() in keep[path] or key.lower() not in HTTP_METHODS
+        }
+    return pruned
+
+
+class IncrementalRun(EventHandler):
+    """Records the outcome of each tested operation and writes the state file at the end."""
+
+    def __init__(
+        self,
+        state_file: str,
+        fingerprints: Dict[str, Tuple[Endpoint, str]],
+        previous: Dict[str, Dict[str, Any]],
+        selected: FrozenSet[str],
+    ) -> None:
+        self.state_file = state_file
+        self.selected = selected
+        self.fingerprints = {key: value for key, (_, value) in fingerprints.items()}
+        # operations that are no longer in the API definition are dropped
+        self.operations = {
+            key: previous[key] for key in self.fingerprints if key in previous
+        }
+        self.carried_forward = {
+            key: self.operations[key]
+            for key in sorted(self.fingerprints)
+            if key not in selected
+        }
+
+    def handle_event(
+        self, context: ExecutionContext, event: events.ExecutionEvent
+    ) -> None:
+        if isinstance(event, events.AfterExecution):
+            self.record(event)
+        if isinstance(event, events.Finished):
+            self.write()
+
+    def record(self, event: events.AfterExecution) -> None:
+        key = operation_key(event.method, event.path)
+        checks: Dict[str, Dict[str, int]] = {}
+        for check in event.result.checks:
+            counts = checks.setdefault(
+                check.name, {Status.success.name: 0, Status.failure.name: 0}
+            )
+            counts[check.value.name] = counts.get(check.value.name, 0) + 1
+        self.operations[key] = {
+            "fingerprint": self.fingerprints.get(key),
+            "status": event.status.name,
+            "checks": checks,
+        }
+
+    def write(self) -> None:
+        with open(self.state_file, "w") as f:
+            json.dump(
+                {"version": STATE_VERSION, "operations": self.operations},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import threading
+
+import hypothesis
+from requests import Response
+from schemathesis.models import Case
+from schemathesis.runner.serialization import SerializedCase
+
+from ibm_service_validator.cli.incremental import operation_key
+from ibm_service_validator.handbook_rules.add_case_rules import is_probe
+
+LATENCY_LABEL: str = "response_time"
+SIZE_LABEL: str = "response_size"
+
+
+class HuntedInput(NamedTuple):
+    # milliseconds
+    elapsed: float
+    # bytes
+    size: int
+    case: SerializedCase
+
+
+def with_target_phase(phases: List[hypothesis.Phase]) -> List[hypothesis.Phase]:
+    """Adds the phases that generate inputs and steer them toward a target."""
+    return [
+        *phases,
+        *(
+            phase
+            for phase in (hypothesis.Phase.generate, hypothesis.Phase.target)
+            if phase not in phases
+        ),
+    ]
+
+
+class LatencyHunt:
+    """Steers Hypothesis toward slow inputs and keeps the slowest input of each operation.
+
+    ``hunt`` is passed to the runner as a check. It reports the response time, and with
+    ``size`` the response size, as Hypothesis targets, which the target phase tries to
+    maximize. Hypothesis allows one observation per label for each example, so only the
+    example's own response is hunted; the requests of add_case rules, sent in the same
+    example, are neither targets nor kept. With ``size``, the input with the largest
+    response of each operation is kept as well.
+    """
+
+    def __init__(
+        self, size: bool = False, headers: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self.size = size
+        self.headers = headers
+        # operation key -> input
+        self.slowest: Dict[str, HuntedInput] = {}
+        self.largest: Dict[str, HuntedInput] = {}
+        self._lock = threading.Lock()
+
+    def hunt(self, response: Response, case: Case) -> Optional[bool]:
+        if is_probe(case):
+            # skips the test when it's not relevant
+            return True
+        elapsed = response.elapsed.total_seconds() * 1000
+        size = len(response.content or b"")
+        hypothesis.target(elapsed, label=LATENCY_LABEL)
+        if self.size:
+            hypothesis.target(float(size), label=SIZE_LABEL)
+
+        key = operation_key(case.endpoint.method, case.endpoint.full_path)
+        with self._lock:
+            slowest = self.slowest.get(key)
+            if slowest is None or elapsed > slowest.elapsed:
+                self.slowest[key] = self.hunted(elapsed, size, case)
+            largest = self.largest.get(key)
+            if self.size and (largest is None or size > largest.size):
+                self.largest[key] = self.hunted(elapsed, size, case)
+        # skips the test when it's not relevant
+        return True
+
+    def hunted(self, elapsed: float, size: int, case: Case) -> HuntedInput:
+        return HuntedInput(elapsed, size, SerializedCase.from_case(case, self.headers))
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+import gzip
+import json
+import math
+import threading
+
+from requests import Response
+from schemathesis.cli.context import ExecutionContext
+from schemathesis.cli.handlers import EventHandler
+from schemathesis.models import Case
+from schemathesis.runner import events
+
+from ibm_service_validator.cli.incremental import operation_key
+from ibm_service_validator.handbook_rules.add_case_rules import is_probe
+from ibm_service_validator.handbook_rules.add_case_rules.compression_supported import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+)
+
+METRICS_VERSION: int = 1
+PERCENTILES: Tuple[int, ...] = (50, 90, 95, 99)
+SLOWEST_COUNT: int = 10
+
+
+class Histogram:
+    """Counts non-negative integers in log-linear buckets, like an HDR histogram.
+
+    Values below 128 are counted exactly. Above that, every power of two is split into 64
+    buckets, so a value is reported with a relative error below 1/64. Memory is bounded by
+    the number of buckets rather than the number of values.
+    """
+
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKET_HALF_COUNT = 1 << (SUB_BUCKET_BITS - 1)
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        value = max(int(value), 0)
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.min = value if not self.count else min(self.min, value)
+        self.max = max(self.max, value)
+        self.count += 1
+
+    def value_at_percentile(self, percent: float) -> int:
+        """Returns the highest value in the bucket of the nearest-rank percentile."""
+        if not self.count:
+            return 0
+        rank = max(math.ceil(percent / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # the exact maximum is known, so it caps the bucket's upper bound
+                return min(self._highest_value(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "count": self.count,
+            "min": self.min,
+            **{
+                f"p{percent}": self.value_at_percentile(percent)
+                for percent in PERCENTILES
+            },
+            "max": self.max,
+        }
+
+    def _index(self, value: int) -> int:
+        shift = max(value.bit_length() - self.SUB_BUCKET_BITS, 0)
+        return shift * self.SUB_BUCKET_HALF_COUNT + (value >> shift)
+
+    def _highest_value(self, index: int) -> int:
+        shift = max(index // self.SUB_BUCKET_HALF_COUNT - 1, 0)
+        sub_bucket = index - shift * self.SUB_BUCKET_HALF_COUNT
+        return ((sub_bucket + 1) << shift) - 1
+
+
+class ResponseMetrics:
+    """Collects the latency and size of each example's response, grouped by operation.
+
+    ``collect_response_metrics`` is passed to the runner as a check. It always returns
+    True, so Schemathesis does not record it as a result. The requests of add_case rules
+    are not collected.
+
+    It also counts the bytes received and how many of them gzip would save on the
+    uncompressed responses larger than the compression threshold. Responses may be
+    collected from several worker threads.
+    """
+
+    def __init__(
+        self, compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    ) -> None:
+        # microseconds
+        self.latencies: Dict[str, Histogram] = {}
+        # bytes
+        self.sizes: Dict[str, Histogram] = {}
+        self.compression_threshold = compression_threshold
+        self.received_bytes = 0
+        self.compression_savings = 0
+        self._lock = threading.Lock()
+
+    def collect_response_metrics(self, response: Response, case: Case) -> Optional[bool]:
+        if is_probe(case):
+            # only the example's own response, not the requests of add_case rules
+            return True
+        key = operation_key(case.endpoint.method, case.endpoint.full_path)
+        content = response.content or b""
+        # compressing is the slow part, so it happens outside the lock
+        received, savings = self._transfer(response, content)
+        with self._lock:
+            if key not in self.latencies:
+                self.latencies[key] = Histogram()
+                self.sizes[key] = Histogram()
+            self.latencies[key].record(int(response.elapsed.total_seconds() * 1_000_000))
+            self.sizes[key].record(len(content))
+            self.received_bytes += received
+            self.compression_savings += savings
+        return True
+
+    def _transfer(self, response: Response, content: bytes) -> Tuple[int, int]:
+        """Returns the bytes received and how many of them gzip would save."""
+        if response.headers.get("Content-Encoding"):
+            # requests has decoded the body, the header has the size that was sent
+            length = response.headers.get("Content-Length", "")
+            return (int(length) if length.isdigit() else len(content)), 0
+        if len(content) > self.compression_threshold:
+            return len(content), max(len(content) - len(gzip.compress(content)), 0)
+        return len(content), 0
+
+    @property
+    def compression_savings_percent(self) -> float:
+        if not self.received_bytes:
+            return 0.0
+        return self.compression_savings / self.received_bytes * 100
+
+    def slowest(self, count: int = SLOWEST_COUNT) -> List[Tuple[str, Histogram]]:
+        """Returns the operations with the highest p99 latency."""
+        return sorted(
+            self.latencies.items(),
+            key=lambda item: (item[1].value_at_percentile(99), item[1].max),
+            reverse=True,
+        )[:count]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": METRICS_VERSION,
+            "operations": {
+                operation: {
+                    "latency_us": latencies.summary(),
+                    "size_bytes": self.sizes[operation].summary(),
+                }
+                for operation, latencies in sorted(self.latencies.items())
+            },
+            "compression": {
+                "threshold_bytes": self.compression_threshold,
+                "received_bytes": self.received_bytes,
+                "savings_bytes": self.compression_savings,
+            },
+        }
+
+
+class MetricsExporter(EventHandler):
+    """Writes the collected metrics as JSON once the run finishes."""
+
+    def __init__(self, metrics: ResponseMetrics, file: IO[str]) -> None:
+        self.metrics = metrics
+        self.file = file
+
+    def handle_event(
+        self, context: ExecutionContext, event: events.ExecutionEvent
+    ) -> None:
+        if isinstance(event, events.Finished):
+            json.dump(self.metrics.to_dict(), self.file, indent=2)
+            self.file.close()
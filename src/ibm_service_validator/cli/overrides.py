@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+)
+
+import fnmatch
+import functools
+import re
+
+from requests.models import Response
+from schemathesis.hooks import HookContext
+from schemathesis.models import Case, Endpoint
+
+from ibm_service_validator.cli.process_config import (
+    COMPRESSION_CONFIG_NAME,
+    MAX_RESPONSE_SIZES_CONFIG_NAME,
+    OVERRIDES_CONFIG_NAME,
+    RESPONSE_TIME_BUDGETS_CONFIG_NAME,
+    checks_on,
+    config_count,
+    config_number,
+    is_off,
+    load_config,
+    warnings,
+)
+from ibm_service_validator.handbook_rules.add_case_rules.compression_supported import (
+    DEFAULT_COMPRESSION_THRESHOLD,
+    add_compression_supported,
+    add_compression_supported_hook,
+)
+from ibm_service_validator.handbook_rules.general_rules.response_size_rules import (
+    DEFAULT_MAX_RESPONSE_SIZE,
+    max_response_size,
+    max_response_size_check,
+)
+from ibm_service_validator.handbook_rules.general_rules.response_time_rules import (
+    DEFAULT_RESPONSE_TIME_BUDGET,
+    response_time_budget,
+    response_time_budget_check,
+)
+
+OFF: str = "off"
+WARN: str = "warn"
+ON: str = "on"
+
+
+def process_rule_config(
+    checks: Optional[List[str]],
+) -> Tuple[FrozenSet[str], FrozenSet[str], "RuleOverrides"]:
+    """Returns the rules to run, the rules that are warnings, and the overrides.
+
+    Rules given with --checks replace the config file, including its overrides.
+    """
+    if checks:
+        return frozenset(checks), frozenset(), RuleOverrides(frozenset(checks), [])
+
+    config = load_config()
+    budgets = config.get(RESPONSE_TIME_BUDGETS_CONFIG_NAME)
+    compression = config.get(COMPRESSION_CONFIG_NAME)
+    sizes = config.get(MAX_RESPONSE_SIZES_CONFIG_NAME)
+    overrides = RuleOverrides(
+        checks_on(config),
+        compile_overrides(config.get(OVERRIDES_CONFIG_NAME)),
+        (
+            config_number(
+                budgets,
+                RESPONSE_TIME_BUDGETS_CONFIG_NAME,
+                "default",
+                DEFAULT_RESPONSE_TIME_BUDGET,
+            )
+            if isinstance(budgets, dict)
+            else DEFAULT_RESPONSE_TIME_BUDGET
+        ),
+        (
+            config_count(
+                compression,
+                COMPRESSION_CONFIG_NAME,
+                "min_size",
+                DEFAULT_COMPRESSION_THRESHOLD,
+            )
+            if isinstance(compression, dict)
+            else DEFAULT_COMPRESSION_THRESHOLD
+        ),
+        (
+            config_count(
+                sizes,
+                MAX_RESPONSE_SIZES_CONFIG_NAME,
+                "default",
+                DEFAULT_MAX_RESPONSE_SIZE,
+            )
+            if isinstance(sizes, dict)
+            else DEFAULT_MAX_RESPONSE_SIZE
+        ),
+    )
+    return overrides.enabled_anywhere, warnings(config) | overrides.warnings, overrides
+
+
+class Override(NamedTuple):
+    """Rule levels for the operations matched by every selector that is set."""
+
+    operation_id: Optional[str]
+    path: Optional[Pattern[str]]
+    tag: Optional[str]
+    method: Optional[str]
+    rules: Dict[str, str]
+    # milliseconds
+    response_time_budget: Optional[float] = None
+    # bytes
+    max_response_size: Optional[int] = None
+
+    def matches(self, endpoint: Endpoint) -> bool:
+        definition = endpoint.definition.raw
+        return (
+            (
+                self.operation_id is None
+                or definition.get("operationId") == self.operation_id
+            )
+            and (self.path is None or self.path.match(endpoint.path) is not None)
+            and (self.tag is None or self.tag in definition.get("tags", ()))
+            and (self.method is None or endpoint.method.upper() == self.method)
+        )
+
+
+def compile_overrides(config: Any) -> List[Override]:
+    """Compiles the overrides section of the config.
+
+    Malformed entries are ignored, but invalid budgets are a usage error.
+    """
+    if not isinstance(config, list):
+        return []
+
+    overrides = []
+    for entry in config:
+        if not isinstance(entry, dict):
+            continue
+        rules = entry.get("rules", {})
+        budget = (
+            config_number(entry, OVERRIDES_CONFIG_NAME, "response_time_budget", 0)
+            if "response_time_budget" in entry
+            else None
+        )
+        size = (
+            config_count(entry, OVERRIDES_CONFIG_NAME, "max_response_size")
+            if "max_response_size" in entry
+            else None
+        )
+        if not isinstance(rules, dict) or not (
+            rules or budget is not None or size is not None
+        ):
+            continue
+        path = entry.get("path")
+        method = entry.get("method")
+        overrides.append(
+            Override(
+                operation_id=entry.get("operation_id"),
+                path=re.compile(fnmatch.translate(path)) if path else None,
+                tag=entry.get("tag"),
+                method=method.upper() if method else None,
+                rules={
+                    rule: OFF if is_off(level) else WARN if level == WARN else ON
+                    for rule, level in rules.items()
+                },
+                response_time_budget=budget,
+                max_response_size=size,
+            )
+        )
+    return overrides
+
+
+class RuleOverrides:
+    """Resolves which rules apply to an operation, and its response time and size budgets.
+
+    It also holds the compression threshold, the size in bytes above which responses
+    should be compressed.
+
+    Matching the overrides against an operation happens once. The result is cached by
+    method and path, so resolving the rules for each response is a dict lookup.
+    """
+
+    def __init__(
+        self,
+        on: FrozenSet[str],
+        overrides: List[Override],
+        default_budget: float = DEFAULT_RESPONSE_TIME_BUDGET,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        default_max_response_size: int = DEFAULT_MAX_RESPONSE_SIZE,
+    ) -> None:
+        self.on = on
+        self.overrides = overrides
+        self.default_budget = default_budget
+        self.compression_threshold = compression_threshold
+        self.default_max_response_size = default_max_response_size
+        self._resolved: Dict[Tuple[str, str], Tuple[FrozenSet[str], float, int]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.overrides)
+
+    @property
+    def enabled_anywhere(self) -> FrozenSet[str]:
+        """Rules that are on globally or for at least one override."""
+        return self.on.union(
+            rule
+            for override in self.overrides
+            for rule, level in override.rules.items()
+            if level != OFF
+        )
+
+    @property
+    def warnings(self) -> FrozenSet[str]:
+        """Rules that are off globally and only turned on as warnings by overrides."""
+        levels: Dict[str, set] = {}
+        for override in self.overrides:
+            for rule, level in override.rules.items():
+                if rule not in self.on and level != OFF:
+                    levels.setdefault(rule, set()).add(level)
+        return frozenset(rule for rule, level in levels.items() if level == {WARN})
+
+    def rules_for(self, endpoint: Endpoint) -> FrozenSet[str]:
+        return self._resolve(endpoint)[0]
+
+    def response_time_budget(self, endpoint: Endpoint) -> float:
+        return self._resolve(endpoint)[1]
+
+    def max_response_size(self, endpoint: Endpoint) -> int:
+        return self._resolve(endpoint)[2]
+
+    @property
+    def download_cap(self) -> int:
+        """The largest response size budget of any operation."""
+        return max(
+            [
+                self.default_max_response_size,
+                *(
+                    override.max_response_size
+                    for override in self.overrides
+                    if override.max_response_size is not None
+                ),
+            ]
+        )
+
+    def _resolve(self, endpoint: Endpoint) -> Tuple[FrozenSet[str], float, int]:
+        key = (endpoint.method, endpoint.path)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            enabled = set(self.on)
+            budget = self.default_budget
+            size = self.default_max_response_size
+            # later overrides take precedence over earlier ones
+            for override in self.overrides:
+                if override.matches(endpoint):
+                    for rule, level in override.rules.items():
+                        if level == OFF:
+                            enabled.discard(rule)
+                        else:
+                            enabled.add(rule)
+                    if override.response_time_budget is not None:
+                        budget = override.response_time_budget
+                    if override.max_response_size is not None:
+                        size = override.max_response_size
+            resolved = self._resolved[key] = (frozenset(enabled), budget, size)
+        return resolved
+
+    def apply(
+        self, check: Callable[[Response, Case], Optional[bool]]
+    ) -> Callable[[Response, Case], Optional[bool]]:
+        """Configures a check with the budgets and scopes it to its operations."""
+        if check is response_time_budget:
+            check = response_time_budget_check(self.response_time_budget)
+        elif check is max_response_size:
+            check = max_response_size_check(self.max_response_size)
+        if self.overrides:
+            check = self.scope_check(check)
+        return check
+
+    def apply_add_case(self, hook: Callable, rule: str) -> Callable:
+        """Configures an add_case hook with the thresholds and scopes it to its operations."""
+        if hook is add_compression_supported:
+            hook = add_compression_supported_hook(self.compression_threshold)
+        if self.overrides:
+            hook = self.scope_add_case(hook, rule)
+        return hook
+
+    def scope_check(
+        self, check: Callable[[Response, Case], Optional[bool]]
+    ) -> Callable[[Response, Case], Optional[bool]]:
+        """Wraps a check so it only runs for operations it is enabled for."""
+
+        @functools.wraps(check)
+        def scoped_check(response: Response, case: Case) -> Optional[bool]:
+            if check.__name__ not in self.rules_for(case.endpoint):
+                # skips the test when it's not relevant
+                return True
+            return check(response, case)
+
+        return scoped_check
+
+    def scope_add_case(self, hook: Callable, rule: str) -> Callable:
+        """Wraps an add_case hook so its request is only sent when its rule is enabled."""
+
+        @functools.wraps(hook)
+        def scoped_hook(
+            context: HookContext, case: Case, response: Response
+        ) -> Optional[Case]:
+            if rule not in self.rules_for(case.endpoint):
+                return None
+            return hook(context, case, response)
+
+        return scoped_hook
@@ -17,22 +17,44 @@ from typing import Any, Callable, Dict, FrozenSet, IO, Iterable, Tuple
 
 import os
 import json
+import math
+
+import click
 import yaml
 
 CONFIG_FILE_NAME: str = "ibm-service-validator-config"
 HANDBOOK_CONFIG_NAME: str = "ibm_cloud_api_handbook"
 SCHEMATHESIS_CONFIG_NAME: str = "schemathesis_checks"
+OVERRIDES_CONFIG_NAME: str = "overrides"
+RESPONSE_TIME_BUDGETS_CONFIG_NAME: str = "response_time_budgets"
+MAX_RESPONSE_SIZES_CONFIG_NAME: str = "max_response_sizes"
+BASELINE_CONFIG_NAME: str = "baseline_thresholds"
+COMPRESSION_CONFIG_NAME: str = "compression"
+ARRAY_SAMPLING_CONFIG_NAME: str = "array_sampling"
+FAILURE_BUDGET_CONFIG_NAME: str = "failure_budget"
+ADAPTIVE_DEADLINE_CONFIG_NAME: str = "adaptive_deadline"
 DEFAULT_CONFIG: Dict[str, Dict[str, str]] = {
     HANDBOOK_CONFIG_NAME: {
         "allow_header_in_405": "on",
+        "cache_headers": "warn",
+        "compression_supported": "warn",
+        "conditional_get": "on",
         "content_location": "warn",
         "get_with_request_body": "on",
+        "head_support": "on",
         "invalid_accept_header": "on",
         "invalid_request_content_type": "on",
+        "latency_regression": "on",
         "location_201": "on",
+        "max_response_size": "on",
         "no_422": "on",
         "no_accept_header": "on",
         "no_content_204": "on",
+        "pagination": "warn",
+        "rate_limit_headers": "off",
+        "response_time_budget": "warn",
+        "retry_after": "on",
+        "size_regression": "warn",
         "www_authenticate_401": "on",
     },
     SCHEMATHESIS_CONFIG_NAME: {
@@ -45,12 +67,17 @@ DEFAULT_CONFIG: Dict[str, Dict[str, str]] = {
 
 
 def process_config() -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    config = load_config()
+    return checks_on(config), warnings(config)
+
+
+def load_config() -> Dict[str, Any]:
     config = load_config_file_as_dict(os.getcwd())
 
     if not config:
         config = DEFAULT_CONFIG
 
-    return checks_on(config), warnings(config)
+    return config
 
 
 def load_config_file_as_dict(dir: str) -> Dict[str, Any]:
@@ -75,13 +102,14 @@ def load_config_file_as_dict(dir: str) -> Dict[str, Any]:
 def checks_on(config: Dict[str, Any]) -> FrozenSet[str]:
     """Returns all checks that are not off.
 
+    Rules missing from the config are on, unless they are off by default.
     Note: warnings are included because we still want to run the warning checks.
     """
-    # YAML treats unquoted off as implicit boolean. Hence, we check "not x".
-    is_off = lambda x: x == "off" or not x
     not_on = {
         *_get_checks(config.get(HANDBOOK_CONFIG_NAME), is_off),
         *_get_checks(config.get(SCHEMATHESIS_CONFIG_NAME), is_off),
+        *_off_by_default(config, HANDBOOK_CONFIG_NAME),
+        *_off_by_default(config, SCHEMATHESIS_CONFIG_NAME),
     }
     return frozenset(
         {
@@ -99,18 +127,80 @@ def checks_on(config: Dict[str, Any]) -> FrozenSet[str]:
     )
 
 
+def is_off(value: Any) -> bool:
+    # YAML treats unquoted off as implicit boolean. Hence, we check "not value".
+    return value == "off" or not value
+
+
 def warnings(config: Dict[str, Any]) -> FrozenSet[str]:
-    """Returns set of all warnings."""
+    """Returns set of all warnings.
+
+    Rules missing from the config are warnings when they are warnings by default.
+    """
 
-    is_warning = lambda x: x == "warn"
     return frozenset(
         {
             *_get_checks(config.get(HANDBOOK_CONFIG_NAME), is_warning),
             *_get_checks(config.get(SCHEMATHESIS_CONFIG_NAME), is_warning),
+            *_warn_by_default(config, HANDBOOK_CONFIG_NAME),
+            *_warn_by_default(config, SCHEMATHESIS_CONFIG_NAME),
         }
     )
 
 
+def is_warning(value: Any) -> bool:
+    return value == "warn"
+
+
+def _off_by_default(config: Dict[str, Any], section: str) -> Iterable[str]:
+    return (rule for rule, val in _missing_defaults(config, section) if is_off(val))
+
+
+def _warn_by_default(config: Dict[str, Any], section: str) -> Iterable[str]:
+    return (rule for rule, val in _missing_defaults(config, section) if is_warning(val))
+
+
+def _missing_defaults(config: Dict[str, Any], section: str) -> Iterable[Tuple[str, str]]:
+    """Returns the default values of the rules missing from a section of the config."""
+    configured = config.get(section)
+    if not isinstance(configured, dict):
+        configured = {}
+    return (
+        (rule, val)
+        for rule, val in DEFAULT_CONFIG[section].items()
+        if rule not in configured
+    )
+
+
+def config_count(
+    config: Dict[str, Any], section: str, name: str, default: int = 0
+) -> int:
+    """Returns a non-negative integer of a config section, or default when it is missing."""
+    value = config.get(name, default)
+    # bool is a subclass of int, but true is not a count
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise click.UsageError(
+            f"{name} in the {section} section of the config file must be a non-negative integer, not {value!r}."
+        )
+    return value
+
+
+def config_number(
+    config: Dict[str, Any], section: str, name: str, default: float
+) -> float:
+    """Returns a positive number of a config section, or default when it is missing."""
+    value = config.get(name, default)
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, (int, float))
+        or not 0 < value < math.inf
+    ):
+        raise click.UsageError(
+            f"{name} in the {section} section of the config file must be a positive number, not {value!r}."
+        )
+    return float(value)
+
+
 def _get_checks(config: Any, condition: Callable[[Any], bool]) -> Iterable[str]:
     if not config or not isinstance(config, dict):
         return ()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import threading
+import zlib
+from random import Random
+
+import jsonschema
+from jsonschema.exceptions import best_match
+from requests import Response
+from schemathesis.exceptions import get_schema_validation_error
+from schemathesis.models import Case
+from schemathesis.specs.openapi.checks import in_scopes
+from schemathesis.specs.openapi.schemas import BaseOpenAPISchema
+from schemathesis.utils import parse_content_type
+
+from ibm_service_validator.cli.process_config import (
+    ARRAY_SAMPLING_CONFIG_NAME,
+    config_count,
+    load_config,
+)
+from ibm_service_validator.handbook_rules.markers import cpu_bound
+from ibm_service_validator.handbook_rules.parsed_response import parse_response
+
+# method, path, status code of the response definition, media type
+ValidatorKey = Tuple[str, str, str, str]
+CompiledSchema = Tuple[List[str], Optional[Dict[str, Any]]]
+ITEMS = jsonschema.Draft4Validator.VALIDATORS["items"]
+
+
+class ArraySample(NamedTuple):
+    """The items of a large array that are validated against the item schema."""
+
+    first: int = 0
+    last: int = 0
+    random: int = 0
+
+    @property
+    def size(self) -> int:
+        return self.first + self.last + self.random
+
+    def indices(self, length: int, rng: Random) -> List[int]:
+        """Returns the first and last items, and random ones in between, drawn from rng."""
+        if length <= self.size:
+            return list(range(length))
+        middle = rng.sample(range(self.first, length - self.last), self.random)
+        return [
+            *range(self.first),
+            *sorted(middle),
+            *range(length - self.last, length),
+        ]
+
+
+def load_array_sampling() -> Optional[ArraySample]:
+    """Returns the sample of the array_sampling config, or None to validate every item."""
+    config = load_config().get(ARRAY_SAMPLING_CONFIG_NAME)
+    if not isinstance(config, dict):
+        return None
+    sample = ArraySample(
+        **{
+            field: config_count(config, ARRAY_SAMPLING_CONFIG_NAME, field)
+            for field in ArraySample._fields
+        }
+    )
+    if not sample.size:
+        return None
+    return sample
+
+
+class ResponseValidators:
+    """Compiles the response schemas of an API definition once and reuses them.
+
+    A response schema is resolved, converted to JSON Schema and checked the first time a
+    response of its operation, status code and media type is validated. The compiled
+    schemas are plain data, so they can be pickled for worker processes and kept by the
+    schema cache for later runs.
+
+    With a sample, only some of the items of larger arrays are validated against their
+    item schema. The other keywords, such as maxItems, still see the whole array. The
+    random items are seeded with the response body, so arrays of the same length do not
+    skip the same items, and a run can be reproduced.
+
+    A resolver keeps a stack of scopes, so each thread validates with its own resolver
+    of the current run's API definition, and its own validators bound to it. Only the
+    lookup of compiled schemas is shared between threads.
+    """
+
+    def __init__(
+        self,
+        schemas: Optional[Dict[ValidatorKey, CompiledSchema]] = None,
+        sampling: Optional[ArraySample] = None,
+    ) -> None:
+        # the scopes to resolve the remaining references in, and the schema
+        self.schemas: Dict[ValidatorKey, CompiledSchema] = (
+            {} if schemas is None else schemas
+        )
+        self.sampling = sampling
+        self.arrays_sampled = 0
+        self.items_validated = 0
+        self.items_skipped = 0
+        self._lock = threading.Lock()
+        # the resolver, validators and random generator of each thread
+        self._local = threading.local()
+        self._validator_class = (
+            jsonschema.Draft4Validator
+            if sampling is None
+            else jsonschema.validators.extend(
+                jsonschema.Draft4Validator, {"items": self._sampled_items}
+            )
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # other threads may compile schemas while the validators are pickled
+        with self._lock:
+            schemas = dict(self.schemas)
+        return {"schemas": schemas, "sampling": self.sampling}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore
+
+    def add_sampled(self, arrays: int, validated: int, skipped: int) -> None:
+        """Adds the array sampling counts of validations done elsewhere, e.g. in a worker."""
+        with self._lock:
+            self.arrays_sampled += arrays
+            self.items_validated += validated
+            self.items_skipped += skipped
+
+    def with_sampling(self, sampling: Optional[ArraySample]) -> "ResponseValidators":
+        """Returns validators for a new run that share the compiled schemas."""
+        return ResponseValidators(self.schemas, sampling)
+
+    @cpu_bound
+    def response_schema_conformance(self, response: Response, case: Case) -> None:
+        """Schemathesis's response_schema_conformance, with compiled schemas."""
+        if not isinstance(case.endpoint.schema, BaseOpenAPISchema):
+            raise TypeError("This check can be used only with Open API schemas")
+        if response.request is not None and response.request.method == "HEAD":
+            # a HEAD response has the headers of GET, but no body to validate
+            return None
+        content_type = parse_response(response).headers.get("Content-Type")
+        if not content_type or not content_type.startswith("application/json"):
+            return None
+        responses = {
+            str(key): value
+            for key, value in case.endpoint.definition.raw.get("responses", {}).items()
+        }
+        status_code = str(response.status_code)
+        if status_code not in responses:
+            if "default" not in responses:
+                # no response defined for the received status code
+                return None
+            status_code = "default"
+        main, sub = parse_content_type(content_type)
+        key = (case.endpoint.method, case.endpoint.path, status_code, f"{main}/{sub}")
+        with self._lock:
+            compiled = self.schemas.get(key)
+            if compiled is None:
+                compiled = self.schemas[key] = compile_schema(
+                    case, responses[status_code], key[3]
+                )
+        scopes, schema = compiled
+        if not schema:
+            return None
+        data = response.json()
+        local = self._thread_local(case.endpoint.schema)
+        validator = local.validators.get(key)
+        if validator is None:
+            validator = local.validators[key] = self._validator_class(
+                schema, resolver=local.resolver
+            )
+        local.random.seed(zlib.crc32(parse_response(response).content))
+        with in_scopes(local.resolver, scopes):
+            error = best_match(validator.iter_errors(data))
+        if error is not None:
+            exc_class = get_schema_validation_error(error)
+            raise exc_class(
+                f"The received response does not conform to the defined schema!\n\nDetails: \n\n{error}"
+            ) from error
+        return None
+
+    def _thread_local(self, api_schema: BaseOpenAPISchema) -> threading.local:
+        """Returns the state of this thread, bound to the API definition of the run."""
+        local = self._local
+        if getattr(local, "api_schema", None) is not api_schema:
+            resolver = api_schema.resolver
+            local.api_schema = api_schema
+            # the same arguments as the resolver of the API definition, and its documents
+            local.resolver = type(resolver)(
+                api_schema.location or "",
+                api_schema.raw_schema,
+                store=resolver.store,
+                nullable_name=api_schema.nullable_name,
+            )
+            local.validators = {}
+            local.random = Random()
+        return local
+
+    def _sampled_items(
+        self,
+        validator: jsonschema.Draft4Validator,
+        items: Any,
+        instance: Any,
+        schema: Dict[str, Any],
+    ) -> Iterator[jsonschema.ValidationError]:
+        if (
+            self.sampling is None
+            or not validator.is_type(instance, "array")
+            or not validator.is_type(items, "object")
+            or len(instance) <= self.sampling.size
+        ):
+            yield from ITEMS(validator, items, instance, schema)
+            return
+        indices = self.sampling.indices(len(instance), self._local.random)
+        self.add_sampled(1, len(indices), len(instance) - len(indices))
+        for index in indices:
+            yield from validator.descend(instance[index], items, path=index)
+
+
+def compile_schema(
+    case: Case, definition: Dict[str, Any], media_type: str
+) -> CompiledSchema:
+    """Resolves and converts the schema of a response definition, then checks it."""
+    content = definition.get("content")
+    if isinstance(content, dict) and media_type in content:
+        # Schemathesis takes the first media type, the one received is more precise
+        definition = {**definition, "content": {media_type: content[media_type]}}
+    scopes, schema = case.endpoint.schema.get_response_schema(
+        definition, case.endpoint.definition.scope
+    )
+    if schema:
+        jsonschema.Draft4Validator.check_schema(schema)
+    return scopes, schema
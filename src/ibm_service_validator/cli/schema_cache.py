@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, Dict, Tuple, Union
+
+import copy
+import functools
+import os
+import pathlib
+
+import yaml
+from schemathesis import loaders
+from schemathesis.utils import StringDatesYAMLLoader
+
+from ibm_service_validator.cli.response_validators import ResponseValidators
+
+
+class SchemaCache:
+    """Keeps parsed API definitions in memory between runs in the same process.
+
+    Entries are keyed by absolute path and invalidated when the file's mtime changes.
+    The compiled response schemas of each file are kept alongside it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._validators: Dict[str, Tuple[float, ResponseValidators]] = {}
+
+    def load(self, schema: str) -> Tuple[Union[str, Dict[str, Any]], Callable]:
+        """Returns the schema and the loader to pass to the Schemathesis runner.
+
+        Schemas that are not local files are returned unchanged with the default loader.
+        """
+        if not os.path.isfile(schema):
+            return schema, loaders.from_path
+
+        path = os.path.abspath(schema)
+        mtime = os.path.getmtime(path)
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != mtime:
+            with open(path) as f:
+                entry = (mtime, yaml.load(f, StringDatesYAMLLoader))
+            self._entries[path] = entry
+
+        # the location lets Schemathesis resolve relative references to other files
+        location = pathlib.Path(path).as_uri()
+        # Schemathesis may mutate the raw schema, so every run gets its own copy
+        return (
+            copy.deepcopy(entry[1]),
+            functools.partial(loaders.from_dict, location=location),
+        )
+
+    def validators(self, schema: str) -> ResponseValidators:
+        """Returns the compiled response schemas of a file, for as long as it is unchanged.
+
+        Schemas that are not local files get new, empty validators.
+        """
+        if not os.path.isfile(schema):
+            return ResponseValidators()
+
+        path = os.path.abspath(schema)
+        mtime = os.path.getmtime(path)
+        entry = self._validators.get(path)
+        if entry is None or entry[0] != mtime:
+            entry = self._validators[path] = (mtime, ResponseValidators())
+        return entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._validators.clear()
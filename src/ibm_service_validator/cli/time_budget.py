@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import re
+import time
+
+import attr
+import click
+import hypothesis
+from requests import Response
+from schemathesis._hypothesis import make_test_or_exception
+from schemathesis.exceptions import InvalidSchema
+from schemathesis.models import Case, Endpoint, Status
+from schemathesis.runner import events
+from schemathesis.schemas import BaseSchema
+
+from ibm_service_validator.cli.incremental import operation_key
+
+DURATION: re.Pattern = re.compile(r"^(\d+(?:\.\d+)?)([smh]?)$")
+SECONDS_PER_UNIT: Dict[str, int] = {"": 1, "s": 1, "m": 60, "h": 3600}
+# examples for an operation while no response has been timed yet
+UNMEASURED_EXAMPLES: int = 10
+
+Test = Union[Callable, InvalidSchema]
+
+
+def parse_duration(
+    ctx: click.Context, param: click.Parameter, value: Optional[str]
+) -> Optional[float]:
+    """Converts a duration such as 300, 300s, 5m or 1h to seconds."""
+    if value is None:
+        return None
+    match = DURATION.match(value.strip())
+    if match is None or not float(match.group(1)):
+        raise click.BadParameter(
+            "Should be a positive number of seconds, e.g. 300s or 5m."
+        )
+    return float(match.group(1)) * SECONDS_PER_UNIT[match.group(2)]
+
+
+class TimeBudget:
+    """Fits a run into a time budget by choosing how many examples each operation gets.
+
+    Operations are tested twice. The first pass runs the explicit examples of every
+    operation. The second pass splits the time left between the operations for the
+    other phases: operations that failed in the first pass, or had no explicit examples
+    to check, come first and get twice the share. An operation gets as many examples as
+    its share fits, at the time per response measured so far, up to max_examples.
+
+    Once the time is spent, no more operations are started, so the run ends with a full
+    summary. An operation that is being tested at the deadline finishes its examples.
+    The operations that got fewer examples are kept in ``reduced``, unless the run ends
+    with time left, as then the shares were cut by the estimate rather than the budget.
+
+    Tests are created just before they run, so this only works with a single worker.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.deadline: Optional[float] = None
+        # whether operations are tested in two passes, whose results are merged
+        self.two_passes = False
+        # operation key -> what it got instead of max_examples
+        self.reduced: Dict[str, str] = {}
+        # operations to generate examples for first
+        self.prioritized: Set[str] = set()
+        # time spent in tests that received responses, and the responses received
+        self.spent = 0.0
+        self.responses = 0
+
+    def loader(self, loader: Callable[..., BaseSchema]) -> Callable[..., BaseSchema]:
+        """Wraps a schema loader so the runner takes its tests from this budget."""
+
+        def load(*args: Any, **kwargs: Any) -> BaseSchema:
+            schema = loader(*args, **kwargs)
+            get_all_endpoints = schema.get_all_endpoints
+
+            def get_all_tests(
+                func: Callable,
+                settings: Optional[hypothesis.settings] = None,
+                seed: Optional[int] = None,
+            ) -> Generator[Tuple[Endpoint, Test], None, None]:
+                yield from self.tests(
+                    get_all_endpoints(), func, settings or hypothesis.settings(), seed
+                )
+
+            schema.get_all_tests = get_all_tests  # type: ignore
+            return schema
+
+        return load
+
+    def count_response(self, response: Response, case: Case) -> Optional[bool]:
+        self.responses += 1
+        return True
+
+    def remaining(self) -> float:
+        if self.deadline is None:
+            self.deadline = time.monotonic() + self.seconds
+        return self.deadline - time.monotonic()
+
+    def tests(
+        self,
+        endpoints: Iterable[Endpoint],
+        func: Callable,
+        settings: hypothesis.settings,
+        seed: Optional[int],
+    ) -> Generator[Tuple[Endpoint, Test], None, None]:
+        """Yields the tests of both passes.
+
+        The runner runs each test before it takes the next one.
+        """
+        endpoints = list(endpoints)
+        self.remaining()
+        explicit_phase = hypothesis.Phase.explicit
+        phases = [phase for phase in settings.phases if phase != explicit_phase]
+        self.two_passes = bool(phases) and explicit_phase in settings.phases
+
+        tested = endpoints
+        if explicit_phase in settings.phases:
+            explicit = hypothesis.settings(settings, phases=[explicit_phase])
+            tested = []
+            for endpoint in endpoints:
+                if self.remaining() <= 0:
+                    break
+                tested.append(endpoint)
+                test = make_test_or_exception(endpoint, func, explicit, seed)
+                yield from self.timed(endpoint, test)
+        for endpoint in endpoints[len(tested) :]:
+            self.reduced[key_of(endpoint)] = "not tested"
+        if not phases:
+            return
+
+        tested.sort(key=lambda endpoint: key_of(endpoint) not in self.prioritized)
+        # operation key -> examples generated, for operations that got fewer examples
+        cut: Dict[str, str] = {}
+        for index, endpoint in enumerate(tested):
+            remaining = self.remaining()
+            if remaining <= 0:
+                self.reduced.update(cut)
+                for skipped in tested[index:]:
+                    self.reduced[key_of(skipped)] = "no examples generated"
+                return
+            weights = [self.weight(other) for other in tested[index:]]
+            share = remaining * weights[0] / sum(weights)
+            examples = (
+                max(int(share * self.responses / self.spent), 1)
+                if self.responses and self.spent
+                else UNMEASURED_EXAMPLES
+            )
+            examples = min(examples, settings.max_examples)
+            generate = hypothesis.settings(settings, phases=phases, max_examples=examples)
+            test = make_test_or_exception(endpoint, func, generate, seed)
+            responses = self.responses
+            yield from self.timed(endpoint, test)
+            # Hypothesis stops early once it runs out of inputs or finds a failure
+            received = self.responses - responses
+            if examples < settings.max_examples and received >= examples:
+                cut[key_of(endpoint)] = (
+                    f"{examples} of {settings.max_examples} examples generated"
+                )
+        if self.remaining() <= 0:
+            self.reduced.update(cut)
+
+    def timed(
+        self, endpoint: Endpoint, test: Test
+    ) -> Generator[Tuple[Endpoint, Test], None, None]:
+        started = time.monotonic()
+        responses = self.responses
+        yield endpoint, test
+        # a test without responses, e.g. one without explicit examples, says nothing
+        # about the time a response takes
+        if self.responses > responses:
+            self.spent += time.monotonic() - started
+
+    def weight(self, endpoint: Endpoint) -> int:
+        return 2 if key_of(endpoint) in self.prioritized else 1
+
+    def record_first_pass(self, event: events.AfterExecution) -> None:
+        """Prioritizes an operation that failed or had nothing to check in pass one."""
+        if event.status != Status.success or not event.result.checks:
+            self.prioritized.add(operation_key(event.method, event.path))
+
+
+def key_of(endpoint: Endpoint) -> str:
+    return operation_key(endpoint.method, endpoint.full_path)
+
+
+def merge_passes(
+    run: Generator[events.ExecutionEvent, None, None], budget: TimeBudget
+) -> Generator[events.ExecutionEvent, None, None]:
+    """Yields one result for each operation, merging the results of both passes.
+
+    The events of the first pass are held until the operation's second pass finishes.
+    Operations without a second pass are yielded before the Finished event, whose counts
+    are made to count operations rather than passes.
+    """
+    held: Dict[str, Tuple[events.BeforeExecution, events.AfterExecution]] = {}
+    started: Dict[str, events.BeforeExecution] = {}
+    statuses: List[Status] = []
+    try:
+        for event in run:
+            if not budget.two_passes:
+                yield event
+                continue
+            if isinstance(event, events.BeforeExecution):
+                started.setdefault(operation_key(event.method, event.path), event)
+            elif isinstance(event, events.AfterExecution):
+                key = operation_key(event.method, event.path)
+                before = started.pop(key)
+                if key not in held:
+                    budget.record_first_pass(event)
+                    held[key] = (before, event)
+                    continue
+                first_before, first = held.pop(key)
+                merged = merge(first, event)
+                statuses.append(merged.status)
+                yield first_before
+                yield merged
+            else:
+                if isinstance(event, (events.Finished, events.Interrupted)):
+                    for before, after in held.values():
+                        statuses.append(after.status)
+                        yield before
+                        yield after
+                    held.clear()
+                if isinstance(event, events.Finished):
+                    event.passed_count = statuses.count(Status.success)
+                    event.failed_count = statuses.count(Status.failure)
+                    event.errored_count = statuses.count(Status.error)
+                yield event
+    finally:
+        run.close()
+
+
+def merge(
+    first: events.AfterExecution, second: events.AfterExecution
+) -> events.AfterExecution:
+    """Combines the results of an operation's two passes."""
+    return attr.evolve(
+        second,
+        status=max(first.status, second.status),
+        elapsed_time=first.elapsed_time + second.elapsed_time,
+        hypothesis_output=first.hypothesis_output + second.hypothesis_output,
+        result=attr.evolve(
+            second.result,
+            has_failures=first.result.has_failures or second.result.has_failures,
+            has_errors=first.result.has_errors or second.result.has_errors,
+            has_logs=first.result.has_logs or second.result.has_logs,
+            is_errored=first.result.is_errored or second.result.is_errored,
+            seed=second.result.seed or first.result.seed,
+            checks=first.result.checks + second.result.checks,
+            logs=first.result.logs + second.result.logs,
+            errors=first.result.errors + second.result.errors,
+            interactions=first.result.interactions + second.result.interactions,
+        ),
+    )
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, Dict, Generator, Iterable, List, Tuple
+
+from schemathesis.models import Endpoint
+from schemathesis.runner import events
+from schemathesis.schemas import BaseSchema
+
+MAX_WORKERS: int = 64
+
+# method, path
+Operation = Tuple[str, str]
+
+
+def recording_loader(
+    loader: Callable[..., BaseSchema], order: List[Operation]
+) -> Callable[..., BaseSchema]:
+    """Wraps a schema loader so the order the runner takes the endpoints in is recorded."""
+
+    def load(*args: Any, **kwargs: Any) -> BaseSchema:
+        schema = loader(*args, **kwargs)
+        get_all_endpoints = schema.get_all_endpoints
+
+        def get_recorded_endpoints() -> Iterable[Endpoint]:
+            for endpoint in get_all_endpoints():
+                order.append((endpoint.method, endpoint.full_path))
+                yield endpoint
+
+        schema.get_all_endpoints = get_recorded_endpoints  # type: ignore
+        return schema
+
+    return load
+
+
+def in_operation_order(
+    run: Generator[events.ExecutionEvent, None, None], order: List[Operation]
+) -> Generator[events.ExecutionEvent, None, None]:
+    """Yields the events of a threaded run as if the operations were tested one by one.
+
+    Worker threads test several operations at once, so their events interleave. The
+    events of an operation are held until it finishes and every operation before it in
+    ``order`` has been yielded, so the output reads like the output of a serial run.
+    """
+    started: Dict[Operation, events.BeforeExecution] = {}
+    finished: Dict[Operation, Tuple[events.ExecutionEvent, ...]] = {}
+    position = 0
+    try:
+        for event in run:
+            if isinstance(event, events.BeforeExecution):
+                started[(event.method, event.path)] = event
+            elif isinstance(event, events.AfterExecution):
+                operation = (event.method, event.path)
+                finished[operation] = (started.pop(operation), event)
+                while position < len(order) and order[position] in finished:
+                    yield from finished.pop(order[position])
+                    position += 1
+            else:
+                if isinstance(event, (events.Finished, events.Interrupted)):
+                    # operations that were not recorded, or that ended the run early
+                    for operation_events in finished.values():
+                        yield from operation_events
+                    finished.clear()
+                yield event
+    finally:
+        run.close()
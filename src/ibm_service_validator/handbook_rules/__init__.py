@@ -14,28 +14,47 @@
 # limitations under the License.
 
 from ibm_service_validator.handbook_rules.add_case_rules import (
+    compression_supported,
+    conditional_get,
     get_with_request_body,
+    head_support,
     invalid_accept_header,
     invalid_request_content_type,
+    pagination,
 )
 from ibm_service_validator.handbook_rules.general_rules import header_rules
+from ibm_service_validator.handbook_rules.general_rules import response_size_rules
+from ibm_service_validator.handbook_rules.general_rules import response_time_rules
 from ibm_service_validator.handbook_rules.general_rules import status_code_rules
 
 HANDBOOK_RULES: tuple = (
+    compression_supported.compression_supported,
+    conditional_get.conditional_get,
     get_with_request_body.get_with_request_body,
+    head_support.head_support,
     invalid_accept_header.invalid_accept_header,
     invalid_request_content_type.invalid_request_content_type,
+    pagination.pagination,
     header_rules.allow_header_in_405,
+    header_rules.cache_headers,
     header_rules.content_location,
     header_rules.location_201,
     header_rules.no_accept_header,
+    header_rules.rate_limit_headers,
+    header_rules.retry_after,
     header_rules.www_authenticate_401,
     status_code_rules.no_422,
     status_code_rules.no_content_204,
+    response_time_rules.response_time_budget,
+    response_size_rules.max_response_size,
 )
 
 ADD_CASE_HOOKS: tuple = (
+    compression_supported.add_compression_supported,
+    conditional_get.add_conditional_get,
     get_with_request_body.add_get_with_request_body,
+    head_support.add_head_support,
     invalid_accept_header.add_invalid_accept_header,
     invalid_request_content_type.add_invalid_request_content_type,
+    pagination.add_pagination,
 )
@@ -13,11 +13,73 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any, Callable, Optional, Tuple
+
+import functools
+
+import attr
 from requests import PreparedRequest, Response
 
 from schemathesis.models import Case
 
 
+@attr.s(slots=True, repr=False)
+class Probe(Case):
+    """A request an add_case rule sends to the operation of the example, after its own.
+
+    ``original`` holds what the check of the rule compares the response with. The
+    request is sent with ``request_method`` instead of the operation's method. The
+    check of the rule judges the status codes in ``handled_status_codes``, which the
+    API definition does not need to document.
+    """
+
+    rule: str = attr.ib(default="")
+    original: Any = attr.ib(default=None)
+    request_method: Optional[str] = attr.ib(default=None)
+    handled_status_codes: Tuple[int, ...] = attr.ib(default=())
+
+    @property
+    def method(self) -> str:
+        return self.request_method or self.endpoint.method
+
+
+def probe(
+    case: Case,
+    rule: str,
+    original: Any = None,
+    request_method: Optional[str] = None,
+    handled_status_codes: Tuple[int, ...] = (),
+) -> Probe:
+    """Marks the case an add_case hook returns as a probe of rule."""
+    return Probe(
+        **{field.name: getattr(case, field.name) for field in attr.fields(Case)},
+        rule=rule,
+        original=original,
+        request_method=request_method,
+        handled_status_codes=handled_status_codes,
+    )
+
+
+def is_probe(case: Case, rule: Optional[str] = None) -> bool:
+    """Returns whether case is a probe, of rule if given, rather than the example's own."""
+    return isinstance(case, Probe) and (rule is None or case.rule == rule)
+
+
+def unless_handled_by_probe(
+    check: Callable[[Response, Case], Optional[bool]],
+) -> Callable[[Response, Case], Optional[bool]]:
+    """Wraps a check so it skips the responses the check of a probe's rule judges."""
+
+    @functools.wraps(check)
+    def wrapper(response: Response, case: Case) -> Optional[bool]:
+        if isinstance(case, Probe) and response.status_code in case.handled_status_codes:
+            # skips the test when it's not relevant
+            return True
+        return check(response, case)
+
+    return wrapper
+
+
 def get_request_header(request: PreparedRequest, header_name: str) -> str:
     return (
         request.headers[header_name]
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Callable, Optional
+import hashlib
+
+from requests import Response
+
+from schemathesis.models import Case
+from schemathesis.hooks import HookContext
+
+from ibm_service_validator.handbook_rules.parsed_response import parse_response
+
+from . import (
+    get_request_header,
+    is_probe,
+    original_case_successful,
+    probe,
+    set_request_header,
+)
+
+# bytes
+DEFAULT_COMPRESSION_THRESHOLD: int = 1024
+# an explicit value, since requests sends "gzip, deflate" by default
+PROBE_ACCEPT_ENCODING: str = "gzip"
+
+
+def add_compression_supported_hook(
+    threshold: int,
+) -> Callable[[HookContext, Case, Response], Optional[Case]]:
+    """Returns the add_case hook for responses larger than threshold bytes."""
+
+    def hook(context: HookContext, case: Case, response: Response) -> Optional[Case]:
+        parsed = parse_response(response)
+        if (
+            original_case_successful(response)
+            and len(parsed.content) > threshold
+            and not parsed.headers.get("Content-Encoding")
+            and get_request_header(response.request, "Accept-Encoding")
+            != PROBE_ACCEPT_ENCODING
+        ):
+            set_request_header(case, "Accept-Encoding", PROBE_ACCEPT_ENCODING)
+            # the probe carries the digest of the original body
+            return probe(case, "compression_supported", digest(parsed.content))
+        else:
+            return None
+
+    # the rule of an add_case hook is taken from its name
+    hook.__name__ = "add_compression_supported"
+    return hook
+
+
+add_compression_supported = add_compression_supported_hook(DEFAULT_COMPRESSION_THRESHOLD)
+
+
+def compression_supported(response: Response, case: Case) -> Optional[bool]:
+    if is_probe(case, "compression_supported") and original_case_successful(response):
+        parsed = parse_response(response)
+        assert (
+            parsed.headers.get("Content-Encoding", "").lower() == "gzip"
+        ), "Large response should be compressed when the request accepts gzip encoding. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers"
+        # requests has already decoded the body
+        assert (
+            digest(parsed.content) == case.original
+        ), "Decoded gzip response body does not match the uncompressed response body."
+    else:
+        # skips the check when it's not relevant
+        return True
+    return None
+
+
+def digest(content: Optional[bytes]) -> str:
+    return hashlib.sha256(content or b"").hexdigest()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+from requests import Response
+
+from schemathesis.models import Case
+from schemathesis.hooks import HookContext
+
+from ibm_service_validator.handbook_rules.parsed_response import parse_response
+
+from . import get_request_header, original_case_successful, probe, set_request_header
+
+
+def add_conditional_get(
+    context: HookContext, case: Case, response: Response
+) -> Optional[Case]:
+    headers = parse_response(response).headers
+    if (
+        case.method.upper() == "GET"
+        and original_case_successful(response)
+        and "ETag" in headers
+        and not get_request_header(response.request, "If-None-Match")
+    ):
+        set_request_header(case, "If-None-Match", headers["ETag"])
+        # conditional_get judges the 304, even when the operation does not document it
+        return probe(case, "conditional_get", handled_status_codes=(304,))
+    else:
+        return None
+
+
+def conditional_get(response: Response, case: Case) -> Optional[bool]:
+    if case.method.upper() == "GET" and get_request_header(
+        response.request, "If-None-Match"
+    ):
+        assert (
+            response.status_code == 304
+        ), "GET request with an If-None-Match header matching the current ETag of the resource should receive a 304 response. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers"
+        assert not parse_response(
+            response
+        ).content, "304 response must not include a response body. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-status-codes"
+    else:
+        # skips the check when it's not relevant
+        return True
+    return None
@@ -19,7 +19,7 @@ from requests import Response
 from schemathesis.models import Case
 from schemathesis.hooks import HookContext
 
-from . import original_case_successful
+from . import original_case_successful, probe
 
 
 def add_get_with_request_body(
@@ -28,7 +28,7 @@ def add_get_with_request_body(
     if original_case_successful(response) and case.method.upper() == "GET":
         # add request body if the original case received 2xx response
         case.body = {"requestBody": "request body passed with GET."}
-        return case
+        return probe(case, "get_with_request_body")
     else:
         # otherwise, do not create an additional test case
         return None
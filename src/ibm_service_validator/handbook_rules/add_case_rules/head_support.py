@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, Optional, Tuple
+
+from requests import Response
+
+from schemathesis.models import Case
+from schemathesis.hooks import HookContext
+
+from ibm_service_validator.handbook_rules.parsed_response import parse_response
+
+from . import is_probe, original_case_successful, probe
+
+MIRRORED_HEADERS: Tuple[str, ...] = ("Content-Type", "Content-Length", "ETag")
+
+
+def add_head_support(
+    context: HookContext, case: Case, response: Response
+) -> Optional[Case]:
+    if case.method.upper() == "GET" and original_case_successful(response):
+        case.body = None
+        headers = parse_response(response).headers
+        # the probe keeps the GET operation, with the status and headers of its response
+        get_response: Tuple[int, Dict[str, str]] = (
+            response.status_code,
+            {header: headers[header] for header in MIRRORED_HEADERS if header in headers},
+        )
+        return probe(case, "head_support", get_response, request_method="HEAD")
+    else:
+        return None
+
+
+def head_support(response: Response, case: Case) -> Optional[bool]:
+    if is_probe(case, "head_support"):
+        status_code, headers = case.original
+        assert (
+            response.status_code == status_code
+        ), f"HEAD request should receive the same status code as GET. GET: {status_code}, HEAD: {response.status_code}. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-methods"
+        parsed = parse_response(response)
+        for header, value in headers.items():
+            assert (
+                parsed.headers.get(header) == value
+            ), f"HEAD response should have the same {header} header as GET. GET: {value}, HEAD: {parsed.headers.get(header)}. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-methods"
+        assert (
+            not parsed.content
+        ), "HEAD response must not include a response body. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-methods"
+    else:
+        # skips the check when it's not relevant
+        return True
+    return None
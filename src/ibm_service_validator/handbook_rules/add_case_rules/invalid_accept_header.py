@@ -19,7 +19,7 @@ from requests import Response
 from schemathesis.models import Case
 from schemathesis.hooks import HookContext
 
-from . import get_request_header, original_case_successful, set_request_header
+from . import get_request_header, original_case_successful, probe, set_request_header
 
 
 def add_invalid_accept_header(
@@ -27,7 +27,7 @@ def add_invalid_accept_header(
 ) -> Optional[Case]:
     if original_case_successful(response):
         set_request_header(case, "Accept", "invalid/accept")
-        return case
+        return probe(case, "invalid_accept_header")
     else:
         return None
 
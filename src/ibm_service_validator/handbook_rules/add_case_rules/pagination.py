@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from requests import Response
+
+from schemathesis.models import Case, Endpoint
+from schemathesis.hooks import HookContext
+
+from ibm_service_validator.handbook_rules.parsed_response import parse_response
+
+from . import is_probe, original_case_successful, probe
+
+LIMIT_PARAMETERS: List[str] = ["limit", "page_size"]
+NEXT_FIELDS: List[str] = [
+    "next",
+    "next_url",
+    "next_token",
+    "next_page_token",
+    "next_start",
+]
+PROBE_LIMIT: int = 1
+# the properties a collection envelope has besides its array of items
+PAGINATION_FIELDS: FrozenSet[str] = frozenset(
+    [
+        "limit",
+        "offset",
+        "start",
+        "total_count",
+        "first",
+        "last",
+        "previous",
+        "prev",
+        *NEXT_FIELDS,
+    ]
+)
+
+
+def add_pagination(
+    context: HookContext, case: Case, response: Response
+) -> Optional[Case]:
+    limit = limit_parameter(case.endpoint)
+    if (
+        limit
+        and case.method.upper() == "GET"
+        and original_case_successful(response)
+        # with fewer items, a page of one item may rightly have no next page
+        and (count_items(response, collection_property(case.endpoint)) or 0) > PROBE_LIMIT
+    ):
+        case.query = {**(case.query or {}), limit: PROBE_LIMIT}
+        return probe(case, "pagination")
+    else:
+        return None
+
+
+def pagination(response: Response, case: Case) -> Optional[bool]:
+    if (
+        case.method.upper() != "GET"
+        or not original_case_successful(response)
+        or not is_collection(case.endpoint)
+    ):
+        # skips the check when it's not relevant
+        return True
+    limit = limit_parameter(case.endpoint)
+    assert (
+        limit
+    ), "Collection GET operation should be paginated with a limit query parameter. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-pagination"
+    if not is_probe(case, "pagination"):
+        # only the probe asks for a page of PROBE_LIMIT items
+        return True
+    count = count_items(response, collection_property(case.endpoint))
+    assert (
+        count is not None and count <= PROBE_LIMIT
+    ), f"Collection response should honor {limit}={PROBE_LIMIT}, but it did not return a page of at most {PROBE_LIMIT} item. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-pagination"
+    assert (
+        has_next_page(response) or count < PROBE_LIMIT
+    ), "Page of a larger collection should include a next link or token. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-pagination"
+    return None
+
+
+def limit_parameter(endpoint: Endpoint) -> str:
+    """Returns the name of the page size query parameter, if the operation has one."""
+    properties = (endpoint.query or {}).get("properties", {})
+    return next((name for name in LIMIT_PARAMETERS if name in properties), "")
+
+
+def is_collection(endpoint: Endpoint) -> bool:
+    """Returns True for operations with a page size parameter or that return a list."""
+    return bool(limit_parameter(endpoint)) or collection_property(endpoint) is not None
+
+
+def collection_property(endpoint: Endpoint) -> Optional[str]:
+    """Returns the array_property of the first successful response that has one."""
+    for status_code, definition in endpoint.definition.resolved.get(
+        "responses", {}
+    ).items():
+        if not str(status_code).startswith("2") or not isinstance(definition, dict):
+            continue
+        for media_type in definition.get("content", {}).values():
+            name = array_property(media_type.get("schema") or {})
+            if name is not None:
+                return name
+    return None
+
+
+def array_property(schema: Dict[str, Any]) -> Optional[str]:
+    """Returns "" for an array schema, or the name of the array of a collection envelope.
+
+    A collection envelope is an object with a single array property, whose other
+    properties are pagination fields such as limit, total_count or next.
+    """
+    if schema.get("type") == "array":
+        return ""
+    properties = schema.get("properties", {})
+    arrays = [
+        name
+        for name, prop in properties.items()
+        if isinstance(prop, dict) and prop.get("type") == "array"
+    ]
+    others = set(properties) - set(arrays)
+    if len(arrays) != 1 or not others <= PAGINATION_FIELDS:
+        return None
+    return arrays[0]
+
+
+def count_items(response: Response, name: Optional[str]) -> Optional[int]:
+    """Returns the number of items in a JSON response, in its name property if not "".
+
+    name is the array_property of the response schema, None if it is not a collection.
+    """
+    if name is None:
+        return None
+    try:
+        body = parse_response(response).json()
+    except ValueError:
+        return None
+    if name:
+        body = body.get(name) if isinstance(body, dict) else None
+    return len(body) if isinstance(body, list) else None
+
+
+def has_next_page(response: Response) -> bool:
+    if "next" in response.links:
+        return True
+    body = parse_response(response).json()
+    return isinstance(body, dict) and any(body.get(field) for field in NEXT_FIELDS)
@@ -13,17 +13,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional
+from typing import Optional, Tuple
+
+from email.utils import parsedate_to_datetime
 
 from requests import Response
 from schemathesis.models import Case
 
+from ibm_service_validator.handbook_rules.parsed_response import parse_response
+
+RATE_LIMIT_HEADERS: Tuple[str, ...] = (
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+)
+
 
 def allow_header_in_405(response: Response, case: Case) -> Optional[bool]:
+    headers = parse_response(response).headers
     if response.status_code == 405:
-        # response.headers object is case-insensitive
         assert (
-            response.headers and "Allow" in response.headers
+            "Allow" in headers
         ), "For 405 response, must provide the Allow header with the list of accepted request methods. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers#negotiation-headers"
     else:
         # skips the test when it's not relevant
@@ -31,13 +41,26 @@ def allow_header_in_405(response: Response, case: Case) -> Optional[bool]:
     return None
 
 
+def cache_headers(response: Response, case: Case) -> Optional[bool]:
+    headers = parse_response(response).headers
+    if response.status_code == 200 and case.method.upper() == "GET":
+        assert any(
+            header in headers for header in ("ETag", "Last-Modified", "Cache-Control")
+        ), "Cacheable GET response should include an ETag or Last-Modified header so clients can make conditional requests, or a Cache-Control header stating how it may be cached. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers"
+    else:
+        # skips the test when it's not relevant
+        return True
+    return None
+
+
 def content_location(response: Response, case: Case) -> Optional[bool]:
+    headers = parse_response(response).headers
     if response.status_code == 200 and case.method.upper() in {"PUT", "PATCH"}:
         assert (
-            response.headers and "Content-Location" in response.headers
+            "Content-Location" in headers
         ), "For successful PUT or PATCH response, should provide Content-Location header with the URI of the resource. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers#content-location"
 
-        content_location_header = response.headers.get("Content-Location")
+        content_location_header = headers.get("Content-Location")
         relative_uri = case.formatted_path
         absolute_uri = case._get_base_url() + relative_uri
         assert content_location_header in {
@@ -46,11 +69,11 @@ def content_location(response: Response, case: Case) -> Optional[bool]:
         }, f"Content-Location header should match the request URI. Content-Location: {content_location_header}, Absolute Request URI: {absolute_uri}, Relative Request URI: {relative_uri}. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers#content-location"
     elif response.status_code == 201:
         assert (
-            response.headers and "Content-Location" in response.headers
+            "Content-Location" in headers
         ), "For 201 response, should provide Content-Location header with the URI of the created resource. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers#content-location"
 
-        content_location_header = response.headers.get("Content-Location")
-        location = response.headers.get("Location")
+        content_location_header = headers.get("Content-Location")
+        location = headers.get("Location")
         assert (
             content_location_header == location
         ), f"Content-Location header should match the value of the Location header. Content-Location: {content_location_header}, Location: {location}. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers#content-location"
@@ -61,7 +84,7 @@ def content_location(response: Response, case: Case) -> Optional[bool]:
         "PUT",
     }:
         assert (
-            response.headers and "Content-Location" in response.headers
+            "Content-Location" in headers
         ), "For 202 response from a DELETE, PATCH, POST, or PUT, should provide Content-Location header with the URI where resource may be obtained. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-headers#content-location"
     else:
         # skips the test when it's not relevant
@@ -70,9 +93,10 @@ def content_location(response: Response, case: Case) -> Optional[bool]:
 
 
 def location_201(response: Response, case: Case) -> Optional[bool]:
+    headers = parse_response(response).headers
     if response.status_code == 201:
         assert (
-            response.headers and "Location" in response.headers
+            "Location" in headers
         ), "For 201 response, must provide Location header with the URI of the created resource. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-status-codes#success-2xx"
     else:
         # skips the test when it's not relevant
@@ -81,12 +105,11 @@ def location_201(response: Response, case: Case) -> Optional[bool]:
 
 
 def no_accept_header(response: Response, case: Case) -> Optional[bool]:
+    parsed = parse_response(response)
     request_headers = response.request.headers
-    if response.content and (not request_headers or "Accept" not in request_headers):
-        assert (
-            response.headers
-            and "Content-Type" in response.headers
-            and response.headers["Content-Type"].startswith("application/json")
+    if parsed.content and (not request_headers or "Accept" not in request_headers):
+        assert parsed.headers.get("Content-Type", "").startswith(
+            "application/json"
         ), "Accept header not provided in the request. Response must be JSON, and Content-Type header must start with application/json. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-format#content-type-behavior"
     else:
         # skips the test when it's not relevant
@@ -94,10 +117,47 @@ def no_accept_header(response: Response, case: Case) -> Optional[bool]:
     return None
 
 
+def rate_limit_headers(response: Response, case: Case) -> Optional[bool]:
+    headers = parse_response(response).headers
+    if 200 <= response.status_code < 300:
+        missing = [header for header in RATE_LIMIT_HEADERS if header not in headers]
+        assert (
+            not missing
+        ), f"Successful response should include rate limit headers so clients can pace their requests. Missing: {', '.join(missing)}."
+    else:
+        # skips the test when it's not relevant
+        return True
+    return None
+
+
+def retry_after(response: Response, case: Case) -> Optional[bool]:
+    headers = parse_response(response).headers
+    if response.status_code in {429, 503}:
+        value = headers.get("Retry-After", "")
+        assert (
+            value
+        ), f"{response.status_code} response must have a Retry-After header so clients know when to retry. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-status-codes"
+        assert value.isdigit() or is_http_date(
+            value
+        ), f"Retry-After header must be a number of seconds or an HTTP date. Retry-After: {value}"
+    else:
+        # skips the test when it's not relevant
+        return True
+    return None
+
+
+def is_http_date(value: str) -> bool:
+    try:
+        return parsedate_to_datetime(value) is not None
+    except (TypeError, ValueError):
+        return False
+
+
 def www_authenticate_401(response: Response, case: Case) -> Optional[bool]:
+    headers = parse_response(response).headers
     if response.status_code == 401:
         assert (
-            response.headers and "WWW-Authenticate" in response.headers
+            "WWW-Authenticate" in headers
         ), "401 response must have WWW-Authenticate header. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-status-codes#client-errors-4xx"
     else:
         # skips the test when it's not relevant
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Callable, Optional
+
+from requests import Response
+from schemathesis.models import Case, Endpoint
+
+from ibm_service_validator.handbook_rules.parsed_response import parse_response
+
+# bytes
+DEFAULT_MAX_RESPONSE_SIZE: int = 10 * 1024 * 1024
+# set on a response whose body was not read because it was larger than the download cap
+DOWNLOAD_CAP_EXCEEDED: str = "download_cap_exceeded"
+
+
+def max_response_size_check(
+    budget_for: Callable[[Endpoint], int],
+) -> Callable[[Response, Case], Optional[bool]]:
+    """Returns the max_response_size rule using the budget of each operation."""
+
+    def check(response: Response, case: Case) -> Optional[bool]:
+        budget = budget_for(case.endpoint)
+        cap = getattr(response, DOWNLOAD_CAP_EXCEEDED, None)
+        assert (
+            cap is None
+        ), f"Response body is larger than the download cap of {cap} bytes and was not read. The response size budget for this operation is {budget} bytes."
+        size = len(parse_response(response).content)
+        assert (
+            size <= budget
+        ), f"Response body of {size} bytes exceeds the response size budget of {budget} bytes for this operation."
+        return None
+
+    # results are reported under the rule name
+    check.__name__ = "max_response_size"
+    return check
+
+
+max_response_size = max_response_size_check(lambda endpoint: DEFAULT_MAX_RESPONSE_SIZE)
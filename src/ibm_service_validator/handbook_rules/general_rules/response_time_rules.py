@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Callable, Optional
+
+from requests import Response
+from schemathesis.models import Case, Endpoint
+
+# milliseconds
+DEFAULT_RESPONSE_TIME_BUDGET: float = 1000
+
+
+def response_time_budget_check(
+    budget_for: Callable[[Endpoint], float],
+) -> Callable[[Response, Case], Optional[bool]]:
+    """Returns the response_time_budget rule using the budget of each operation."""
+
+    def check(response: Response, case: Case) -> Optional[bool]:
+        if response.status_code >= 400:
+            # skips the test, an error response is already reported by other rules
+            return True
+        budget = budget_for(case.endpoint)
+        elapsed = response.elapsed.total_seconds() * 1000
+        assert (
+            elapsed <= budget
+        ), f"Response took {elapsed:.0f} ms, which exceeds the response time budget of {budget:g} ms for this operation."
+        return None
+
+    # results are reported under the rule name
+    check.__name__ = "response_time_budget"
+    return check
+
+
+response_time_budget = response_time_budget_check(
+    lambda endpoint: DEFAULT_RESPONSE_TIME_BUDGET
+)
@@ -18,6 +18,8 @@ from typing import Optional
 from requests import Response
 from schemathesis.models import Case
 
+from ibm_service_validator.handbook_rules.parsed_response import parse_response
+
 
 def no_422(response: Response, case: Case) -> Optional[bool]:
     assert (
@@ -28,9 +30,9 @@ def no_422(response: Response, case: Case) -> Optional[bool]:
 
 def no_content_204(response: Response, case: Case) -> Optional[bool]:
     if response.status_code == 204:
-        assert (
-            not response.content
-        ), "204 response must not include a response body. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-status-codes#success-2xx"
+        assert not parse_response(
+            response
+        ).content, "204 response must not include a response body. https://cloud.ibm.com/docs/api-handbook?topic=api-handbook-status-codes#success-2xx"
     else:
         # skips the test when it's not relevant
         return True
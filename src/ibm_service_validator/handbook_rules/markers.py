@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, TypeVar
+
+CPU_BOUND: str = "cpu_bound"
+
+Check = TypeVar("Check", bound=Callable[..., Any])
+
+
+def cpu_bound(check: Check) -> Check:
+    """Marks a check as CPU-bound, so --check-processes runs it in a worker process.
+
+    Only checks that depend on nothing but the response and its operation can be
+    marked. Checks of add_case rules read what their hook put on the probe, which is not
+    sent to the worker.
+    """
+    setattr(check, CPU_BOUND, True)
+    return check
+
+
+def is_cpu_bound(check: Callable[..., Any]) -> bool:
+    return getattr(check, CPU_BOUND, False)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+import json
+
+from requests import Response
+from schemathesis.models import Case
+
+# decodes JSON bodies, with orjson when it is installed
+_loads_json: Callable[[bytes], Any] = json.loads
+try:
+    import orjson
+
+    _loads_json = orjson.loads
+except ImportError:  # pragma: no cover
+    pass
+
+# the attribute of a response that holds its ParsedResponse
+PARSED_RESPONSE: str = "parsed_response"
+UTF_8: frozenset = frozenset({"utf-8", "utf8"})
+_NOT_PARSED = object()
+
+
+class FrozenHeaders(Mapping[str, str]):
+    """Read-only, case-insensitive view of the response headers.
+
+    Names are lowercased once, when the view is created.
+    """
+
+    def __init__(self, headers: Mapping[str, str]) -> None:
+        self._headers: Dict[str, str] = {
+            name.lower(): value for name, value in headers.items()
+        }
+
+    def __getitem__(self, name: str) -> str:
+        return self._headers[name.lower()]
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.lower() in self._headers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._headers)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+
+class ParsedResponse:
+    """The body and headers of a response, parsed once for all the checks that read it.
+
+    The JSON body is decoded with orjson when it is installed. The response's own
+    ``json`` method is replaced with the shared one, so the Schemathesis checks reuse it.
+    """
+
+    def __init__(self, response: Response) -> None:
+        self.response = response
+        self.headers = FrozenHeaders(response.headers)
+        self.content: bytes = response.content or b""
+        self._json: Any = _NOT_PARSED
+
+    def json(self, **kwargs: Any) -> Any:
+        """Returns the decoded JSON body. Raises ValueError when it is not JSON."""
+        if kwargs:
+            return Response.json(self.response, **kwargs)
+        if self._json is _NOT_PARSED:
+            self._json = self._decode()
+        return self._json
+
+    def _decode(self) -> Any:
+        encoding = self.response.encoding
+        if encoding is None or encoding.lower() in UTF_8:
+            try:
+                return _loads_json(self.content)
+            except ValueError:
+                pass
+        # requests guesses other encodings and raises its own error for invalid bodies
+        return Response.json(self.response)
+
+
+def parse_response(response: Response) -> ParsedResponse:
+    """Returns the shared ParsedResponse of a response."""
+    parsed: Optional[ParsedResponse] = getattr(response, PARSED_RESPONSE, None)
+    if parsed is None:
+        parsed = ParsedResponse(response)
+        setattr(response, PARSED_RESPONSE, parsed)
+        response.json = parsed.json  # type: ignore
+    return parsed
+
+
+def share_parsed_response(response: Response, case: Case) -> Optional[bool]:
+    """Passed to the runner as the first check, so every check reads the same parse.
+
+    It always returns True, so Schemathesis does not record it as a result.
+    """
+    parse_response(response)
+    return True
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares runs with different numbers of workers against a slow API with large responses.
+
+Each operation sleeps before it responds with an array of objects, so a serial run
+spends its time waiting for the network and then validating the response schema. Each
+number of workers also runs with as many check processes, which validate the responses
+on other cores.
+
+    PYTHONPATH=src python -m test.benchmarks.bench_workers
+"""
+
+from typing import Any, Dict
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+import hypothesis
+import yaml
+from flask import Flask, Response
+from werkzeug.serving import make_server
+
+from ibm_service_validator.api import validate
+
+OPERATIONS: int = 8
+# seconds
+DELAY: float = 0.2
+ITEMS: int = 5000
+WORKERS = (1, 2, 4, 8)
+
+ITEM_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["id", "name", "tags"],
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string", "pattern": "^item[0-9]+$"},
+        "tags": {"type": "array", "items": {"type": "string", "enum": ["a", "b", "c"]}},
+    },
+}
+
+
+def api_definition() -> Dict[str, Any]:
+    schema = {
+        "type": "object",
+        "properties": {"list": {"type": "array", "items": ITEM_SCHEMA}},
+    }
+    response = {
+        "description": "items",
+        "content": {"application/json": {"schema": schema}},
+    }
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "benchmark", "version": "1.0.0"},
+        "paths": {
+            f"/items{index}": {"get": {"responses": {"200": response}}}
+            for index in range(OPERATIONS)
+        },
+    }
+
+
+def create_app() -> Flask:
+    app = Flask(__name__)
+    body = json.dumps(
+        {
+            "list": [
+                {"id": i, "name": f"item{i}", "tags": ["a", "b"]} for i in range(ITEMS)
+            ]
+        }
+    )
+
+    def items() -> Response:
+        time.sleep(DELAY)
+        return Response(body, mimetype="application/json")
+
+    for index in range(OPERATIONS):
+        app.add_url_rule(f"/items{index}", f"items{index}", items)
+    return app
+
+
+def main() -> None:
+    server = make_server("127.0.0.1", 0, create_app(), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.port}"
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.yaml")
+        with open(path, "w") as f:
+            yaml.safe_dump(api_definition(), f)
+        for workers, processes in [(w, p) for w in WORKERS for p in (0, w)]:
+            start = time.perf_counter()
+            results = list(
+                validate(
+                    path,
+                    base_url,
+                    checks=["not_a_server_error", "response_schema_conformance"],
+                    additional_cases=False,
+                    hypothesis_phases=[hypothesis.Phase.generate],
+                    hypothesis_max_examples=1,
+                    # waiting for other workers must not count against the examples
+                    hypothesis_deadline=60000,
+                    workers=workers,
+                    check_processes=processes,
+                )
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"{workers} workers, {processes} check processes: "
+                f"{len(results)} operations in {elapsed:.2f} s"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
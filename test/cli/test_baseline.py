@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from multiprocessing import Process
+
+import click
+import pytest
+import yaml
+from _pytest.main import ExitCode
+
+from ..mock_server import flask_app
+from src.ibm_service_validator.cli.baseline import (
+    BASELINE_RULES,
+    DEFAULT_THRESHOLDS,
+    LATENCY_REGRESSION,
+    SIZE_REGRESSION,
+    compare,
+    load_thresholds,
+)
+from src.ibm_service_validator.cli.process_config import (
+    BASELINE_CONFIG_NAME,
+    CONFIG_FILE_NAME,
+)
+
+SERVER_PROCESS: Process = None
+SERVER_URL: str = None
+
+
+def setup_module():
+    """Start Flask server as subprocess and keep global reference to process."""
+    global SERVER_URL
+    global SERVER_PROCESS
+    app = flask_app.create_app()
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(app)
+
+
+def teardown_module():
+    SERVER_PROCESS.terminate()
+
+
+def operation(p50, p99, size):
+    return {
+        "latency_us": {"p50": p50, "p99": p99},
+        "size_bytes": {"p50": size, "max": size},
+    }
+
+
+def test_compare():
+    baseline = {
+        "GET /users": operation(10000, 20000, 100),
+        "GET /groups": operation(10000, 20000, 100),
+        "GET /removed": operation(10000, 20000, 100),
+    }
+    current = {
+        "GET /users": operation(25000, 30000, 100),
+        "GET /groups": operation(10000, 20000, 300),
+        "GET /added": operation(10000, 20000, 100),
+    }
+
+    regressions, outcomes = compare(baseline, current, DEFAULT_THRESHOLDS, BASELINE_RULES)
+
+    assert [(r.operation, r.rule, r.statistic) for r in regressions] == [
+        ("GET /users", LATENCY_REGRESSION, "p50"),
+        ("GET /groups", SIZE_REGRESSION, "p50"),
+        ("GET /groups", SIZE_REGRESSION, "max"),
+    ]
+    assert outcomes == {
+        LATENCY_REGRESSION: {"passed": 1, "failed": 1},
+        SIZE_REGRESSION: {"passed": 1, "failed": 1},
+    }
+
+
+def test_compare_ignores_small_latency_increases():
+    regressions, _ = compare(
+        {"GET /users": operation(100, 200, 100)},
+        {"GET /users": operation(500, 900, 100)},
+        DEFAULT_THRESHOLDS,
+        BASELINE_RULES,
+    )
+
+    assert not regressions
+
+
+def test_compare_rules_that_are_off():
+    _, outcomes = compare(
+        {"GET /users": operation(100, 200, 100)},
+        {"GET /users": operation(500, 900, 100)},
+        DEFAULT_THRESHOLDS,
+        frozenset({SIZE_REGRESSION}),
+    )
+
+    assert list(outcomes) == [SIZE_REGRESSION]
+
+
+def test_baseline(cli, server_definition, tmp_cwd):
+    args = (
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--no-additional-cases",
+        "--checks=not_a_server_error,size_regression",
+    )
+    result = cli.run(*args, "--statistics-file=baseline.json")
+    assert result.exit_code == ExitCode.OK, result.stdout
+
+    with open("baseline.json") as f:
+        baseline = json.load(f)
+    for statistics in baseline["operations"].values():
+        statistics["size_bytes"]["max"] = 1
+    with open("baseline.json", "w") as f:
+        json.dump(baseline, f)
+
+    result = cli.run(*args, "--baseline=baseline.json")
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert "== BASELINE REGRESSIONS ==" in result.stdout
+    assert "GET /string: size_regression max 1 B ->" in result.stdout
+    assert "size_regression" in result.stdout.split("SUMMARY")[1]
+
+
+@pytest.mark.parametrize("content", ['{"operations": {}}', "{not json"])
+def test_baseline_not_a_statistics_file(cli, server_definition, tmp_cwd, content):
+    with open("baseline.json", "w") as f:
+        f.write(content)
+
+    result = cli.run(
+        server_definition, "--base-url=" + SERVER_URL, "--baseline=baseline.json"
+    )
+
+    assert result.exit_code == 2
+    assert "is not a statistics file" in result.output
+
+
+@pytest.mark.parametrize(
+    "thresholds, message",
+    [
+        ({"latency": "fast"}, "latency in the baseline_thresholds section"),
+        ({"size": 0}, "size in the baseline_thresholds section"),
+        ({"p99": 1.5}, "Unknown baseline_thresholds in the config file: p99"),
+    ],
+)
+def test_load_thresholds_invalid(
+    tmp_path, monkeypatch, write_to_file, thresholds, message
+):
+    # restores the cwd, so later tests do not read the invalid config
+    monkeypatch.chdir(tmp_path)
+    config = {BASELINE_CONFIG_NAME: thresholds}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    with pytest.raises(click.UsageError, match=message):
+        load_thresholds()
+
+
+def test_load_thresholds(tmp_path, monkeypatch, write_to_file):
+    monkeypatch.chdir(tmp_path)
+    config = {BASELINE_CONFIG_NAME: {"latency": 1.5}}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    assert load_thresholds() == {"latency": 1.5, "size": 2.0}
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+from schemathesis import loaders
+from schemathesis.models import Case
+
+from src.ibm_service_validator.cli import get_selected_checks
+from src.ibm_service_validator.cli import check_pool
+from src.ibm_service_validator.cli.check_pool import (
+    CheckOutcome,
+    CheckPool,
+    run_check,
+    to_check_request,
+)
+from src.ibm_service_validator.cli.response_validators import (
+    ArraySample,
+    ResponseValidators,
+)
+from src.ibm_service_validator.handbook_rules.general_rules.status_code_rules import (
+    no_422,
+)
+from src.ibm_service_validator.handbook_rules.markers import cpu_bound, is_cpu_bound
+
+ON = frozenset({"response_schema_conformance", "not_a_server_error"})
+
+
+@pytest.fixture()
+def array_case(server_definition):
+    schema = loaders.from_path(server_definition, base_url="http://127.0.0.1")
+    return Case(schema.endpoints["/array"]["GET"])
+
+
+@pytest.fixture()
+def in_process_worker(array_case, monkeypatch):
+    # restores the uninitialized worker after the test
+    monkeypatch.setattr(check_pool, "_worker", None)
+    schema = array_case.endpoint.schema
+    validators = ResponseValidators(sampling=ArraySample(first=1))
+    check_pool.init_worker(schema.raw_schema, schema.location, validators)
+
+
+def json_response(mock_response, content):
+    mock_response.status_code = 200
+    mock_response.headers["Content-Type"] = "application/json"
+    mock_response._content = content
+    return mock_response
+
+
+def test_cpu_bound():
+    @cpu_bound
+    def check(response, case):
+        return None
+
+    assert is_cpu_bound(check)
+    assert not is_cpu_bound(no_422)
+    assert is_cpu_bound(ResponseValidators().response_schema_conformance)
+
+
+def test_no_processes_runs_checks_in_process():
+    validators = ResponseValidators()
+    pool = CheckPool(0, validators)
+    checks = get_selected_checks(ON, validators=validators, pool=pool)
+
+    assert validators.response_schema_conformance in checks
+    assert pool.offload(no_422) is no_422
+
+
+def test_only_cpu_bound_checks_are_offloaded():
+    validators = ResponseValidators()
+    pool = CheckPool(2, validators)
+    checks = {
+        check.__name__: check for check in get_selected_checks(ON, None, validators, pool)
+    }
+
+    assert checks["response_schema_conformance"] != validators.response_schema_conformance
+    assert checks["not_a_server_error"].__module__ == "schemathesis.checks"
+
+
+def test_run_check(array_case, mock_response, in_process_worker):
+    items = ["a"] * 10
+    response = json_response(mock_response, json.dumps({"list": items}).encode())
+    request = to_check_request("response_schema_conformance", response, array_case)
+
+    assert run_check(request) == CheckOutcome(False, None, 1, 1, 9)
+
+    items[0] = 1
+    response._content = json.dumps({"list": items}).encode()
+    outcome = run_check(
+        to_check_request("response_schema_conformance", response, array_case)
+    )
+    assert "does not conform to the defined schema" in outcome.message
+
+    response.status_code = 500
+    outcome = run_check(to_check_request("not_a_server_error", response, array_case))
+    assert outcome.message
+
+
+def test_run_check_unknown_operation(array_case, mock_response, in_process_worker):
+    response = json_response(mock_response, b'{"list": ["a"]}')
+    request = to_check_request("response_schema_conformance", response, array_case)
+
+    # the caller runs the check itself
+    assert run_check(request._replace(path="/missing")) is None
+    assert run_check(request._replace(method="DELETE")) is None
+
+
+def test_uninitialized_worker(array_case, mock_response):
+    request = to_check_request("no_422", json_response(mock_response, b"{}"), array_case)
+
+    with pytest.raises(RuntimeError, match="not initialized"):
+        run_check(request)
+
+
+def test_pool(array_case, mock_response):
+    validators = ResponseValidators(sampling=ArraySample(first=1))
+    items = ["a"] * 10
+
+    with CheckPool(1, validators) as pool:
+        check = pool.offload(validators.response_schema_conformance)
+        response = json_response(mock_response, json.dumps({"list": items}).encode())
+        assert check(response, array_case) is None
+
+        items[0] = 1
+        response._content = json.dumps({"list": items}).encode()
+        with pytest.raises(
+            AssertionError, match="does not conform to the defined schema"
+        ):
+            check(response, array_case)
+
+    # counted in the worker and added to the validators of the run
+    assert validators.arrays_sampled == 2
+    assert validators.items_validated == 2
+    assert validators.items_skipped == 18
+    # the schemas were compiled in the worker
+    assert not validators.schemas
+
+
+def test_workers_start_with_the_compiled_schemas(array_case, mock_response):
+    validators = ResponseValidators()
+    response = json_response(mock_response, json.dumps({"list": ["a"]}).encode())
+    validators.response_schema_conformance(response, array_case)
+    (key,) = validators.schemas
+
+    with CheckPool(1, validators) as pool:
+        schemas = (
+            pool._executor_for(array_case.endpoint.schema).submit(worker_schemas).result()
+        )
+
+    assert schemas == [key]
+
+
+def worker_schemas():
+    return list(check_pool._worker[1].schemas)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import requests
+from flask import Response
+from schemathesis import loaders
+
+from src.ibm_service_validator.cli.circuit_breaker import CircuitBreaker, CircuitOpen
+from src.ibm_service_validator.cli.download_cap import DownloadCap
+from ..mock_server import flask_app
+
+DEFINITION = {
+    "openapi": "3.0.0",
+    "info": {"title": "circuit breaker", "version": "1.0.0"},
+    "servers": [{"url": "/api"}],
+    "paths": {
+        "/users/{id}": {"get": {"responses": {"200": {"description": "user"}}}},
+        "/users/me": {"get": {"responses": {"200": {"description": "current user"}}}},
+    },
+}
+
+
+def setup_module():
+    """Start Flask server as subprocess and keep global reference to process."""
+    global SERVER_URL
+    global SERVER_PROCESS
+    app = flask_app.create_app()
+
+    @app.route("/error", methods=["GET"])
+    def error():
+        return Response("{}", status=503, mimetype="application/json")
+
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(app, timeout=0.5)
+
+
+def teardown_module():
+    SERVER_PROCESS.terminate()
+
+
+def test_requests_are_matched_to_operations():
+    breaker = CircuitBreaker(1)
+    breaker.watching(loaders.from_dict)(DEFINITION)
+
+    for path, operation in (
+        ("/api/users/me", ("GET", "/api/users/me")),
+        ("/api/users/5?fields=name", ("GET", "/api/users/{id}")),
+        ("/api/other", ("GET", "/api/other")),
+    ):
+        request = requests.Request("get", "http://api.com" + path).prepare()
+        assert breaker._keys(request) == (operation, "api.com")
+
+
+def test_server_errors_open_circuit():
+    breaker = CircuitBreaker(2)
+    with requests.Session() as session:
+        session.auth = breaker
+        session.get(SERVER_URL + "/error")
+        # a success of another operation does not reset the count of the operation
+        session.get(SERVER_URL + "/allof")
+        session.get(SERVER_URL + "/error")
+
+        with pytest.raises(CircuitOpen, match="requests to GET /error"):
+            session.get(SERVER_URL + "/error")
+        assert session.get(SERVER_URL + "/allof").status_code == 200
+    assert list(breaker.opened) == [("GET", "/error")]
+
+
+def test_server_errors_do_not_open_host_circuit():
+    breaker = CircuitBreaker(2)
+    with requests.Session() as session:
+        session.auth = breaker
+        session.get(SERVER_URL + "/error")
+        session.get(SERVER_URL + "/error")
+
+        # the host answered, so a healthy operation is still tested
+        assert session.get(SERVER_URL + "/allof").status_code == 200
+    assert list(breaker.opened) == [("GET", "/error")]
+
+
+def test_connection_errors_open_host_circuit():
+    url = f"http://127.0.0.1:{flask_app.find_port()}"
+    breaker = CircuitBreaker(2)
+    with requests.Session() as session:
+        session.auth = breaker
+        for path in ("/allof", "/array"):
+            with pytest.raises(requests.ConnectionError):
+                session.get(url + path)
+
+        with pytest.raises(CircuitOpen, match="host 127.0.0.1"):
+            session.get(url + "/string")
+
+
+def test_run_auth_is_applied():
+    breaker = CircuitBreaker(1, DownloadCap(1000, ("user", "password")))
+    with requests.Session() as session:
+        session.auth = breaker
+        response = session.get(SERVER_URL + "/allof")
+
+    assert response.request.headers["Authorization"].startswith("Basic ")
+
+
+def test_open_circuit_skips_operations(cli, server_definition):
+    result = cli.run(
+        server_definition,
+        f"--base-url=http://127.0.0.1:{flask_app.find_port()}",
+        "--hypothesis-phases=generate,shrink",
+        "--checks=not_a_server_error",
+        "--circuit-breaker=2",
+    )
+
+    assert result.exit_code == 1, result.stdout
+    assert result.stdout.count("Skipped: circuit open") >= 5
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
 import pytest
 from _pytest.main import ExitCode
@@ -22,7 +23,7 @@ import yaml
 from ..mock_server import flask_app
 from multiprocessing import Process
 from src.ibm_service_validator.cli import API_KEY, IAM_ENDPOINT
-from schemathesis.hooks import unregister_all
+from schemathesis.hooks import GLOBAL_HOOK_DISPATCHER, unregister_all
 from src.ibm_service_validator.cli.process_config import (
     CONFIG_FILE_NAME,
     HANDBOOK_CONFIG_NAME,
@@ -319,19 +320,38 @@ def test_statistics(tmp_cwd, cli, config_partial_warn, mixed_api_def, write_to_f
         "--hypothesis-phases=generate",
         "--hypothesis-max-examples=1",
         "--statistics",
+        "--statistics-file=statistics.json",
         "--no-additional-cases",
     )
 
     assert result.exit_code == ExitCode.TESTS_FAILED
     # gets non-empty lines
     lines = [*filter(lambda x: x, result.stdout.split("\n"))]
-    assert "== STATISTICS ==" in lines[-8]
-    assert lines[-7] == "Total warnings: 4"
-    assert lines[-6] == "Total errors: 2"
-    assert lines[-5] == "warnings"
-    assert lines[-4] == "status_code_conformance : 4"
-    assert lines[-3] == "errors"
-    assert lines[-2] == "not_a_server_error : 2"
+    start = next(i for i, line in enumerate(lines) if "== STATISTICS ==" in line)
+    assert lines[start + 1] == "Total warnings: 4"
+    assert lines[start + 2] == "Total errors: 2"
+    assert lines[start + 3] == "warnings"
+    assert lines[start + 4] == "status_code_conformance : 4"
+    assert lines[start + 5] == "errors"
+    assert lines[start + 6] == "not_a_server_error : 2"
+    assert lines[start + 7] == "Response times (ms)"
+    assert lines[start + 8].split() == [
+        "operation",
+        "min",
+        "p50",
+        "p90",
+        "p95",
+        "p99",
+        "max",
+    ]
+    assert "Slowest operations by p99 (ms)" in lines
+    with open("statistics.json") as f:
+        operations = json.load(f)["operations"]
+    assert operations
+    assert all(
+        op["latency_us"]["count"] == op["size_bytes"]["count"]
+        for op in operations.values()
+    )
 
 
 @pytest.mark.usefixtures("reset_hooks")
@@ -475,3 +495,217 @@ def test_internal_exception_1(tmp_cwd, cli, invalid_examples):
 def reset_hooks():
     yield
     unregister_all()
+
+
+def test_repeated_runs_do_not_accumulate_hooks(cli, server_definition, check_str):
+    """Add case hooks from earlier runs must not send duplicate requests."""
+    summaries = []
+    for _ in range(2):
+        result = cli.run(
+            server_definition,
+            "--base-url=" + SERVER_URL,
+            "--hypothesis-phases=generate",
+            "--hypothesis-derandomize",
+            "--hypothesis-max-examples=1",
+            "--checks=" + check_str + ",get_with_request_body",
+        )
+        assert result.exit_code == ExitCode.OK, result.stdout
+        lines = [*filter(lambda x: x, result.stdout.split("\n"))]
+        summaries.append(lines[-1].split(" in ")[0])
+
+    assert summaries[0] == summaries[1]
+    assert GLOBAL_HOOK_DISPATCHER.get_all_by_name("add_case") == []
+
+
+@pytest.mark.usefixtures("reset_hooks")
+def test_rate_limit_rules(cli, rate_limited, server_definition):
+    result = cli.run(
+        rate_limited,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--checks=retry_after,rate_limit_headers",
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert any(
+        "retry_after" in line and "1 / 1 passed" in line
+        for line in result.stdout.split("\n")
+    )
+
+    # the mock server does not send rate limit headers for other operations
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--checks=rate_limit_headers",
+    )
+
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert "Missing: X-RateLimit-Limit" in result.stdout
+
+
+@pytest.mark.usefixtures("reset_hooks")
+def test_head_support(cli, server_definition):
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--checks=head_support,status_code_conformance,response_schema_conformance",
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    # one HEAD request for each GET operation
+    assert any(
+        "head_support" in line and "6 / 6 passed" in line
+        for line in result.stdout.split("\n")
+    )
+    # the HEAD requests are reported under their GET operation
+    assert "HEAD /" not in result.stdout
+
+
+@pytest.mark.usefixtures("reset_hooks")
+def test_conditional_get(cli, server_definition):
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--checks=conditional_get,status_code_conformance",
+    )
+
+    # the API definition does not document the 304 of the conditional requests
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert any(
+        "conditional_get" in line and "6 / 6 passed" in line
+        for line in result.stdout.split("\n")
+    )
+
+
+@pytest.mark.usefixtures("reset_hooks")
+def test_stream_responses(cli, server_definition):
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--checks=max_response_size,response_schema_conformance",
+        "--stream-responses",
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+
+
+@pytest.mark.usefixtures("reset_hooks")
+def test_workers(cli, server_definition):
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--checks=head_support,status_code_conformance,response_schema_conformance",
+        "--workers=3",
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert any(
+        "head_support" in line and "6 / 6 passed" in line
+        for line in result.stdout.split("\n")
+    )
+    operations = [
+        line.split()[1] for line in result.stdout.split("\n") if line.startswith("GET /")
+    ]
+    assert operations == sorted(operations)
+    assert len(operations) == 6
+
+
+def test_check_processes(cli, server_definition):
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--hypothesis-deadline=60000",
+        "--checks=status_code_conformance,response_schema_conformance",
+        "--workers=2",
+        "--check-processes=1",
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert any(
+        "response_schema_conformance" in line and "6 / 6 passed" in line
+        for line in result.stdout.split("\n")
+    )
+
+
+@pytest.mark.usefixtures("reset_hooks")
+def test_check_processes_with_add_case_rules(cli, server_definition, tmp_cwd):
+    # no config file, so the default rules send their add_case requests
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--hypothesis-deadline=60000",
+        "--check-processes=1",
+    )
+
+    # the mock server does not reject unsupported Accept headers
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    failed = [
+        line.split()[0]
+        for line in result.stdout.split("\n")
+        if line.split()[-1:] == ["ERROR"]
+    ]
+    assert failed == ["invalid_accept_header"]
+    assert any(
+        "head_support" in line and "SUCCESS" in line for line in result.stdout.split("\n")
+    )
+
+
+def test_max_failures_per_operation(cli, status_code_failure):
+    result = cli.run(
+        status_code_failure,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate,shrink",
+        "--checks=status_code_conformance",
+        "--max-failures-per-operation=1",
+    )
+
+    assert result.exit_code == 1, result.stdout
+    assert "status_code_conformance                    0 / 1 passed" in result.stdout
+
+
+@pytest.mark.usefixtures("reset_hooks")
+def test_time_budget(cli, server_definition):
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=explicit,generate",
+        "--hypothesis-max-examples=1",
+        "--checks=status_code_conformance",
+        "--time-budget=5m",
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    # the results of both passes are reported once for each operation
+    operations = [
+        line.split()[1] for line in result.stdout.split("\n") if line.startswith("GET /")
+    ]
+    assert len(operations) == len(set(operations)) == 6
+    assert "status_code_conformance                    6 / 6 passed" in result.stdout
+    assert "Reduced coverage" not in result.stdout
+
+
+def test_time_budget_with_workers(cli, server_definition):
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--time-budget=5m",
+        "--workers=2",
+    )
+
+    assert result.exit_code == 2, result.output
+    assert "cannot be used with --workers" in result.output
@@ -24,6 +24,7 @@ from src.ibm_service_validator.cli.process_config import (
     open_get_data_close,
     open_write_close,
     process_config,
+    warnings,
 )
 from src.ibm_service_validator.cli.process_config import (
     CONFIG_FILE_NAME,
@@ -157,6 +158,24 @@ def test_checks_on_2():
     )
 
 
+def test_checks_on_3():
+    # rules that are off by default stay off unless the config turns them on
+    assert "rate_limit_headers" not in checks_on({HANDBOOK_CONFIG_NAME: {}})
+    assert "rate_limit_headers" in checks_on(
+        {HANDBOOK_CONFIG_NAME: {"rate_limit_headers": "warn"}}
+    )
+
+
+def test_warnings():
+    # rules that are warnings by default stay warnings unless the config sets them
+    assert "cache_headers" in warnings({HANDBOOK_CONFIG_NAME: {}})
+    assert "pagination" in warnings({})
+    assert "cache_headers" not in warnings(
+        {HANDBOOK_CONFIG_NAME: {"cache_headers": "on"}}
+    )
+    assert "status_code_conformance" not in warnings({SCHEMATHESIS_CONFIG_NAME: {}})
+
+
 def test_create_default_config(tmp_cwd):
     create_default_config(write_json=True, overwrite=False)
 
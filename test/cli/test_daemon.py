@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+from multiprocessing import Process
+from time import sleep
+
+from _pytest.main import ExitCode
+
+import ibm_service_validator.cli
+from ibm_service_validator.cli.daemon import is_listening, serve
+from ..mock_server import flask_app
+
+SERVER_PROCESS: Process = None
+SERVER_URL: str = None
+DAEMON_PROCESS: Process = None
+SOCKET_PATH: str = os.path.join(tempfile.mkdtemp(), "daemon.sock")
+
+
+def setup_module():
+    """Start the Flask server and the daemon as subprocesses."""
+    global SERVER_URL
+    global SERVER_PROCESS
+    global DAEMON_PROCESS
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(flask_app.create_app())
+    DAEMON_PROCESS = Process(
+        target=serve, args=(SOCKET_PATH, ibm_service_validator.cli.run)
+    )
+    DAEMON_PROCESS.start()
+    for _ in range(100):
+        if os.path.exists(SOCKET_PATH) and is_listening(SOCKET_PATH):
+            break
+        sleep(0.02)
+
+
+def teardown_module():
+    DAEMON_PROCESS.terminate()
+    SERVER_PROCESS.terminate()
+
+
+def test_client(cli, server_definition):
+    result = cli.main(
+        "client",
+        "--socket",
+        SOCKET_PATH,
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=explicit,generate",
+        "--hypothesis-max-examples=1",
+        "--no-additional-cases",
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "Performed checks:" in result.stdout
+
+
+def test_client_repeated_runs(cli, server_definition):
+    """Output of a run must not be affected by earlier runs in the daemon."""
+    outputs = [
+        cli.main(
+            "client",
+            "--socket",
+            SOCKET_PATH,
+            server_definition,
+            "--base-url=" + SERVER_URL,
+            "--hypothesis-phases=generate",
+            "--hypothesis-derandomize",
+            "--hypothesis-max-examples=1",
+        ).stdout
+        for _ in range(2)
+    ]
+
+    summaries = [output.split("\n")[-2].split(" in ")[0] for output in outputs]
+    assert all(output.count("== SUMMARY ==") == 1 for output in outputs)
+    assert "successes" in summaries[0]
+    assert summaries[0] == summaries[1]
+
+
+def test_client_failed_run(cli, status_code_failure, check_str):
+    result = cli.main(
+        "client",
+        "--socket",
+        SOCKET_PATH,
+        status_code_failure,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=1",
+        "--checks=" + check_str,
+    )
+
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+
+
+def test_client_usage_error(cli):
+    """Usage errors raised in the daemon are reported by the client."""
+    result = cli.main("client", "--socket", SOCKET_PATH, "does_not_exist.yaml")
+
+    assert result.exit_code == 2
+    assert "Invalid SCHEMA" in result.stdout
+
+
+def test_client_no_daemon(cli, tmp_path):
+    result = cli.main("client", "--socket", str(tmp_path / "missing.sock"), "schema.yaml")
+
+    assert result.exit_code == 2
+    assert "No daemon is listening" in result.output
+
+
+def test_socket_is_private():
+    assert os.stat(SOCKET_PATH).st_mode & 0o777 == 0o600
+
+
+def test_client_refuses_shared_directory(cli, tmp_path):
+    tmp_path.chmod(0o777)
+
+    result = cli.main("client", "--socket", str(tmp_path / "daemon.sock"), "schema.yaml")
+
+    assert result.exit_code == 2
+    assert "not writable by other users" in result.output
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import timedelta
+from multiprocessing import Process
+from types import SimpleNamespace
+
+import json
+
+import click
+import pytest
+import yaml
+from _pytest.main import ExitCode
+from schemathesis import loaders
+from schemathesis.models import Case
+
+from ..mock_server import flask_app
+from src.ibm_service_validator.cli.deadlines import (
+    AdaptiveDeadlines,
+    DeadlineConfig,
+    load_deadline_config,
+)
+from src.ibm_service_validator.cli.history import HISTORY_VERSION
+from src.ibm_service_validator.cli.process_config import (
+    ADAPTIVE_DEADLINE_CONFIG_NAME,
+    CONFIG_FILE_NAME,
+)
+from ibm_service_validator.handbook_rules.add_case_rules import probe
+
+SERVER_PROCESS: Process = None
+SERVER_URL: str = None
+
+
+def setup_module():
+    """Start Flask server as subprocess and keep global reference to process."""
+    global SERVER_URL
+    global SERVER_PROCESS
+    app = flask_app.create_app()
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(app)
+
+
+def teardown_module():
+    SERVER_PROCESS.terminate()
+
+
+def test_load_deadline_config(tmp_cwd, write_to_file):
+    assert load_deadline_config() == DeadlineConfig()
+
+    config = {ADAPTIVE_DEADLINE_CONFIG_NAME: {"multiplier": 3}}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    assert load_deadline_config() == DeadlineConfig(multiplier=3.0, min_deadline=200)
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("multiplier", "ten"),
+        ("multiplier", 0),
+        ("min_deadline", 0.5),
+        ("min_deadline", -1),
+    ],
+)
+def test_load_deadline_config_invalid(tmp_path, monkeypatch, write_to_file, name, value):
+    # restores the cwd, so later tests do not read the invalid config
+    monkeypatch.chdir(tmp_path)
+    config = {ADAPTIVE_DEADLINE_CONFIG_NAME: {name: value}}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    with pytest.raises(
+        click.UsageError, match=f"{name} in the adaptive_deadline section"
+    ):
+        load_deadline_config()
+
+
+def test_tests_get_their_deadlines(server_definition):
+    history = {"GET /string": {"status": "success", "elapsed_time": 0.1, "deadline": 300}}
+    deadlines = AdaptiveDeadlines(DeadlineConfig(), history)
+    schema = deadlines.loader(loaders.from_path)(server_definition)
+
+    def test(case):
+        pass
+
+    settings = {
+        endpoint.path: test._hypothesis_internal_use_settings
+        for endpoint, test in schema.get_all_tests(test)
+    }
+
+    assert settings["/string"].deadline == timedelta(milliseconds=300)
+    # operations without a deadline are calibrated without one
+    assert settings["/integer"].deadline is None
+
+
+def case_of(path):
+    return Case(SimpleNamespace(method="GET", full_path=path))
+
+
+def test_measure(mock_response):
+    deadlines = AdaptiveDeadlines(DeadlineConfig(multiplier=4, min_deadline=100), {})
+    reports = case_of("/reports")
+
+    mock_response.elapsed = timedelta(milliseconds=500)
+    assert deadlines.measure(mock_response, reports) is True
+    # the additional cases are part of the first example
+    mock_response.elapsed = timedelta(milliseconds=250)
+    deadlines.measure(mock_response, probe(reports, "head_support"))
+    # only the first example of an operation is measured
+    mock_response.elapsed = timedelta(milliseconds=10)
+    deadlines.measure(mock_response, reports)
+    deadlines.measure(mock_response, probe(reports, "head_support"))
+    # a fast operation gets the minimum deadline
+    deadlines.measure(mock_response, case_of("/health"))
+
+    assert deadlines.deadlines == {"GET /reports": 3000, "GET /health": 100}
+
+
+def test_measure_recalibrates(mock_response):
+    history = {"GET /reports": {"deadline": 1}, "GET /health": {"deadline": 300}}
+    deadlines = AdaptiveDeadlines(DeadlineConfig(multiplier=4, min_deadline=100), history)
+
+    mock_response.elapsed = timedelta(milliseconds=750)
+    deadlines.measure(mock_response, case_of("/reports"))
+
+    # operations that were not tested keep their deadlines
+    assert deadlines.deadlines == {"GET /reports": 3000, "GET /health": 300}
+
+
+def test_adaptive_deadline(cli, server_definition, tmp_path):
+    history_file = tmp_path / "history.json"
+
+    def run(*args):
+        return cli.run(
+            server_definition,
+            "--base-url=" + SERVER_URL,
+            "--hypothesis-phases=generate",
+            "--hypothesis-max-examples=2",
+            "--no-additional-cases",
+            "--adaptive-deadline",
+            "--history-file=" + str(history_file),
+            *args,
+        )
+
+    result = run()
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    history = json.loads(history_file.read_text())
+    assert history["version"] == HISTORY_VERSION
+    assert len(history["operations"]) == 6
+    assert all(
+        operation["deadline"] >= DeadlineConfig().min_deadline
+        for operation in history["operations"].values()
+    )
+
+    # later runs use the deadlines in the history file
+    history["operations"]["GET /string"]["deadline"] = 1
+    history_file.write_text(json.dumps(history))
+    result = run()
+
+    assert result.exit_code == ExitCode.TESTS_FAILED, result.stdout
+    assert "DeadlineExceeded" in result.stdout
+    # and recalibrate the operations they test
+    history = json.loads(history_file.read_text())
+    assert (
+        history["operations"]["GET /string"]["deadline"] >= DeadlineConfig().min_deadline
+    )
+
+
+def test_adaptive_deadline_usage_errors(cli, server_definition):
+    for args in (["--workers=2"], ["--hypothesis-deadline=500"]):
+        result = cli.run(
+            server_definition, "--base-url=" + SERVER_URL, "--adaptive-deadline", *args
+        )
+
+        assert result.exit_code == 2, result.output
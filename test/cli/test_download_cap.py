@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+
+import requests
+from flask import Response
+
+from src.ibm_service_validator.cli.download_cap import DownloadCap
+from src.ibm_service_validator.handbook_rules.general_rules.response_size_rules import (
+    DOWNLOAD_CAP_EXCEEDED,
+)
+from ..mock_server import flask_app
+
+LARGE_BODY = b'{"foo": "' + b"a" * 100000 + b'"}'
+
+
+def setup_module():
+    """Start Flask server as subprocess and keep global reference to process."""
+    global SERVER_URL
+    global SERVER_PROCESS
+    app = flask_app.create_app()
+
+    @app.route("/large", methods=["GET"])
+    def large():
+        return Response(LARGE_BODY, mimetype="application/json")
+
+    @app.route("/large_gzip", methods=["GET"])
+    def large_gzip():
+        # the compressed size is small, the decoded body is not
+        response = Response(gzip.compress(LARGE_BODY), mimetype="application/json")
+        response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    @app.route("/large_streamed", methods=["GET"])
+    def large_streamed():
+        # no Content-Length header
+        return Response(iter([LARGE_BODY]), mimetype="application/json")
+
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(app, timeout=0.5)
+
+
+def teardown_module():
+    SERVER_PROCESS.terminate()
+
+
+def test_body_under_cap_is_read():
+    with requests.Session() as session:
+        session.auth = DownloadCap(len(LARGE_BODY))
+        response = session.get(SERVER_URL + "/large")
+
+    assert response.content == LARGE_BODY
+    assert not hasattr(response, DOWNLOAD_CAP_EXCEEDED)
+
+
+def test_body_over_cap_is_not_read():
+    with requests.Session() as session:
+        session.auth = DownloadCap(1000)
+        for path in ("/large", "/large_gzip", "/large_streamed"):
+            response = session.get(SERVER_URL + path)
+
+            assert response.status_code == 200
+            assert response.content == b""
+            assert "Content-Type" not in response.headers
+            assert getattr(response, DOWNLOAD_CAP_EXCEEDED) == 1000
+        # the session can still be used after a connection is dropped
+        assert session.get(SERVER_URL + "/allof").json() == {"foo": 2, "bar": "string"}
+
+
+def test_run_auth_is_applied():
+    cap = DownloadCap(1000, ("user", "password"))
+    with requests.Session() as session:
+        session.auth = cap
+        response = session.get(SERVER_URL + "/allof")
+
+    assert response.request.headers["Authorization"].startswith("Basic ")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+import unittest
+
+import click
+import pytest
+import yaml
+from hypothesis.errors import MultipleFailures
+
+from src.ibm_service_validator.cli.failure_budget import (
+    FailureBudget,
+    FailureBudgetSpent,
+    FailureCounter,
+    load_failure_budget,
+)
+from src.ibm_service_validator.cli.process_config import (
+    CONFIG_FILE_NAME,
+    FAILURE_BUDGET_CONFIG_NAME,
+)
+
+
+def failing_check(response, case):
+    assert response.status_code < 400, f"Status code {response.status_code}"
+
+
+def case_of(path="/users"):
+    return SimpleNamespace(endpoint=SimpleNamespace(method="GET", full_path=path))
+
+
+def test_distinct_failures(mock_response):
+    counter = FailureCounter(FailureBudget(max_failures=2))
+    check = counter.count(failing_check)
+    case = case_of()
+
+    assert check.__name__ == "failing_check"
+    for status_code in (500, 500, 503):
+        mock_response.status_code = status_code
+        assert counter.enforce(mock_response, case) is True
+        with pytest.raises(AssertionError):
+            check(mock_response, case)
+
+    with pytest.raises(
+        FailureBudgetSpent, match="Stopped testing GET /users: 2 distinct failures"
+    ):
+        counter.enforce(mock_response, case)
+    # other operations have their own budget
+    assert counter.enforce(mock_response, case_of("/other")) is True
+    assert counter.spent == {"GET /users": "2 distinct failures"}
+
+
+def test_repeated_failure(mock_response):
+    counter = FailureCounter(FailureBudget(max_repeats=3))
+    check = counter.count(failing_check)
+    case = case_of()
+    mock_response.status_code = 500
+
+    for _ in range(3):
+        counter.enforce(mock_response, case)
+        with pytest.raises(AssertionError):
+            check(mock_response, case)
+
+    with pytest.raises(FailureBudgetSpent, match="the same failure 3 times"):
+        counter.enforce(mock_response, case)
+
+
+def test_warnings_are_not_counted():
+    counter = FailureCounter(FailureBudget(max_failures=1), frozenset({"failing_check"}))
+
+    assert counter.count(failing_check) is failing_check
+
+
+def test_budget_spent_ends_test_as_failure():
+    # Hypothesis re-raises skips, Schemathesis reports MultipleFailures as failures
+    assert issubclass(FailureBudgetSpent, unittest.SkipTest)
+    assert issubclass(FailureBudgetSpent, MultipleFailures)
+
+
+def test_load_failure_budget(tmp_cwd, write_to_file):
+    assert load_failure_budget() is None
+    assert load_failure_budget(3) == FailureBudget(max_failures=3)
+
+    config = {FAILURE_BUDGET_CONFIG_NAME: {"max_failures": 5, "max_repeats": 10}}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    assert load_failure_budget() == FailureBudget(5, 10)
+    assert load_failure_budget(0) == FailureBudget(0, 10)
+
+
+@pytest.mark.parametrize("value", ["5", -1, None])
+def test_load_failure_budget_invalid(tmp_path, monkeypatch, write_to_file, value):
+    # restores the cwd, so later tests do not read the invalid config
+    monkeypatch.chdir(tmp_path)
+    config = {FAILURE_BUDGET_CONFIG_NAME: {"max_repeats": value}}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    with pytest.raises(
+        click.UsageError, match="max_repeats in the failure_budget section"
+    ):
+        load_failure_budget()
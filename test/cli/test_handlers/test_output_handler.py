@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import timedelta
+from types import SimpleNamespace
+
 import pytest
 import click
 
@@ -27,7 +30,9 @@ from schemathesis.runner.serialization import (
 from src.ibm_service_validator.cli.handlers.output_handler import (
     OutputHandler,
     display_exceptions,
+    display_latency_table,
 )
+from src.ibm_service_validator.cli.metrics import ResponseMetrics
 
 
 @pytest.fixture()
@@ -62,7 +67,7 @@ def internal_error():
 
 @pytest.fixture()
 def output_handler():
-    return OutputHandler(frozenset(), False)
+    return OutputHandler(frozenset())
 
 
 @pytest.fixture()
@@ -150,3 +155,21 @@ def test_finished_1(
     # Should get the error message with traceback
     assert "In file:" in captured.out
     assert "On line:" in captured.out
+
+
+def test_latency_table(capsys, mock_response):
+    metrics = ResponseMetrics()
+    case = SimpleNamespace(endpoint=SimpleNamespace(method="GET", full_path="/users"))
+    for milliseconds in range(1, 101):
+        mock_response.elapsed = timedelta(milliseconds=milliseconds)
+        assert metrics.collect_response_metrics(mock_response, case)
+
+    display_latency_table(metrics)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "Response times (ms)"
+    operation, path, *values = lines[2].split()
+    assert (operation, path) == ("GET", "/users")
+    # percentiles are reported with the bucket's relative error of at most 1/64
+    for value, expected in zip(map(float, values), (1, 50, 90, 95, 99, 100)):
+        assert expected <= value <= expected * 65 / 64
+    assert lines[-1].split()[:2] == ["GET", "/users"]
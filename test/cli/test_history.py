@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import re
+from multiprocessing import Process
+
+from _pytest.main import ExitCode
+from schemathesis import loaders
+
+from ..mock_server import flask_app
+from src.ibm_service_validator.cli.history import (
+    FAILED_FIRST,
+    HISTORY_VERSION,
+    LONGEST_FIRST,
+    order_endpoints,
+    ordered_loader,
+)
+
+SERVER_PROCESS: Process = None
+SERVER_URL: str = None
+
+
+def setup_module():
+    """Start Flask server as subprocess and keep global reference to process."""
+    global SERVER_URL
+    global SERVER_PROCESS
+    app = flask_app.create_app()
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(app)
+
+
+def teardown_module():
+    SERVER_PROCESS.terminate()
+
+
+def paths(endpoints):
+    return [endpoint.path for endpoint in endpoints]
+
+
+def test_failed_first(server_definition):
+    endpoints = list(loaders.from_path(server_definition).get_all_endpoints())
+    history = {
+        "GET /allof": {"status": "success", "elapsed_time": 0.1},
+        "GET /boolean": {"status": "success", "elapsed_time": 0.1},
+        "GET /datetime": {"status": "success", "elapsed_time": 0.1},
+        "GET /integer": {"status": "error", "elapsed_time": 0.1},
+        "GET /string": {"status": "failure", "elapsed_time": 0.1},
+    }
+
+    assert paths(order_endpoints(endpoints, FAILED_FIRST, history)) == [
+        "/integer",
+        "/string",
+        "/array",
+        "/allof",
+        "/boolean",
+        "/datetime",
+    ]
+
+
+def test_longest_first(server_definition):
+    endpoints = list(loaders.from_path(server_definition).get_all_endpoints())
+    history = {
+        "GET /allof": {"status": "success", "elapsed_time": 0.1},
+        "GET /boolean": {"status": "success", "elapsed_time": 0.3},
+        "GET /datetime": {"status": "success", "elapsed_time": 0.1},
+        "GET /integer": {"status": "success", "elapsed_time": 2.0},
+        "GET /string": {"status": "failure", "elapsed_time": 0.2},
+    }
+
+    assert paths(order_endpoints(endpoints, LONGEST_FIRST, history)) == [
+        "/array",
+        "/integer",
+        "/boolean",
+        "/string",
+        "/allof",
+        "/datetime",
+    ]
+
+
+def test_ordered_loader(server_definition):
+    history = {"GET /string": {"status": "failure", "elapsed_time": 0.1}}
+    schema = ordered_loader(loaders.from_path, FAILED_FIRST, history)(server_definition)
+
+    assert paths(schema.get_all_endpoints())[0] == "/string"
+    assert next(schema.get_all_tests(lambda: None))[0].path == "/string"
+
+
+def test_order(cli, server_definition, tmp_path):
+    history_file = tmp_path / "history.json"
+    history_file.write_text(
+        json.dumps(
+            {
+                "version": HISTORY_VERSION,
+                "operations": {
+                    "GET /string": {"status": "failure", "elapsed_time": 0.1},
+                    "GET /removed": {"status": "failure", "elapsed_time": 0.1},
+                },
+            }
+        )
+    )
+
+    result = cli.run(
+        server_definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=2",
+        "--no-additional-cases",
+        "--order=failed-first",
+        "--history-file=" + str(history_file),
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert re.findall(r"GET (/\w+)", result.stdout)[0] == "/string"
+    history = json.loads(history_file.read_text())["operations"]
+    assert history["GET /string"]["status"] == "success"
+    assert len(history) == 7
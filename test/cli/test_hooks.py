@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from schemathesis.hooks import GLOBAL_HOOK_DISPATCHER, HookContext
+
+from src.ibm_service_validator.cli.hooks import RunHooks
+
+
+def make_add_case(calls, label):
+    def add_case(context, case, response):
+        calls.append(label)
+        return None
+
+    return add_case
+
+
+def dispatch_add_case():
+    for hook in GLOBAL_HOOK_DISPATCHER.get_all_by_name("add_case"):
+        hook(HookContext(), None, None)
+
+
+def test_hooks_removed_on_exit():
+    calls = []
+    hooks = RunHooks()
+    hooks.register(make_add_case(calls, "run"), "add_case")
+
+    with hooks:
+        assert len(GLOBAL_HOOK_DISPATCHER.get_all_by_name("add_case")) == 1
+        dispatch_add_case()
+
+    assert GLOBAL_HOOK_DISPATCHER.get_all_by_name("add_case") == []
+    assert calls == ["run"]
+
+
+def test_hooks_removed_on_error():
+    hooks = RunHooks()
+    hooks.register(make_add_case([], "run"), "add_case")
+
+    try:
+        with hooks:
+            raise RuntimeError
+    except RuntimeError:
+        pass
+
+    assert GLOBAL_HOOK_DISPATCHER.get_all_by_name("add_case") == []
+
+
+def test_repeated_runs_constant_cost():
+    calls = []
+    for _ in range(3):
+        hooks = RunHooks()
+        hooks.register(make_add_case(calls, "run"), "add_case")
+        with hooks:
+            dispatch_add_case()
+
+    assert calls == ["run"] * 3
+
+
+def test_concurrent_runs_isolated():
+    """Hooks of a run do not fire for a run in another thread."""
+    calls = []
+    entered = threading.Barrier(2)
+    dispatched = threading.Barrier(2)
+
+    def run(label):
+        hooks = RunHooks()
+        hooks.register(make_add_case(calls, label), "add_case")
+        with hooks:
+            entered.wait()
+            dispatch_add_case()
+            dispatched.wait()
+
+    threads = [threading.Thread(target=run, args=(label,)) for label in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(calls) == ["a", "b"]
+    assert GLOBAL_HOOK_DISPATCHER.get_all_by_name("add_case") == []
+
+
+def test_worker_thread_joins_run():
+    """A worker thread does not inherit the run's context until it joins it."""
+    calls = []
+    hooks = RunHooks()
+    hooks.register(make_add_case(calls, "run"), "add_case")
+
+    def worker(join):
+        if join:
+            assert hooks.join_thread(None, None) is True
+        dispatch_add_case()
+
+    with hooks:
+        for join in (False, True):
+            thread = threading.Thread(target=worker, args=(join,))
+            thread.start()
+            thread.join()
+
+    assert calls == ["run"]
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import shutil
+from multiprocessing import Process
+
+import pytest
+import yaml
+from _pytest.main import ExitCode
+from schemathesis import loaders
+
+from ..mock_server import flask_app
+from src.ibm_service_validator.cli.incremental import (
+    fingerprint_operations,
+    prune_schema,
+    select_operations,
+)
+from src.ibm_service_validator.cli.overrides import RuleOverrides, compile_overrides
+
+SERVER_PROCESS: Process = None
+SERVER_URL: str = None
+
+
+def setup_module():
+    """Start Flask server as subprocess and keep global reference to process."""
+    global SERVER_URL
+    global SERVER_PROCESS
+    app = flask_app.create_app()
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(app)
+
+
+def teardown_module():
+    SERVER_PROCESS.terminate()
+
+
+@pytest.fixture()
+def raw_schema(server_definition):
+    with open(server_definition) as f:
+        return yaml.safe_load(f)
+
+
+def fingerprints_of(raw_schema):
+    return fingerprint_operations(loaders.from_dict(raw_schema, validate_schema=False))
+
+
+def test_fingerprint_changes_with_definition(raw_schema):
+    before = fingerprints_of(raw_schema)
+    raw_schema["paths"]["/string"]["get"]["responses"]["200"]["description"] = "changed"
+    after = fingerprints_of(raw_schema)
+
+    changed = {key for key in before if before[key][1] != after[key][1]}
+    assert changed == {"GET /string"}
+
+
+def test_fingerprint_follows_references(raw_schema):
+    before = fingerprints_of(raw_schema)
+    for schema in raw_schema["components"]["schemas"].values():
+        schema["description"] = "changed"
+    after = fingerprints_of(raw_schema)
+
+    # every operation references a component schema
+    assert all(before[key][1] != after[key][1] for key in before)
+
+
+def test_fingerprint_changes_with_rules(raw_schema):
+    schema = loaders.from_dict(raw_schema, validate_schema=False)
+    on = frozenset({"not_a_server_error", "response_time_budget"})
+
+    def fingerprints(overrides, warnings=frozenset()):
+        return {
+            key: value
+            for key, (_, value) in fingerprint_operations(
+                schema, overrides, warnings
+            ).items()
+        }
+
+    before = fingerprints(RuleOverrides(on, []))
+    config = [{"path": "/string", "rules": {"not_a_server_error": "off"}}]
+
+    # an override changes the rules of one operation
+    after = fingerprints(RuleOverrides(on, compile_overrides(config)))
+    assert {key for key in before if before[key] != after[key]} == {"GET /string"}
+    # every operation is affected by a change in the global rules or budgets
+    for overrides, warnings in (
+        (RuleOverrides(on | {"no_422"}, []), frozenset()),
+        (RuleOverrides(on, []), frozenset({"not_a_server_error"})),
+        (RuleOverrides(on, [], default_budget=50), frozenset()),
+    ):
+        after = fingerprints(overrides, warnings)
+        assert all(before[key] != after[key] for key in before)
+
+
+def test_select_operations(raw_schema):
+    fingerprints = fingerprints_of(raw_schema)
+    previous = {
+        key: {"fingerprint": value, "status": "success", "checks": {}}
+        for key, (_, value) in fingerprints.items()
+    }
+    previous["GET /array"]["status"] = "failure"
+    previous["GET /string"]["fingerprint"] = "outdated"
+    del previous["GET /integer"]
+
+    assert select_operations(fingerprints, previous) == {
+        "GET /array",
+        "GET /string",
+        "GET /integer",
+    }
+
+
+def test_prune_schema(raw_schema):
+    fingerprints = fingerprints_of(raw_schema)
+    pruned = prune_schema(raw_schema, [fingerprints["GET /string"][0]])
+
+    assert list(pruned["paths"]) == ["/string"]
+    assert pruned["components"] == raw_schema["components"]
+    # the raw schema is left intact
+    assert len(raw_schema["paths"]) == 6
+
+
+def test_changed_since(cli, server_definition, tmp_path):
+    definition = str(tmp_path / "mock_server.yaml")
+    shutil.copy(server_definition, definition)
+    state_file = str(tmp_path / "state.json")
+    args = (
+        definition,
+        "--base-url=" + SERVER_URL,
+        "--hypothesis-phases=generate",
+        "--hypothesis-max-examples=2",
+        "--no-additional-cases",
+        "--changed-since=" + state_file,
+    )
+
+    result = cli.run(*args)
+    assert result.exit_code == ExitCode.OK, result.stdout
+    with open(state_file) as f:
+        state = json.load(f)
+    assert len(state["operations"]) == 6
+    assert all(op["status"] == "success" for op in state["operations"].values())
+
+    # nothing changed, so nothing is tested again
+    result = cli.run(*args)
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "Unchanged operations, results from the previous run:" in result.stdout
+    assert "GET /string" in result.stdout
+
+    with open(definition) as f:
+        raw_schema = yaml.safe_load(f)
+    raw_schema["paths"]["/string"]["get"]["summary"] = "changed"
+    with open(definition, "w") as f:
+        yaml.safe_dump(raw_schema, f)
+
+    result = cli.run(*args)
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "GET /string" in result.stdout
+    assert "GET /allof" in result.stdout
+    with open(state_file) as f:
+        assert json.load(f)["operations"] != state["operations"]
+
+    # other rules make every operation be tested again
+    result = cli.run(*args, "--checks=not_a_server_error")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "Unchanged operations" not in result.stdout
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import timedelta
+from multiprocessing import Process
+
+import json
+import time
+
+import hypothesis
+from _pytest.main import ExitCode
+from flask import Response, request
+from hypothesis import strategies as st
+from schemathesis import loaders
+from schemathesis.models import Case
+
+from ..mock_server import flask_app
+from src.ibm_service_validator.cli.latency_hunt import LatencyHunt, with_target_phase
+from ibm_service_validator.handbook_rules.add_case_rules import probe
+
+SERVER_PROCESS: Process = None
+SERVER_URL: str = None
+
+DEFINITION = {
+    "openapi": "3.0.0",
+    "info": {"title": "latency hunt", "version": "1.0.0"},
+    "paths": {
+        "/slow": {
+            "get": {
+                "parameters": [
+                    {
+                        "name": "delay",
+                        "in": "query",
+                        "required": True,
+                        "schema": {"type": "integer", "minimum": 0, "maximum": 50},
+                    }
+                ],
+                "responses": {"200": {"description": "slow"}},
+            }
+        }
+    },
+}
+
+
+def setup_module():
+    """Start Flask server as subprocess and keep global reference to process."""
+    global SERVER_URL
+    global SERVER_PROCESS
+    app = flask_app.create_app()
+
+    @app.route("/slow", methods=["GET"])
+    def slow():
+        delay = int(request.args.get("delay", 0))
+        time.sleep(delay / 1000)
+        return Response(json.dumps({"delay": delay}), mimetype="application/json")
+
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(app, timeout=0.5)
+
+
+def teardown_module():
+    SERVER_PROCESS.terminate()
+
+
+def test_with_target_phase():
+    assert with_target_phase([hypothesis.Phase.explicit]) == [
+        hypothesis.Phase.explicit,
+        hypothesis.Phase.generate,
+        hypothesis.Phase.target,
+    ]
+    assert with_target_phase([hypothesis.Phase.target, hypothesis.Phase.generate]) == [
+        hypothesis.Phase.target,
+        hypothesis.Phase.generate,
+    ]
+
+
+def test_hunt(mock_response):
+    hunt = LatencyHunt(size=True)
+    endpoint = next(loaders.from_dict(DEFINITION).get_all_endpoints())
+    mock_response.status_code = 200
+    seen = []
+
+    @hypothesis.settings(max_examples=10, database=None)
+    @hypothesis.given(st.integers(0, 50))
+    def test(delay):
+        seen.append(delay)
+        case = Case(endpoint, query={"delay": delay})
+        mock_response.elapsed = timedelta(milliseconds=delay)
+        mock_response._content = b"x" * (50 - delay)
+        assert hunt.hunt(mock_response, case) is True
+        # an add_case request in the same example is neither a target nor kept
+        mock_response.elapsed = timedelta(milliseconds=100)
+        mock_response._content = b"x" * 100
+        assert hunt.hunt(mock_response, probe(case, "head_support")) is True
+
+    test()
+
+    slowest = hunt.slowest["GET /slow"]
+    largest = hunt.largest["GET /slow"]
+    assert slowest.elapsed == max(seen)
+    assert largest.size == 50 - min(seen)
+    assert slowest.case.query == {"delay": max(seen)}
+    assert slowest.case.requests_code.startswith("requests.get(")
+
+
+def test_hunt_latency(cli, tmp_path):
+    definition = tmp_path / "slow.json"
+    definition.write_text(json.dumps(DEFINITION))
+
+    result = cli.run(
+        str(definition),
+        "--base-url=" + SERVER_URL,
+        "--checks=not_a_server_error",
+        "--hypothesis-deadline=60000",
+        "--hypothesis-max-examples=30",
+        "--hypothesis-seed=1",
+        "--hunt-latency",
+    )
+
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert "Slowest inputs:" in result.stdout
+    assert "Largest responses:" not in result.stdout
+    assert "requests.get('" + SERVER_URL + "/slow', params={'delay':" in result.stdout
+
+
+def test_hunt_size_needs_hunt_latency(cli, server_definition):
+    result = cli.run(server_definition, "--base-url=" + SERVER_URL, "--hunt-size")
+
+    assert result.exit_code == 2, result.output
+    assert "--hunt-size is used with --hunt-latency" in result.output
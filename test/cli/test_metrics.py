@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import random
+from datetime import timedelta
+from types import SimpleNamespace
+
+from schemathesis.cli.context import ExecutionContext
+from schemathesis.models import Case
+from schemathesis.runner.events import Finished
+
+from ibm_service_validator.handbook_rules.add_case_rules import probe
+from src.ibm_service_validator.cli.metrics import (
+    Histogram,
+    MetricsExporter,
+    ResponseMetrics,
+)
+
+
+def test_histogram_small_values_are_exact():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.record(value)
+
+    assert histogram.summary() == {
+        "count": 100,
+        "min": 1,
+        "p50": 50,
+        "p90": 90,
+        "p95": 95,
+        "p99": 99,
+        "max": 100,
+    }
+
+
+def test_histogram_relative_error():
+    values = sorted(random.Random(0).randint(0, 10**9) for _ in range(10000))
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+
+    for percent in (50, 90, 99):
+        expected = values[int(percent / 100 * len(values)) - 1]
+        assert abs(histogram.value_at_percentile(percent) - expected) <= expected / 64
+    assert histogram.max == values[-1]
+    assert histogram.min == values[0]
+
+
+def test_histogram_memory_is_bounded():
+    histogram = Histogram()
+    for _ in range(10):
+        for value in range(0, 10**6, 7):
+            histogram.record(value)
+
+    assert histogram.count == 10 * len(range(0, 10**6, 7))
+    # 128 exact buckets and 64 buckets for each further power of two
+    assert len(histogram.buckets) <= 128 + 64 * 13
+
+
+def test_empty_histogram():
+    assert Histogram().value_at_percentile(99) == 0
+
+
+def test_slowest_and_export(mock_response):
+    metrics = ResponseMetrics()
+    mock_response._content = b"{}"
+    for index in range(12):
+        case = SimpleNamespace(
+            endpoint=SimpleNamespace(method="GET", full_path=f"/{index}")
+        )
+        mock_response.elapsed = timedelta(milliseconds=index)
+        assert metrics.collect_response_metrics(mock_response, case)
+
+    slowest = [operation for operation, _ in metrics.slowest()]
+    assert slowest == [f"GET /{index}" for index in range(11, 1, -1)]
+
+    file = io.StringIO()
+    file.close = lambda: None
+    finished = Finished(
+        passed_count=0,
+        failed_count=0,
+        errored_count=0,
+        has_failures=False,
+        has_errors=False,
+        has_logs=False,
+        is_empty=False,
+        total={},
+        running_time=1.0,
+    )
+    MetricsExporter(metrics, file).handle_event(ExecutionContext(), finished)
+    exported = json.loads(file.getvalue())
+    assert exported["operations"]["GET /11"]["latency_us"]["max"] == 11000
+    assert exported["operations"]["GET /11"]["size_bytes"]["p50"] == 2
+
+
+def test_compression_savings(mock_response):
+    metrics = ResponseMetrics(compression_threshold=100)
+    case = SimpleNamespace(endpoint=SimpleNamespace(method="GET", full_path="/users"))
+    mock_response.elapsed = timedelta(milliseconds=1)
+
+    # below the threshold
+    mock_response._content = b"{}"
+    metrics.collect_response_metrics(mock_response, case)
+    assert (metrics.received_bytes, metrics.compression_savings) == (2, 0)
+
+    mock_response._content = b'{"name": "user"}' * 100
+    metrics.collect_response_metrics(mock_response, case)
+    assert metrics.received_bytes == 1602
+    assert 1500 < metrics.compression_savings < 1600
+
+    # already compressed, the size sent is in Content-Length
+    mock_response.headers["Content-Encoding"] = "gzip"
+    mock_response.headers["Content-Length"] = "50"
+    savings = metrics.compression_savings
+    metrics.collect_response_metrics(mock_response, case)
+    assert metrics.received_bytes == 1652
+    assert metrics.compression_savings == savings
+    assert metrics.compression_savings_percent == savings / 1652 * 100
+    assert metrics.to_dict()["compression"] == {
+        "threshold_bytes": 100,
+        "received_bytes": 1652,
+        "savings_bytes": savings,
+    }
+
+
+def test_probes_are_not_collected(mock_response):
+    metrics = ResponseMetrics()
+    case = Case(SimpleNamespace(method="GET", full_path="/users"))
+    mock_response._content = b"{}"
+    mock_response.elapsed = timedelta(milliseconds=1)
+
+    metrics.collect_response_metrics(mock_response, case)
+    mock_response.elapsed = timedelta(seconds=1)
+    assert metrics.collect_response_metrics(mock_response, probe(case, "head_support"))
+
+    (histogram,) = metrics.latencies.values()
+    assert (histogram.count, histogram.max) == (1, 1000)
+    assert metrics.received_bytes == 2
@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import timedelta
+
+import click
+import pytest
+import yaml
+from schemathesis.models import Case
+
+from src.ibm_service_validator.cli import get_selected_checks, register_add_case_hooks
+from src.ibm_service_validator.cli.baseline import BASELINE_RULES
+from src.ibm_service_validator.cli.hooks import RunHooks
+from src.ibm_service_validator.cli.overrides import (
+    RuleOverrides,
+    compile_overrides,
+    process_rule_config,
+)
+from src.ibm_service_validator.cli.process_config import (
+    COMPRESSION_CONFIG_NAME,
+    CONFIG_FILE_NAME,
+    DEFAULT_CONFIG,
+    HANDBOOK_CONFIG_NAME,
+    MAX_RESPONSE_SIZES_CONFIG_NAME,
+    OVERRIDES_CONFIG_NAME,
+    RESPONSE_TIME_BUDGETS_CONFIG_NAME,
+    SCHEMATHESIS_CONFIG_NAME,
+)
+
+ON = frozenset({"not_a_server_error", "response_schema_conformance"})
+
+DEFAULT_WARNINGS = {
+    rule
+    for rules in DEFAULT_CONFIG.values()
+    for rule, val in rules.items()
+    if val == "warn"
+}
+
+
+def export_endpoint(create_endpoint):
+    return create_endpoint(
+        path="/exports/{id}",
+        method="POST",
+        definition={"operationId": "create_export", "tags": ["bulk"]},
+    )
+
+
+def test_operation_id(create_endpoint):
+    overrides = RuleOverrides(
+        ON,
+        compile_overrides(
+            [
+                {
+                    "operation_id": "create_export",
+                    "rules": {"response_schema_conformance": "off"},
+                }
+            ]
+        ),
+    )
+
+    assert overrides.rules_for(export_endpoint(create_endpoint)) == {"not_a_server_error"}
+    other = create_endpoint(path="/exports", method="GET", definition={})
+    assert overrides.rules_for(other) == ON
+
+
+def test_path_glob_tag_and_method(create_endpoint):
+    endpoint = export_endpoint(create_endpoint)
+
+    for selectors in (
+        {"path": "/exports/*"},
+        {"tag": "bulk"},
+        {"method": "post"},
+        {"path": "/exports/*", "tag": "bulk", "method": "POST"},
+    ):
+        config = [{**selectors, "rules": {"not_a_server_error": False}}]
+        overrides = RuleOverrides(ON, compile_overrides(config))
+        assert overrides.rules_for(endpoint) == {"response_schema_conformance"}
+
+    # every selector must match
+    config = [
+        {"path": "/exports/*", "method": "GET", "rules": {"not_a_server_error": "off"}}
+    ]
+    assert RuleOverrides(ON, compile_overrides(config)).rules_for(endpoint) == ON
+
+
+def test_later_overrides_take_precedence(create_endpoint):
+    config = [
+        {"tag": "bulk", "rules": {"no_422": "on", "not_a_server_error": "off"}},
+        {"operation_id": "create_export", "rules": {"not_a_server_error": "on"}},
+    ]
+    overrides = RuleOverrides(ON, compile_overrides(config))
+
+    assert overrides.rules_for(export_endpoint(create_endpoint)) == ON | {"no_422"}
+    assert overrides.enabled_anywhere == ON | {"no_422"}
+
+
+def test_malformed_overrides_are_ignored():
+    assert compile_overrides({"rules": {}}) == []
+    assert compile_overrides([{"path": "/exports"}, "no_422"]) == []
+
+
+def test_scope_check(create_endpoint):
+    calls = []
+
+    def not_a_server_error(response, case):
+        calls.append(case)
+
+    config = [{"tag": "bulk", "rules": {"not_a_server_error": "off"}}]
+    check = RuleOverrides(ON, compile_overrides(config)).scope_check(not_a_server_error)
+    other = create_endpoint(path="/exports", method="GET", definition={})
+
+    assert check.__name__ == "not_a_server_error"
+    assert check(None, Case(export_endpoint(create_endpoint))) is True
+    assert check(None, Case(other)) is None
+    assert len(calls) == 1
+
+
+def test_scoped_add_case_hooks(create_endpoint):
+    on = frozenset({"get_with_request_body"})
+    config = [{"tag": "bulk", "rules": {"get_with_request_body": "off"}}]
+    hooks = RunHooks()
+    register_add_case_hooks(hooks, on, RuleOverrides(on, compile_overrides(config)))
+    ((name, hook),) = hooks._hooks
+
+    assert name == "add_case"
+    assert hook(None, Case(export_endpoint(create_endpoint)), None) is None
+
+
+def test_process_rule_config(tmp_cwd, write_to_file):
+    config = {
+        HANDBOOK_CONFIG_NAME: {"no_422": "off", "location_201": "off"},
+        SCHEMATHESIS_CONFIG_NAME: {"not_a_server_error": "warn"},
+        OVERRIDES_CONFIG_NAME: [
+            {"tag": "bulk", "rules": {"no_422": "warn", "not_a_server_error": "off"}},
+            {"method": "post", "rules": {"location_201": "on"}},
+        ],
+    }
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    on, warnings, overrides = process_rule_config(None)
+
+    assert {"no_422", "location_201", "not_a_server_error"} <= on
+    # off globally and only turned on as a warning, besides the rules that warn by default
+    assert warnings - DEFAULT_WARNINGS == {"not_a_server_error", "no_422"}
+    # the baseline rules compare whole runs, so they are not checks
+    assert len(get_selected_checks(on, overrides)) == len(on - BASELINE_RULES)
+
+
+@pytest.mark.parametrize(
+    "config, message",
+    [
+        (
+            {RESPONSE_TIME_BUDGETS_CONFIG_NAME: {"default": "slow"}},
+            "default in the response_time_budgets section",
+        ),
+        (
+            {OVERRIDES_CONFIG_NAME: [{"tag": "bulk", "response_time_budget": -1}]},
+            "response_time_budget in the overrides section",
+        ),
+        (
+            {COMPRESSION_CONFIG_NAME: {"min_size": "1k"}},
+            "min_size in the compression section",
+        ),
+        (
+            {MAX_RESPONSE_SIZES_CONFIG_NAME: {"default": "10MB"}},
+            "default in the max_response_sizes section",
+        ),
+        (
+            {OVERRIDES_CONFIG_NAME: [{"tag": "bulk", "max_response_size": 1.5}]},
+            "max_response_size in the overrides section",
+        ),
+    ],
+)
+def test_process_rule_config_invalid(
+    tmp_path, monkeypatch, write_to_file, config, message
+):
+    # restores the cwd, so later tests do not read the invalid config
+    monkeypatch.chdir(tmp_path)
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    with pytest.raises(click.UsageError, match=message):
+        process_rule_config(None)
+
+
+def test_checks_replace_overrides(tmp_cwd, write_to_file):
+    config = {OVERRIDES_CONFIG_NAME: [{"rules": {"no_422": "off"}}]}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    on, warnings, overrides = process_rule_config(["no_422"])
+
+    assert on == {"no_422"}
+    assert not warnings
+    assert not overrides
+
+
+def test_response_time_budget(create_endpoint):
+    config = [
+        {"tag": "bulk", "response_time_budget": 30000},
+        {"path": "/exports", "response_time_budget": 200},
+    ]
+    overrides = RuleOverrides(ON, compile_overrides(config), 500)
+    other = create_endpoint(path="/exports", method="GET", definition={})
+    unmatched = create_endpoint(path="/users", method="GET", definition={})
+
+    assert overrides.response_time_budget(export_endpoint(create_endpoint)) == 30000
+    assert overrides.response_time_budget(other) == 200
+    assert overrides.response_time_budget(unmatched) == 500
+    # an entry with only a budget does not change the rules
+    assert overrides.rules_for(other) == ON
+
+
+def test_apply_configures_response_time_budget(mock_response, create_endpoint):
+    on = frozenset({"response_time_budget"})
+    overrides = RuleOverrides(on, [], 100)
+    (check,) = get_selected_checks(on, overrides)
+    mock_response.status_code = 200
+    mock_response.elapsed = timedelta(milliseconds=150)
+
+    with pytest.raises(AssertionError, match="budget of 100 ms"):
+        check(mock_response, Case(export_endpoint(create_endpoint)))
+
+
+def test_apply_add_case_configures_compression_threshold(create_endpoint, mock_response):
+    on = frozenset({"compression_supported"})
+    hooks = RunHooks()
+    register_add_case_hooks(hooks, on, RuleOverrides(on, [], compression_threshold=10))
+    ((name, hook),) = hooks._hooks
+    mock_response.status_code = 200
+    mock_response._content = b'{"name": "user"}'
+    case = Case(export_endpoint(create_endpoint))
+
+    assert name == "add_case"
+    assert hook(None, case, mock_response).headers["Accept-Encoding"] == "gzip"
+
+
+def test_max_response_size(create_endpoint, mock_response):
+    config = [{"tag": "bulk", "max_response_size": 50 * 1024 * 1024}]
+    on = frozenset({"max_response_size"})
+    overrides = RuleOverrides(on, compile_overrides(config), default_max_response_size=10)
+    other = create_endpoint(path="/exports", method="GET", definition={})
+    (check,) = get_selected_checks(on, overrides)
+    mock_response.status_code = 200
+    mock_response._content = b'{"foo": "string"}'
+
+    assert (
+        overrides.max_response_size(export_endpoint(create_endpoint)) == 50 * 1024 * 1024
+    )
+    assert overrides.max_response_size(other) == 10
+    assert overrides.download_cap == 50 * 1024 * 1024
+    assert check(mock_response, Case(export_endpoint(create_endpoint))) is None
+    with pytest.raises(AssertionError, match="budget of 10 bytes"):
+        check(mock_response, Case(other))
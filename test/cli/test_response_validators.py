@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pickle
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+import pytest
+import yaml
+from requests import Response
+from schemathesis import loaders
+from schemathesis.models import Case
+
+from src.ibm_service_validator.cli import get_selected_checks
+from src.ibm_service_validator.cli.process_config import (
+    ARRAY_SAMPLING_CONFIG_NAME,
+    CONFIG_FILE_NAME,
+)
+from src.ibm_service_validator.cli.response_validators import (
+    ArraySample,
+    ResponseValidators,
+    load_array_sampling,
+)
+from src.ibm_service_validator.cli.schema_cache import SchemaCache
+
+
+@pytest.fixture()
+def array_case(server_definition):
+    schema = loaders.from_path(server_definition, base_url="http://127.0.0.1")
+    return Case(schema.endpoints["/array"]["GET"])
+
+
+def json_response(mock_response, content):
+    mock_response.status_code = 200
+    mock_response.headers["Content-Type"] = "application/json"
+    mock_response._content = content
+    return mock_response
+
+
+def test_response_schema_conformance(array_case, mock_response):
+    validators = ResponseValidators()
+    check = validators.response_schema_conformance
+
+    assert check.__name__ == "response_schema_conformance"
+    assert check(json_response(mock_response, b'{"list": ["a"]}'), array_case) is None
+    assert list(validators.schemas) == [("GET", "/array", "200", "application/json")]
+
+
+def test_response_schema_conformance_negative(array_case, mock_response):
+    check = ResponseValidators().response_schema_conformance
+
+    with pytest.raises(AssertionError, match="does not conform to the defined schema"):
+        check(json_response(mock_response, b'{"list": [1]}'), array_case)
+
+
+def test_schema_is_compiled_once(array_case, prepare_request, monkeypatch):
+    schema = array_case.endpoint.schema
+    calls = []
+    get_response_schema = schema.get_response_schema
+
+    def counting(*args):
+        calls.append(args)
+        return get_response_schema(*args)
+
+    monkeypatch.setattr(schema, "get_response_schema", counting)
+    validators = ResponseValidators()
+    for _ in range(3):
+        response = json_response(Response(), b'{"list": ["a"]}')
+        response.request = prepare_request()
+        validators.response_schema_conformance(response, array_case)
+
+    assert len(calls) == 1
+
+
+def test_not_json(array_case, mock_response):
+    validators = ResponseValidators()
+    mock_response.status_code = 200
+    mock_response.headers["Content-Type"] = "text/plain"
+
+    assert validators.response_schema_conformance(mock_response, array_case) is None
+    assert not validators.schemas
+
+
+def test_pickle_keeps_compiled_schemas(array_case, mock_response):
+    validators = ResponseValidators()
+    validators.response_schema_conformance(
+        json_response(mock_response, b'{"list": ["a"]}'), array_case
+    )
+    copy = pickle.loads(pickle.dumps(validators))
+
+    assert copy.schemas == validators.schemas
+    assert not hasattr(copy._local, "validators")
+
+
+def test_threads_validate_with_their_own_resolver(array_case):
+    validators = ResponseValidators()
+
+    def conforms(content):
+        response = json_response(Response(), content)
+        try:
+            validators.response_schema_conformance(response, array_case)
+        except AssertionError:
+            return False
+        return True
+
+    with ThreadPoolExecutor(4) as executor:
+        outcomes = list(
+            executor.map(conforms, [b'{"list": ["a"]}', b'{"list": [1]}'] * 50)
+        )
+
+    assert outcomes == [True, False] * 50
+    schema = array_case.endpoint.schema
+    assert validators._thread_local(schema).resolver is not schema.resolver
+
+
+def test_schema_cache_keeps_validators(server_definition):
+    cache = SchemaCache()
+    validators = cache.validators(server_definition)
+
+    assert cache.validators(server_definition) is validators
+    assert cache.validators("http://mockapi.com/openapi.yaml") is not validators
+    cache.clear()
+    assert cache.validators(server_definition) is not validators
+
+
+def test_selected_checks_use_validators():
+    validators = ResponseValidators()
+    on = frozenset({"response_schema_conformance", "not_a_server_error"})
+    checks = get_selected_checks(on, None, validators)
+
+    assert validators.response_schema_conformance in checks
+    assert len(checks) == 2
+
+
+def test_array_sample_indices():
+    sample = ArraySample(first=2, last=2, random=3)
+    indices = sample.indices(100, random.Random(0))
+
+    assert indices[:2] == [0, 1]
+    assert indices[-2:] == [98, 99]
+    assert len(set(indices)) == 7
+    assert indices == sorted(indices)
+    assert sample.indices(100, random.Random(0)) == indices
+    assert sample.indices(5, random.Random(0)) == [0, 1, 2, 3, 4]
+
+
+def test_sample_is_seeded_with_the_response(array_case, mock_response):
+    validators = ResponseValidators(sampling=ArraySample(random=1))
+
+    def skipped_invalid_items(items):
+        # one random item out of two is validated
+        response = json_response(Response(), json.dumps({"list": items}).encode())
+        try:
+            validators.response_schema_conformance(response, array_case)
+        except AssertionError:
+            return False
+        return True
+
+    # arrays of the same length do not always skip the same item
+    outcomes = {skipped_invalid_items(["a", 1, "b" * length]) for length in range(20)}
+    assert outcomes == {True, False}
+    # the same response is sampled the same way
+    assert all(
+        skipped_invalid_items(["a", 1, "b" * length])
+        == skipped_invalid_items(["a", 1, "b" * length])
+        for length in range(20)
+    )
+
+
+def test_sampled_validation(array_case, mock_response):
+    validators = ResponseValidators(sampling=ArraySample(first=1, last=1))
+    items = ["a"] * 100
+    items[50] = 1
+
+    validators.response_schema_conformance(
+        json_response(mock_response, json.dumps({"list": items}).encode()), array_case
+    )
+    assert validators.arrays_sampled == 1
+    assert validators.items_validated == 2
+    assert validators.items_skipped == 98
+
+    items[-1] = 1
+    response = json_response(Response(), json.dumps({"list": items}).encode())
+    with pytest.raises(AssertionError, match="does not conform to the defined schema"):
+        validators.response_schema_conformance(response, array_case)
+
+
+def test_small_arrays_are_not_sampled(array_case, mock_response):
+    validators = ResponseValidators(sampling=ArraySample(first=5))
+
+    with pytest.raises(AssertionError):
+        validators.response_schema_conformance(
+            json_response(mock_response, b'{"list": ["a", 1]}'), array_case
+        )
+    assert not validators.arrays_sampled
+
+
+def test_with_sampling_shares_schemas(array_case, mock_response):
+    validators = ResponseValidators()
+    sampled = validators.with_sampling(ArraySample(random=1))
+    sampled.response_schema_conformance(
+        json_response(mock_response, b'{"list": ["a"]}'), array_case
+    )
+
+    assert sampled.schemas is validators.schemas
+    assert pickle.loads(pickle.dumps(sampled)).sampling == ArraySample(random=1)
+
+
+def test_load_array_sampling(tmp_cwd, write_to_file):
+    assert load_array_sampling() is None
+
+    config = {ARRAY_SAMPLING_CONFIG_NAME: {"first": 10, "random": 5}}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+    assert load_array_sampling() == ArraySample(first=10, last=0, random=5)
+
+    config = {ARRAY_SAMPLING_CONFIG_NAME: {"first": 0}}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+    assert load_array_sampling() is None
+
+
+@pytest.mark.parametrize("value", ["ten", -1, True, 1.5])
+def test_load_array_sampling_invalid(tmp_path, monkeypatch, write_to_file, value):
+    # restores the cwd, so later tests do not read the invalid config
+    monkeypatch.chdir(tmp_path)
+    config = {ARRAY_SAMPLING_CONFIG_NAME: {"first": value}}
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config, yaml.safe_dump)
+
+    with pytest.raises(click.UsageError, match="first in the array_sampling section"):
+        load_array_sampling()
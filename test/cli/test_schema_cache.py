@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from schemathesis import loaders
+
+from src.ibm_service_validator.cli.schema_cache import SchemaCache
+
+
+def test_load_file(server_definition):
+    cache = SchemaCache()
+    first, loader = cache.load(server_definition)
+    second, _ = cache.load(server_definition)
+
+    assert first == second
+    # every run gets its own copy
+    assert first is not second
+    schema = loader(first, base_url="http://127.0.0.1")
+    assert schema.location.endswith("mock_server.yaml")
+
+
+def test_load_not_a_file():
+    schema, loader = SchemaCache().load("http://mockapi.com/openapi.yaml")
+
+    assert schema == "http://mockapi.com/openapi.yaml"
+    assert loader is loaders.from_path
+
+
+def test_reload_when_modified(tmp_path):
+    path = tmp_path / "schema.yaml"
+    path.write_text("openapi: 3.0.0\ninfo:\n  title: first\n")
+    cache = SchemaCache()
+    assert cache.load(str(path))[0]["info"]["title"] == "first"
+
+    path.write_text("openapi: 3.0.0\ninfo:\n  title: second\n")
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert cache.load(str(path))[0]["info"]["title"] == "second"
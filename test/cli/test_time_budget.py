@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+import time
+
+import click
+import hypothesis
+import pytest
+
+from src.ibm_service_validator.cli import time_budget
+from src.ibm_service_validator.cli.time_budget import TimeBudget, parse_duration
+
+GENERATE = [hypothesis.Phase.generate]
+
+
+@pytest.mark.parametrize(
+    "value, seconds", [("300", 300), ("300s", 300), ("1.5m", 90), ("1h", 3600)]
+)
+def test_parse_duration(value, seconds):
+    assert parse_duration(None, None, value) == seconds
+
+
+@pytest.mark.parametrize("value", ["0", "5d", "-1s", "soon"])
+def test_invalid_duration(value):
+    with pytest.raises(click.BadParameter):
+        parse_duration(None, None, value)
+
+
+def endpoint(path):
+    return SimpleNamespace(method="GET", full_path=path)
+
+
+@pytest.fixture
+def made_tests(monkeypatch):
+    """Records the settings each test is made with."""
+    made = []
+
+    def make_test_or_exception(endpoint, func, settings, seed):
+        made.append((endpoint.full_path, settings))
+        return func
+
+    monkeypatch.setattr(time_budget, "make_test_or_exception", make_test_or_exception)
+    return made
+
+
+def test_explicit_examples_run_first(made_tests):
+    budget = TimeBudget(60)
+    settings = hypothesis.settings(
+        phases=[hypothesis.Phase.explicit, *GENERATE], max_examples=5
+    )
+    endpoints = [endpoint("/a"), endpoint("/b")]
+
+    for _ in budget.tests(endpoints, None, settings, None):
+        budget.responses += 5
+
+    assert budget.two_passes
+    assert [(path, tuple(settings.phases)) for path, settings in made_tests] == [
+        ("/a", (hypothesis.Phase.explicit,)),
+        ("/b", (hypothesis.Phase.explicit,)),
+        ("/a", tuple(GENERATE)),
+        ("/b", tuple(GENERATE)),
+    ]
+    assert not budget.reduced
+
+
+def test_prioritized_operations_go_first(made_tests):
+    budget = TimeBudget(60)
+    budget.prioritized.add("GET /b")
+    settings = hypothesis.settings(phases=GENERATE)
+
+    for _ in budget.tests([endpoint("/a"), endpoint("/b")], None, settings, None):
+        pass
+
+    assert not budget.two_passes
+    assert [path for path, _ in made_tests] == ["/b", "/a"]
+
+
+def test_examples_fit_the_time_left(made_tests):
+    budget = TimeBudget(60)
+    budget.prioritized.add("GET /b")
+    settings = hypothesis.settings(phases=GENERATE, max_examples=1000)
+    # responses take a second
+    budget.spent, budget.responses = 1.0, 1
+    tests = budget.tests([endpoint("/a"), endpoint("/b")], None, settings, None)
+
+    next(tests)
+    budget.spent += 40
+    budget.responses += 40
+    budget.deadline = time.monotonic() + 10
+    next(tests)
+    budget.responses += 1
+    budget.deadline = time.monotonic()
+
+    # /b has twice the share of /a, and /a gets the time left
+    examples = [settings.max_examples for _, settings in made_tests]
+    assert 39 <= examples[0] <= 40
+    assert 9 <= examples[1] <= 10
+    with pytest.raises(StopIteration):
+        next(tests)
+    # /a got fewer responses than examples, so it was not reduced by the budget
+    assert list(budget.reduced) == ["GET /b"]
+
+
+def test_tests_without_responses_are_not_timed(made_tests):
+    budget = TimeBudget(60)
+    settings = hypothesis.settings(
+        phases=[hypothesis.Phase.explicit, *GENERATE], max_examples=1000
+    )
+    tests = budget.tests([endpoint("/a"), endpoint("/b")], None, settings, None)
+
+    next(tests)
+    time.sleep(0.05)
+    next(tests)
+    budget.responses += 1
+    next(tests)
+
+    assert budget.responses == 1
+    assert budget.spent < 0.05
+
+
+def test_not_reduced_when_the_run_ends_under_budget(made_tests):
+    budget = TimeBudget(60)
+    settings = hypothesis.settings(phases=GENERATE, max_examples=1000)
+    budget.spent, budget.responses = 1.0, 1
+    tests = budget.tests([endpoint("/a"), endpoint("/b")], None, settings, None)
+
+    budget.deadline = time.monotonic() + 10
+    for _ in tests:
+        budget.responses += 5
+
+    # both got fewer examples than max_examples, and all of their responses
+    assert all(settings.max_examples < 1000 for _, settings in made_tests)
+    assert not budget.reduced
+
+
+def test_deadline(made_tests):
+    budget = TimeBudget(60)
+    settings = hypothesis.settings(phases=[hypothesis.Phase.explicit, *GENERATE])
+    tests = budget.tests([endpoint("/a"), endpoint("/b")], None, settings, None)
+
+    next(tests)
+    budget.deadline = 0
+    for _ in tests:
+        pass
+
+    assert [path for path, _ in made_tests] == ["/a"]
+    assert budget.reduced == {"GET /b": "not tested", "GET /a": "no examples generated"}
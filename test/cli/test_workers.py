@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from schemathesis import loaders
+from schemathesis.models import Status
+from schemathesis.runner import events
+
+from src.ibm_service_validator.cli.workers import in_operation_order, recording_loader
+
+
+def before(path):
+    return events.BeforeExecution(method="GET", path=path, recursion_level=0)
+
+
+def after(path):
+    return events.AfterExecution(
+        method="GET", path=path, status=Status.success, result=None, elapsed_time=0.1
+    )
+
+
+def events_of(*interleaved):
+    yield from interleaved
+
+
+def test_in_operation_order():
+    run = events_of(
+        before("/a"),
+        before("/b"),
+        before("/c"),
+        after("/b"),
+        after("/a"),
+        before("/d"),
+        after("/d"),
+        after("/c"),
+    )
+    order = [("GET", path) for path in ("/a", "/b", "/d", "/c")]
+
+    ordered = [
+        (type(event).__name__, event.path) for event in in_operation_order(run, order)
+    ]
+
+    assert ordered == [
+        (kind, path)
+        for path in ("/a", "/b", "/d", "/c")
+        for kind in ("BeforeExecution", "AfterExecution")
+    ]
+
+
+def test_held_events_are_yielded_when_the_run_ends():
+    interrupted = events.Interrupted()
+    run = events_of(before("/a"), before("/b"), after("/b"), interrupted)
+    ordered = list(in_operation_order(run, [("GET", "/a"), ("GET", "/b")]))
+
+    assert [event.path for event in ordered[:2]] == ["/b", "/b"]
+    assert ordered[2] is interrupted
+
+
+def test_close_closes_run():
+    closed = []
+
+    def run():
+        try:
+            yield before("/a")
+            yield after("/a")
+            yield before("/b")
+            yield after("/b")
+        finally:
+            closed.append(True)
+
+    ordered = in_operation_order(run(), [("GET", "/a"), ("GET", "/b")])
+    next(ordered)
+    ordered.close()
+
+    assert closed == [True]
+
+
+def test_recording_loader(server_definition):
+    order = []
+    schema = recording_loader(loaders.from_path, order)(server_definition)
+    endpoints = list(schema.get_all_endpoints())
+
+    assert order == [(endpoint.method, endpoint.full_path) for endpoint in endpoints]
+    assert order[0] == ("GET", "/allof")
@@ -202,6 +202,14 @@ def prepare_request():
     return f
 
 
+@pytest.fixture()
+def rate_limited() -> str:
+    """Return path of the API definition with throttled and rate limited operations."""
+
+    dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(dir, "mock_definitions", "rate_limited.yaml")
+
+
 @pytest.fixture()
 def server_definition() -> str:
     """Return path of the mock server API definition."""
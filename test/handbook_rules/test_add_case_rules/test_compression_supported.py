@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from requests import Response
+
+from schemathesis.hooks import HookContext
+
+from src.ibm_service_validator.handbook_rules.add_case_rules import (
+    compression_supported as hooks,
+)
+
+LARGE_BODY = b'{"name": "user"}' * 100
+
+
+@pytest.fixture()
+def large_response(mock_response):
+    mock_response.status_code = 200
+    mock_response._content = LARGE_BODY
+    return mock_response
+
+
+@pytest.fixture()
+def probe_response(prepare_request):
+    response = Response()
+    response.request = prepare_request(headers={"Accept-Encoding": "gzip"})
+    response.status_code = 200
+    response._content = LARGE_BODY
+    return response
+
+
+def test_add_compression_supported(mock_case, large_response):
+    new_case = hooks.add_compression_supported(
+        HookContext(mock_case.endpoint), mock_case, large_response
+    )
+    assert new_case.headers["Accept-Encoding"] == "gzip"
+
+
+def test_add_compression_supported_negative(mock_case, large_response):
+    # below the configured threshold
+    hook = hooks.add_compression_supported_hook(len(LARGE_BODY))
+    assert not hook(HookContext(mock_case.endpoint), mock_case, large_response)
+
+
+def test_add_compression_supported_negative_1(mock_case, large_response):
+    # already compressed
+    large_response.headers["Content-Encoding"] = "gzip"
+    assert not hooks.add_compression_supported(
+        HookContext(mock_case.endpoint), mock_case, large_response
+    )
+
+
+def test_add_compression_supported_negative_2(mock_case, large_response):
+    large_response.status_code = 404
+    assert not hooks.add_compression_supported(
+        HookContext(mock_case.endpoint), mock_case, large_response
+    )
+
+
+def test_compression_supported_positive(mock_case, large_response, probe_response):
+    new_case = hooks.add_compression_supported(
+        HookContext(mock_case.endpoint), mock_case, large_response
+    )
+    with pytest.raises(AssertionError, match="should be compressed"):
+        hooks.compression_supported(probe_response, new_case)
+
+
+def test_compression_supported_positive_1(mock_case, large_response, probe_response):
+    new_case = hooks.add_compression_supported(
+        HookContext(mock_case.endpoint), mock_case, large_response
+    )
+    probe_response.headers["Content-Encoding"] = "gzip"
+    probe_response._content = b"{}"
+    with pytest.raises(AssertionError, match="does not match"):
+        hooks.compression_supported(probe_response, new_case)
+
+
+def test_compression_supported_negative(mock_case, large_response, probe_response):
+    new_case = hooks.add_compression_supported(
+        HookContext(mock_case.endpoint), mock_case, large_response
+    )
+    probe_response.headers["Content-Encoding"] = "gzip"
+    assert hooks.compression_supported(probe_response, new_case) is None
+
+
+def test_compression_supported_skipped(mock_case, large_response):
+    assert hooks.compression_supported(large_response, mock_case)
+
+
+def test_compression_supported_skipped_1(mock_case, probe_response):
+    # a request that asks for gzip itself is not the probe of the rule
+    assert hooks.compression_supported(probe_response, mock_case)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from schemathesis.hooks import HookContext
+
+from src.ibm_service_validator.handbook_rules.add_case_rules import (
+    conditional_get as hooks,
+    unless_handled_by_probe,
+)
+
+
+@pytest.fixture()
+def get_case(mock_case):
+    mock_case.endpoint.method = "GET"
+    return mock_case
+
+
+def test_add_conditional_get(get_case, mock_response):
+    mock_response.status_code = 200
+    mock_response.headers["ETag"] = '"abc"'
+    new_case = hooks.add_conditional_get(
+        HookContext(get_case.endpoint), get_case, mock_response
+    )
+    assert new_case.headers["If-None-Match"] == '"abc"'
+    assert new_case.handled_status_codes == (304,)
+
+
+def test_add_conditional_get_negative(get_case, mock_response):
+    # no ETag to send back
+    mock_response.status_code = 200
+    assert not hooks.add_conditional_get(
+        HookContext(get_case.endpoint), get_case, mock_response
+    )
+
+
+def test_add_conditional_get_negative_1(get_case, mock_response):
+    mock_response.status_code = 404
+    mock_response.headers["ETag"] = '"abc"'
+    assert not hooks.add_conditional_get(
+        HookContext(get_case.endpoint), get_case, mock_response
+    )
+
+
+def test_add_conditional_get_negative_2(get_case, mock_response, prepare_request):
+    # the response is already to a conditional request
+    mock_response.status_code = 200
+    mock_response.headers["ETag"] = '"abc"'
+    mock_response.request = prepare_request(headers={"If-None-Match": '"abc"'})
+    assert not hooks.add_conditional_get(
+        HookContext(get_case.endpoint), get_case, mock_response
+    )
+
+
+def test_conditional_get_positive(get_case, mock_response, prepare_request):
+    mock_response.request = prepare_request(headers={"If-None-Match": '"abc"'})
+    mock_response.status_code = 200
+    with pytest.raises(AssertionError, match="should receive a 304 response"):
+        hooks.conditional_get(mock_response, get_case)
+
+
+def test_conditional_get_positive_1(get_case, mock_response, prepare_request):
+    mock_response.request = prepare_request(headers={"If-None-Match": '"abc"'})
+    mock_response.status_code = 304
+    mock_response._content = b"{}"
+    with pytest.raises(AssertionError, match="304 response must not include"):
+        hooks.conditional_get(mock_response, get_case)
+
+
+def test_conditional_get_negative(get_case, mock_response, prepare_request):
+    mock_response.request = prepare_request(headers={"If-None-Match": '"abc"'})
+    mock_response.status_code = 304
+    mock_response._content = b""
+    assert hooks.conditional_get(mock_response, get_case) is None
+
+
+def test_conditional_get_skipped(get_case, mock_response):
+    mock_response.status_code = 200
+    assert hooks.conditional_get(mock_response, get_case)
+
+
+def test_unless_handled_by_probe(get_case, mock_response):
+    mock_response.status_code = 200
+    mock_response.headers["ETag"] = '"abc"'
+    new_case = hooks.add_conditional_get(
+        HookContext(get_case.endpoint), get_case, mock_response
+    )
+
+    def status_code_conformance(response, case):
+        raise AssertionError(
+            "Received a response with a status code, which is not defined"
+        )
+
+    check = unless_handled_by_probe(status_code_conformance)
+    mock_response.status_code = 304
+    # the 304 of the probe is judged by conditional_get
+    assert check(mock_response, new_case)
+    with pytest.raises(AssertionError):
+        check(mock_response, get_case)
+    mock_response.status_code = 500
+    with pytest.raises(AssertionError):
+        check(mock_response, new_case)
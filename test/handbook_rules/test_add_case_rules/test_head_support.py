@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from requests import Response
+
+from schemathesis.hooks import HookContext
+from schemathesis.models import Case
+
+from src.ibm_service_validator.handbook_rules.add_case_rules import (
+    head_support as hooks,
+)
+
+HEADERS = {"Content-Type": "application/json", "Content-Length": "13", "ETag": '"a"'}
+
+
+@pytest.fixture()
+def get_case(create_endpoint):
+    definition = {
+        "responses": {
+            "200": {
+                "description": "ok",
+                "content": {"application/json": {"schema": {"type": "object"}}},
+            }
+        }
+    }
+    return Case(create_endpoint(path="/users", method="GET", definition=definition))
+
+
+@pytest.fixture()
+def get_response(mock_response):
+    mock_response.status_code = 200
+    mock_response.headers.update(HEADERS)
+    mock_response._content = b'{"foo": "a"}\n'
+    return mock_response
+
+
+@pytest.fixture()
+def head_response(prepare_request):
+    response = Response()
+    response.request = prepare_request(method="HEAD")
+    response.status_code = 200
+    response.headers.update(HEADERS)
+    response._content = b""
+    return response
+
+
+def add_head(case, response):
+    return hooks.add_head_support(HookContext(case.endpoint), case, response)
+
+
+def test_add_head_support(get_case, get_response):
+    head_case = add_head(get_case, get_response)
+
+    assert head_case.method == "HEAD"
+    assert head_case.as_requests_kwargs("http://localhost")["method"] == "HEAD"
+    # the probe keeps the GET operation
+    assert head_case.endpoint is get_case.endpoint
+    assert head_case.original == (200, HEADERS)
+
+
+def test_add_head_support_negative(get_case, get_response):
+    get_response.status_code = 404
+    assert not add_head(get_case, get_response)
+
+
+def test_add_head_support_negative_1(create_endpoint, get_response):
+    post_case = Case(create_endpoint(path="/users", method="POST", definition={}))
+    assert not add_head(post_case, get_response)
+
+
+def test_head_support_positive(get_case, get_response, head_response):
+    head_case = add_head(get_case, get_response)
+    head_response.status_code = 405
+
+    with pytest.raises(AssertionError, match="same status code as GET"):
+        hooks.head_support(head_response, head_case)
+
+
+def test_head_support_positive_1(get_case, get_response, head_response):
+    head_case = add_head(get_case, get_response)
+    del head_response.headers["ETag"]
+
+    with pytest.raises(AssertionError, match="same ETag header as GET"):
+        hooks.head_support(head_response, head_case)
+
+
+def test_head_support_positive_2(get_case, get_response, head_response):
+    head_case = add_head(get_case, get_response)
+    head_response._content = b'{"foo": "a"}\n'
+
+    with pytest.raises(AssertionError, match="must not include a response body"):
+        hooks.head_support(head_response, head_case)
+
+
+def test_head_support_negative(get_case, get_response, head_response):
+    head_case = add_head(get_case, get_response)
+
+    assert hooks.head_support(head_response, head_case) is None
+
+
+def test_head_support_skipped(get_case, get_response):
+    assert hooks.head_support(get_response, get_case)
+
+
+def test_head_support_skipped_1(get_case, head_response):
+    # a HEAD request that is not the probe of the rule
+    assert hooks.head_support(head_response, get_case)
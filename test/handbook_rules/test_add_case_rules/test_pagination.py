@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from schemathesis.hooks import HookContext
+from schemathesis.models import Case
+
+from src.ibm_service_validator.handbook_rules.add_case_rules import (
+    pagination as hooks,
+    probe,
+)
+
+LIST_SCHEMA = {
+    "type": "object",
+    "properties": {"users": {"type": "array", "items": {"type": "string"}}},
+}
+
+
+@pytest.fixture()
+def list_case(create_endpoint):
+    endpoint = create_endpoint(
+        path="/users",
+        method="GET",
+        definition={
+            "responses": {
+                "200": {"content": {"application/json": {"schema": LIST_SCHEMA}}}
+            }
+        },
+        query={"properties": {"limit": {"type": "integer"}}},
+    )
+    return Case(endpoint=endpoint)
+
+
+@pytest.fixture()
+def list_probe(list_case):
+    list_case.query = {"limit": 1}
+    return probe(list_case, "pagination")
+
+
+def set_body(response, body):
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+
+
+def test_add_pagination(list_case, mock_response):
+    set_body(mock_response, {"users": ["a", "b"]})
+    new_case = hooks.add_pagination(
+        HookContext(list_case.endpoint), list_case, mock_response
+    )
+    assert new_case.query == {"limit": 1}
+    assert new_case.rule == "pagination"
+
+
+def test_add_pagination_negative(list_case, mock_response):
+    # a single item does not need a next page
+    set_body(mock_response, {"users": ["a"]})
+    assert not hooks.add_pagination(
+        HookContext(list_case.endpoint), list_case, mock_response
+    )
+
+
+def test_add_pagination_negative_1(list_case, mock_response):
+    # counts the items of the envelope, not another list
+    set_body(mock_response, {"users": ["a"], "warnings": ["b", "c"]})
+    assert not hooks.add_pagination(
+        HookContext(list_case.endpoint), list_case, mock_response
+    )
+
+
+def test_add_pagination_negative_2(mock_case, mock_response):
+    # no limit parameter
+    mock_case.endpoint.method = "GET"
+    set_body(mock_response, {"users": ["a", "b"]})
+    assert not hooks.add_pagination(
+        HookContext(mock_case.endpoint), mock_case, mock_response
+    )
+
+
+def test_pagination_positive(create_endpoint, mock_response):
+    endpoint = create_endpoint(
+        path="/users",
+        method="GET",
+        definition={
+            "responses": {
+                "200": {"content": {"application/json": {"schema": {"type": "array"}}}}
+            }
+        },
+    )
+    set_body(mock_response, ["a", "b"])
+    with pytest.raises(AssertionError, match="should be paginated"):
+        hooks.pagination(mock_response, Case(endpoint=endpoint))
+
+
+def test_pagination_positive_1(list_probe, mock_response):
+    set_body(mock_response, {"users": ["a", "b"]})
+    with pytest.raises(AssertionError, match="should honor limit=1"):
+        hooks.pagination(mock_response, list_probe)
+
+
+def test_pagination_positive_2(list_probe, mock_response):
+    set_body(mock_response, {"users": ["a"]})
+    with pytest.raises(AssertionError, match="should include a next link"):
+        hooks.pagination(mock_response, list_probe)
+
+
+def test_pagination_positive_3(list_probe, mock_response):
+    # the users envelope field is missing
+    set_body(mock_response, {"items": ["a"], "next_token": "a"})
+    with pytest.raises(AssertionError, match="should honor limit=1"):
+        hooks.pagination(mock_response, list_probe)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"users": ["a"], "next": {"href": "/users?start=a&limit=1"}},
+        {"users": ["a"], "next_token": "a"},
+        {"users": []},
+    ],
+)
+def test_pagination_negative(list_probe, mock_response, body):
+    set_body(mock_response, body)
+    assert hooks.pagination(mock_response, list_probe) is None
+
+
+def test_pagination_negative_1(list_probe, mock_response):
+    mock_response.headers["Link"] = '</users?start=a&limit=1>; rel="next"'
+    set_body(mock_response, {"users": ["a"]})
+    assert hooks.pagination(mock_response, list_probe) is None
+
+
+def test_pagination_skipped(mock_case, mock_response):
+    # not a collection
+    mock_case.endpoint.method = "GET"
+    mock_case.endpoint.definition.resolved = {}
+    set_body(mock_response, {"name": "a"})
+    assert hooks.pagination(mock_response, mock_case)
+
+
+def test_pagination_skipped_1(list_case, mock_response, prepare_request):
+    # an example that happens to ask for one item is not the probe
+    list_case.query = {"limit": 1}
+    mock_response.request = prepare_request(params={"limit": 1})
+    set_body(mock_response, {"users": ["a", "b"]})
+    assert hooks.pagination(mock_response, list_case)
+
+
+@pytest.mark.parametrize(
+    "schema, expected",
+    [
+        ({"type": "array"}, ""),
+        (LIST_SCHEMA, "users"),
+        (
+            {
+                "type": "object",
+                "properties": {
+                    "users": {"type": "array"},
+                    "total_count": {"type": "integer"},
+                    "next": {"type": "object"},
+                },
+            },
+            "users",
+        ),
+        # a resource with an array property is not a collection
+        (
+            {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "tags": {"type": "array"}},
+            },
+            None,
+        ),
+        (
+            {
+                "type": "object",
+                "properties": {"users": {"type": "array"}, "groups": {"type": "array"}},
+            },
+            None,
+        ),
+    ],
+)
+def test_array_property(schema, expected):
+    assert hooks.array_property(schema) == expected
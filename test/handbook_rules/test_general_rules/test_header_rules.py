@@ -226,3 +226,83 @@ def test_www_authenticate_401_negative_1(mock_case, mock_response):
     # non-401 status code
     mock_response.status_code = 400
     rules.www_authenticate_401(mock_response, mock_case)
+
+
+def test_cache_headers_positive(mock_case, mock_response):
+    mock_case.endpoint.method = "GET"
+    mock_response.status_code = 200
+
+    with pytest.raises(AssertionError, match="Cacheable GET response should include"):
+        rules.cache_headers(mock_response, mock_case)
+
+
+@pytest.mark.parametrize("header", ["ETag", "Last-Modified", "Cache-Control"])
+def test_cache_headers_negative(mock_case, mock_response, header):
+    mock_case.endpoint.method = "GET"
+    mock_response.status_code = 200
+    mock_response.headers[header] = "mock"
+
+    assert rules.cache_headers(mock_response, mock_case) is None
+
+
+def test_cache_headers_negative_1(mock_case, mock_response):
+    # not a GET request
+    mock_case.endpoint.method = "POST"
+    mock_response.status_code = 200
+
+    assert rules.cache_headers(mock_response, mock_case)
+
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_retry_after_positive(mock_case, mock_response, status_code):
+    mock_response.status_code = status_code
+
+    with pytest.raises(AssertionError, match="must have a Retry-After header"):
+        rules.retry_after(mock_response, mock_case)
+
+
+def test_retry_after_positive_1(mock_case, mock_response):
+    mock_response.status_code = 429
+    mock_response.headers["Retry-After"] = "soon"
+
+    with pytest.raises(AssertionError, match="number of seconds or an HTTP date"):
+        rules.retry_after(mock_response, mock_case)
+
+
+@pytest.mark.parametrize("value", ["120", "Wed, 21 Oct 2015 07:28:00 GMT"])
+def test_retry_after_negative(mock_case, mock_response, value):
+    mock_response.status_code = 503
+    mock_response.headers["Retry-After"] = value
+
+    assert rules.retry_after(mock_response, mock_case) is None
+
+
+def test_retry_after_negative_1(mock_case, mock_response):
+    mock_response.status_code = 500
+
+    assert rules.retry_after(mock_response, mock_case)
+
+
+def test_rate_limit_headers_positive(mock_case, mock_response):
+    mock_response.status_code = 200
+    mock_response.headers["X-RateLimit-Limit"] = "10"
+
+    with pytest.raises(
+        AssertionError, match="Missing: X-RateLimit-Remaining, X-RateLimit-Reset"
+    ):
+        rules.rate_limit_headers(mock_response, mock_case)
+
+
+def test_rate_limit_headers_negative(mock_case, mock_response):
+    mock_response.status_code = 200
+    mock_response.headers["X-RateLimit-Limit"] = "10"
+    mock_response.headers["X-RateLimit-Remaining"] = "9"
+    mock_response.headers["X-RateLimit-Reset"] = "60"
+
+    assert rules.rate_limit_headers(mock_response, mock_case) is None
+
+
+def test_rate_limit_headers_negative_1(mock_case, mock_response):
+    mock_response.status_code = 404
+
+    assert rules.rate_limit_headers(mock_response, mock_case)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from src.ibm_service_validator.handbook_rules.general_rules import (
+    response_size_rules as rules,
+)
+
+
+def test_max_response_size_positive(mock_case, mock_response):
+    check = rules.max_response_size_check(lambda endpoint: 10)
+    mock_response.status_code = 200
+    mock_response._content = b'{"foo": "string"}'
+
+    assert check.__name__ == "max_response_size"
+    with pytest.raises(
+        AssertionError, match="17 bytes exceeds the response size budget of 10 bytes"
+    ):
+        check(mock_response, mock_case)
+
+
+def test_max_response_size_positive_1(mock_case, mock_response):
+    # the body was not read
+    mock_response.status_code = 200
+    mock_response._content = b""
+    setattr(mock_response, rules.DOWNLOAD_CAP_EXCEEDED, 100)
+
+    with pytest.raises(AssertionError, match="larger than the download cap of 100"):
+        rules.max_response_size(mock_response, mock_case)
+
+
+def test_max_response_size_negative(mock_case, mock_response):
+    mock_response.status_code = 200
+    mock_response._content = b'{"foo": "string"}'
+
+    assert rules.max_response_size(mock_response, mock_case) is None
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import timedelta
+
+import pytest
+
+from src.ibm_service_validator.handbook_rules.general_rules import (
+    response_time_rules as rules,
+)
+
+
+def test_response_time_budget_positive(mock_case, mock_response):
+    mock_response.status_code = 200
+    mock_response.elapsed = timedelta(milliseconds=1500)
+    with pytest.raises(
+        AssertionError, match="exceeds the response time budget of 1000 ms"
+    ):
+        rules.response_time_budget(mock_response, mock_case)
+
+
+def test_response_time_budget_negative(mock_case, mock_response):
+    mock_response.status_code = 200
+    mock_response.elapsed = timedelta(milliseconds=500)
+    assert rules.response_time_budget(mock_response, mock_case) is None
+
+
+def test_response_time_budget_skips_error_responses(mock_case, mock_response):
+    mock_response.status_code = 500
+    mock_response.elapsed = timedelta(milliseconds=1500)
+    assert rules.response_time_budget(mock_response, mock_case)
+
+
+def test_response_time_budget_check(mock_case, mock_response):
+    check = rules.response_time_budget_check(lambda endpoint: 100)
+    mock_response.status_code = 200
+    mock_response.elapsed = timedelta(milliseconds=150)
+
+    assert check.__name__ == "response_time_budget"
+    with pytest.raises(AssertionError, match="budget of 100 ms"):
+        check(mock_response, mock_case)
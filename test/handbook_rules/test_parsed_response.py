@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from requests import Response
+
+from src.ibm_service_validator.handbook_rules.parsed_response import (
+    parse_response,
+    share_parsed_response,
+)
+
+
+def test_parse_response_is_shared(mock_case, mock_response):
+    mock_response._content = b'{"foo": ["bar"]}'
+    mock_response.headers["Content-Type"] = "application/json"
+
+    assert share_parsed_response(mock_response, mock_case) is True
+    parsed = parse_response(mock_response)
+    assert parse_response(mock_response) is parsed
+    assert parsed.json() == {"foo": ["bar"]}
+    # the body is decoded once, and the response's json method reuses it
+    assert parsed.json() is parsed.json()
+    assert mock_response.json() is parsed.json()
+
+
+def test_headers_are_case_insensitive(mock_response):
+    mock_response.headers["Content-Type"] = "application/json"
+    headers = parse_response(mock_response).headers
+
+    assert "content-type" in headers
+    assert headers["CONTENT-TYPE"] == "application/json"
+    assert headers.get("ETag") is None
+    assert len(headers) == 1
+
+
+def test_invalid_json(mock_response):
+    mock_response._content = b"not json"
+
+    with pytest.raises(ValueError):
+        parse_response(mock_response).json()
+
+
+def test_empty_body(mock_response):
+    mock_response._content = None
+    parsed = parse_response(mock_response)
+
+    assert parsed.content == b""
+    with pytest.raises(ValueError):
+        parsed.json()
+
+
+def test_other_encodings_are_decoded_by_requests():
+    response = Response()
+    response._content = '{"name": "café"}'.encode("latin-1")
+    response.encoding = "latin-1"
+
+    assert parse_response(response).json() == {"name": "café"}
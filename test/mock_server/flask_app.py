@@ -19,7 +19,7 @@ from time import sleep
 
 from typing import Optional
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 
 VALID_API_KEY = "abc123"
 TOKEN = "eyJraWQiOiIyMDIwMDQyNTE4MjkiLCJhbGciOiJSUzI1NiJ9.eyJpYW1faWQiOiJJQk1pZC01NTAwMDVCVEpZIiwiaWQiOiJJQk1pZC01NTAwMDVCVEpZIiwicmVhbG1pZCI6IklCTWlkIiwiaWRlbnRpZmllciI6IjU1MDAwNUJUSlkiLCJnaXZlbl9uYW1lIjoiQmFycmV0dCIsImZhbWlseV9uYW1lIjoiU2Nob25lZmVsZCIsIm5hbWUiOiJCYXJyZXR0IFNjaG9uZWZlbGQiLCJlbWFpbCI6ImJhcnJldHQuc2Nob25lZmVsZEBpYm0uY29tIiwic3ViIjoiYmFycmV0dC5zY2hvbmVmZWxkQGlibS5jb20iLCJhY2NvdW50Ijp7InZhbGlkIjp0cnVlLCJic3MiOiJlZTNkYjcxMDdjN2I0NTdjOGZkZjY3YWZiNjBlNWJkZCJ9LCJpYXQiOjE1ODg4NzcwMDUsImV4cCI6MTU4ODg4MDYwNSwiaXNzIjoiaHR0cHM6Ly9pYW0uY2xvdWQuaWJtLmNvbS9pZGVudGl0eSIsImdyYW50X3R5cGUiOiJ1cm46aWJtOnBhcmFtczpvYXV0aDpncmFudC10eXBlOmFwaWtleSIsInNjb3BlIjoiaWJtIG9wZW5pZCIsImNsaWVudF9pZCI6ImRlZmF1bHQiLCJhY3IiOjEsImFtciI6WyJwd2QiXX0.DEI8uNi-yQOTQWGgZvOk4eAdZ2dt8DYRXL25_tqq7T6hAhx40H2LidwBaOJHjr-x9fMN3K95i5ppkKNZ-s4v6waJNXdNMmtbUSOUUjSR8venlRDlWAfW92uUYaIooZrVdQD05d6fekVZGn_l-a0vIGvc_zkaaR9XDBhYQyLr-0sYZUgsyU66iK5KqsW80B2LgezOx9sMxqlz5KORGsAKke0CeS2z6s-xxCUaKsmMH2XJ92NBPZfTETatmVDuVM6Qjx4yIOGVxuSIP_YZILnmfXCgYrtvb8YjcTKZ7xpaR-iF74nt0ct08tqSiX40KLf_rGP28Q2NzJ8h8-4hlzFltA"
@@ -28,6 +28,14 @@ TOKEN = "eyJraWQiOiIyMDIwMDQyNTE4MjkiLCJhbGciOiJSUzI1NiJ9.eyJpYW1faWQiOiJJQk1pZC
 def create_app() -> Flask:
     app = Flask(__name__)
 
+    @app.after_request
+    def conditional_get(response: Response) -> Response:
+        # answers If-None-Match with 304 when the ETag matches
+        if request.method in {"GET", "HEAD"} and response.status_code == 200:
+            response.add_etag()
+            response.make_conditional(request)
+        return response
+
     @app.route("/allof", methods=["GET"])
     def allof():
         data = {"foo": 2, "bar": "string"}
@@ -35,7 +43,11 @@ def create_app() -> Flask:
 
     @app.route("/array", methods=["GET"])
     def array():
-        data = {"list": ["string1", "string2"]}
+        items = ["string1", "string2"]
+        limit = request.args.get("limit", len(items), type=int)
+        data = {"list": items[:limit]}
+        if limit < len(items):
+            data["next"] = {"href": f"{request.base_url}?start={limit}&limit={limit}"}
         return jsonify(data), 200
 
     @app.route("/boolean", methods=["GET"])
@@ -68,6 +80,25 @@ def create_app() -> Flask:
         data = {"foo": "string"}
         return jsonify(data), 500
 
+    @app.route("/rate_limited", methods=["GET"])
+    def rate_limited():
+        headers = {
+            "X-RateLimit-Limit": "10",
+            "X-RateLimit-Remaining": "9",
+            "X-RateLimit-Reset": "60",
+        }
+        return jsonify({"foo": "string"}), 200, headers
+
+    @app.route("/throttled", methods=["GET"])
+    def throttled():
+        headers = {
+            "Retry-After": "1",
+            "X-RateLimit-Limit": "10",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "1",
+        }
+        return jsonify({"too_many_requests": "try again later"}), 429, headers
+
     @app.route("/need_authorization", methods=["GET"])
     def need_authorization():
         if request.headers.get("Authorization") == "Bearer " + TOKEN:
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# Copyright 2020 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from multiprocessing import Process
+
+import json
+
+import hypothesis
+import pytest
+import yaml
+from schemathesis.hooks import GLOBAL_HOOK_DISPATCHER
+
+from ibm_service_validator.api import ERROR, WARNING, OperationResult, validate
+from src.ibm_service_validator.cli.process_config import CONFIG_FILE_NAME
+from .mock_server import flask_app
+
+SERVER_PROCESS: Process = None
+SERVER_URL: str = None
+GENERATE = [hypothesis.Phase.generate]
+
+
+def setup_module():
+    global SERVER_URL
+    global SERVER_PROCESS
+    SERVER_URL, SERVER_PROCESS = flask_app.run_server_as_child(flask_app.create_app())
+
+
+def teardown_module():
+    SERVER_PROCESS.terminate()
+
+
+def test_validate(server_definition, check_str):
+    results = list(
+        validate(
+            server_definition,
+            SERVER_URL,
+            checks=[c.strip() for c in check_str.split(",")],
+            hypothesis_phases=GENERATE,
+            hypothesis_max_examples=1,
+        )
+    )
+
+    assert len(results) == 6
+    assert all(isinstance(result, OperationResult) for result in results)
+    assert all(result.status == "success" for result in results)
+    assert all(result.elapsed_time > 0 for result in results)
+    assert {result.path for result in results} >= {"/allof", "/array"}
+    assert all(check.severity == ERROR for result in results for check in result.checks)
+
+
+def test_validate_workers(server_definition):
+    def run(workers):
+        return [
+            (result.path, result.status, len(result.checks))
+            for result in validate(
+                server_definition,
+                SERVER_URL,
+                checks=["head_support", "response_schema_conformance"],
+                hypothesis_phases=GENERATE,
+                hypothesis_max_examples=1,
+                hypothesis_seed=1,
+                workers=workers,
+            )
+        ]
+
+    serial = run(1)
+    # the add_case hooks fire in the worker threads, and results keep the schema order
+    assert run(4) == serial
+    assert len(serial) == 6
+
+
+def test_validate_time_budget(server_definition):
+    results = list(
+        validate(
+            server_definition,
+            SERVER_URL,
+            checks=["status_code_conformance"],
+            hypothesis_phases=[hypothesis.Phase.explicit, *GENERATE],
+            hypothesis_max_examples=1,
+            time_budget=300,
+        )
+    )
+
+    # one result for each operation, with the checks of both passes
+    assert len({result.path for result in results}) == len(results) == 6
+    assert all(len(result.checks) == 1 for result in results)
+
+
+def test_validate_adaptive_deadline(server_definition, tmp_path):
+    history_file = tmp_path / "history.json"
+    results = list(
+        validate(
+            server_definition,
+            SERVER_URL,
+            checks=["status_code_conformance"],
+            hypothesis_phases=GENERATE,
+            hypothesis_max_examples=1,
+            adaptive_deadline=True,
+            history_file=str(history_file),
+        )
+    )
+
+    assert len(results) == 6
+    operations = json.loads(history_file.read_text())["operations"]
+    assert len(operations) == 6
+    assert all(operation["deadline"] > 0 for operation in operations.values())
+
+
+def test_validate_stream_responses(server_definition):
+    results = list(
+        validate(
+            server_definition,
+            SERVER_URL,
+            checks=["max_response_size"],
+            hypothesis_phases=GENERATE,
+            hypothesis_max_examples=1,
+            stream_responses=True,
+        )
+    )
+
+    assert len(results) == 6
+    assert all(result.status == "success" for result in results)
+
+
+def test_validate_severity(tmp_cwd, config_partial_warn, write_to_file, mixed_api_def):
+    write_to_file(CONFIG_FILE_NAME + ".yaml", config_partial_warn, yaml.safe_dump)
+
+    results = list(
+        validate(
+            mixed_api_def,
+            SERVER_URL,
+            additional_cases=False,
+            hypothesis_phases=GENERATE,
+            hypothesis_max_examples=1,
+        )
+    )
+
+    failures = [check for result in results for check in result.failures]
+    assert {check.name for check in failures if check.severity == WARNING} == {
+        "status_code_conformance"
+    }
+    assert {check.name for check in failures if check.severity == ERROR} == {
+        "not_a_server_error"
+    }
+    assert all(check.requests_code for check in failures)
+
+
+def test_validate_cancel(server_definition):
+    results = validate(
+        server_definition,
+        SERVER_URL,
+        hypothesis_phases=GENERATE,
+        hypothesis_max_examples=1,
+    )
+    first = next(results)
+    results.close()
+
+    assert first.method == "GET"
+    assert GLOBAL_HOOK_DISPATCHER.get_all_by_name("add_case") == []
+
+
+def test_validate_interleaved(server_definition, check_str):
+    """Add case hooks of one run do not leak into a run consumed alternately."""
+    checks = [c.strip() for c in check_str.split(",")] + ["get_with_request_body"]
+    with_cases = validate(
+        server_definition,
+        SERVER_URL,
+        checks=checks,
+        hypothesis_phases=GENERATE,
+        hypothesis_max_examples=1,
+    )
+    without_cases = validate(
+        server_definition,
+        SERVER_URL,
+        checks=checks,
+        additional_cases=False,
+        hypothesis_phases=GENERATE,
+        hypothesis_max_examples=1,
+    )
+
+    for first, second in zip(with_cases, without_cases):
+        assert any(check.name == "get_with_request_body" for check in first.checks)
+        assert all(check.name != "get_with_request_body" for check in second.checks)
+
+
+def test_validate_internal_error(invalid_examples):
+    with pytest.raises(RuntimeError):
+        list(validate(invalid_examples, SERVER_URL))